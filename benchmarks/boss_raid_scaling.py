@@ -0,0 +1,93 @@
+"""
+boss_raid_scaling.py — Batched Multi-Raid Boss Step vs Per-Boss Objects
+PowerRush Ultramasterpiece — Jan 18 2026
+
+Tick cost of BossRaidEngine.step as concurrent raids grow (1 → 100k):
+- Each tick: 10% of raids get fresh coop readings, every raid takes player damage
+- Defeated raids are replaced so the active count stays level
+- Baseline: one Python boss object per raid updated in a loop (the per-object scaling rules)
+- Reports ms per tick and raid updates per second against the 42 ms tick budget
+
+Run from the repo root: python -m benchmarks.boss_raid_scaling
+"""
+
+import time
+
+import numpy as np
+
+from core.boss_raid_engine import BossRaidEngine, FLAVORS, LOW_POWER, LOW_POWER_PENALTY
+
+RAIDS = (1, 10, 100, 1_000, 10_000, 100_000)
+TICKS = 50
+
+class ScalarBoss:
+    """One raid, one object — the rules as the per-boss classes apply them"""
+    def __init__(self, efficiency: float):
+        self.base_hp = 10000.0
+        self.hp = self.base_hp
+        self.efficiency = efficiency
+        self.joy = 1.0
+        self.mercy_floor = 0.3
+        self.solar_health = 1.0
+        self.boost = 0.0
+
+    def update(self):
+        weakness = self.efficiency * 0.8
+        cap = self.base_hp * (1.0 - weakness)
+        if self.solar_health < LOW_POWER:
+            cap *= LOW_POWER_PENALTY
+        cap = max(cap, self.base_hp * self.mercy_floor)
+        self.hp = min(self.hp, cap)
+        self.boost = weakness + self.joy * 0.2
+        if self.hp <= 0:
+            return FLAVORS[min(int(self.efficiency * 5), 4)]
+        return None
+
+def bench_engine(raids: int, rng: np.random.Generator) -> float:
+    engine = BossRaidEngine(raids)
+    ids = list(range(raids))
+    engine.add_many(ids, efficiency=rng.random(raids))
+    next_id = raids
+    elapsed = 0.0
+    for _ in range(TICKS):
+        active = engine.ids
+        changed = [active[i] for i in rng.integers(0, len(active), max(1, raids // 10)).tolist()]
+        hits = rng.uniform(0, 600, len(active)).astype(np.float32)
+        start = time.perf_counter()
+        engine.set_inputs(list(dict.fromkeys(changed)), efficiency=rng.random(len(dict.fromkeys(changed))))
+        engine.hp[:engine.count] -= hits  # Every raid's damage for the tick, already aggregated
+        result = engine.step()
+        elapsed += time.perf_counter() - start
+        fresh = len(result["defeated"])
+        if fresh:
+            engine.add_many(list(range(next_id, next_id + fresh)), efficiency=rng.random(fresh))
+            next_id += fresh
+    return elapsed / TICKS
+
+def bench_scalar(raids: int, rng: np.random.Generator) -> float:
+    bosses = [ScalarBoss(e) for e in rng.random(raids).tolist()]
+    elapsed = 0.0
+    for _ in range(TICKS):
+        changed = rng.integers(0, raids, max(1, raids // 10)).tolist()
+        readings = rng.random(len(changed)).tolist()
+        hits = rng.uniform(0, 600, raids).tolist()
+        start = time.perf_counter()
+        for i, reading in zip(changed, readings):
+            bosses[i].efficiency = reading
+        for i, boss in enumerate(bosses):
+            boss.hp -= hits[i]
+            if boss.update() is not None:
+                bosses[i] = ScalarBoss(boss.efficiency)
+        elapsed += time.perf_counter() - start
+    return elapsed / TICKS
+
+def main():
+    rng = np.random.default_rng(42)
+    print(f"{'raids':>7} {'engine ms/tick':>15} {'objects ms/tick':>16} {'speedup':>8} {'raids/s (engine)':>17}")
+    for raids in RAIDS:
+        engine = bench_engine(raids, rng)
+        scalar = bench_scalar(raids, rng)
+        print(f"{raids:>7} {engine * 1000:>15.3f} {scalar * 1000:>16.3f} {scalar / engine:>7.1f}x {raids / engine:>17.0f}")
+
+if __name__ == "__main__":
+    main()
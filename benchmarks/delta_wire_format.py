@@ -0,0 +1,66 @@
+"""
+delta_wire_format.py — Shard Delta Wire Format Size / Throughput Benchmark
+PowerRush Ultramasterpiece — Jan 18 2026
+
+Compares the binary delta codec against JSON and pickle:
+- Round-trip check on every payload before timing (mixed value types, deletions)
+- Bytes per frame — first frame (keys inline) and steady state (keys interned)
+- Encode + decode throughput in frames/sec
+
+Run from the repo root: python -m benchmarks.delta_wire_format
+"""
+
+import json
+import pickle
+import random
+import time
+
+from multiplayer.delta_codec import DeltaEncoder, DeltaDecoder
+
+ROUNDS = 2000
+
+def make_delta(size: int, rng: random.Random) -> dict:
+    delta = {}
+    for i in range(size):
+        kind = i % 4
+        if kind == 0:
+            delta[f"player_{i}.gel_stock"] = rng.randint(0, 200)
+        elif kind == 1:
+            delta[f"player_{i}.joy_valence"] = rng.random()
+        elif kind == 2:
+            delta[f"player_{i}.zone"] = rng.choice(["alpha", "beta", "gamma"])
+        else:
+            delta[f"player_{i}.pos"] = [rng.randint(-500, 500), rng.randint(-500, 500), 50]
+    return delta
+
+def check_round_trip(delta: dict):
+    enc, dec = DeltaEncoder(), DeltaDecoder()
+    for _ in range(3):  # Inline keys, then interned keys, then again
+        frame = enc.encode(delta, deleted=["stale_key"])
+        assert dec.decode(memoryview(frame)) == (delta, ["stale_key"]), "delta codec round-trip mismatch"
+
+def bench(label: str, encode, decode, delta: dict):
+    frame = encode(delta)
+    decode(frame)  # Keep stateful codecs in session
+    first = len(frame)
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        frame = encode(delta)
+        decode(frame)
+    rate = ROUNDS / (time.perf_counter() - start)
+    print(f"{label:>14} {first:>9} {len(frame):>9} {rate:>12.0f}")
+
+def main():
+    rng = random.Random(42)
+    for size in (8, 64, 512):
+        delta = make_delta(size, rng)
+        check_round_trip(delta)
+        print(f"\ndelta of {size} keys   first B  steady B  frames/sec")
+        bench("json", lambda d: json.dumps(d).encode(), json.loads, delta)
+        bench("pickle", lambda d: pickle.dumps(d, protocol=pickle.HIGHEST_PROTOCOL), pickle.loads, delta)
+        for mode in (None, "zlib"):
+            enc, dec = DeltaEncoder(compression=mode), DeltaDecoder()
+            bench(f"delta/{mode or 'raw'}", enc.encode, lambda f, dec=dec: dec.decode(f), delta)
+
+if __name__ == "__main__":
+    main()
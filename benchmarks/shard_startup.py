@@ -0,0 +1,89 @@
+"""
+shard_startup.py — build_shard Cold-Start Harness + Report
+MercyOS Pinnacle Ultramasterpiece — Jan 18 2026
+
+Handheld cold start, each sample in a fresh interpreter:
+- Import time of shards.shard_builder and build_shard() time (median of runs)
+- Subsystem modules loaded eagerly by build_shard (must be none)
+- First-use import / construction cost per subsystem (informational)
+- Exits non-zero over STARTUP_BUDGET_MS — wall-clock gate lives here, tests/test_shard_startup.py
+  only asserts that nothing loads eagerly (timing-free, CI-safe)
+
+Run from the repo root: python -m benchmarks.shard_startup
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+
+from shards.shard_builder import SUBSYSTEMS
+
+# Milliseconds, measured in a fresh interpreter (handheld cold start)
+STARTUP_BUDGET_MS = {"import": 50.0, "build": 5.0}
+RUNS = 7
+
+_COLD_START = """
+import json, sys, time
+start = time.perf_counter()
+from shards.shard_builder import build_shard, SUBSYSTEMS
+imported = time.perf_counter()
+shard = build_shard(multiplayer={multiplayer})
+built = time.perf_counter()
+eager = sorted(name for name, (module, _) in SUBSYSTEMS.items() if module in sys.modules)
+for name in {touch!r}:
+    try:
+        shard.subsystem(name)
+    except ImportError as exc:
+        shard.startup[name] = {{"error": str(exc)}}
+print(json.dumps({{"import_ms": (imported - start) * 1000, "build_ms": (built - imported) * 1000,
+                  "eager": eager, "subsystems": shard.startup}}))
+"""
+
+def startup_report(multiplayer: bool = True, touch: tuple = ()) -> dict:
+    """Cold-start timings for build_shard, measured in a fresh interpreter (run from the repo root)
+
+    import_ms / build_ms, subsystem modules already loaded after build ("eager"), and
+    first-use import / construction ms for each subsystem named in touch.
+    """
+    code = _COLD_START.format(multiplayer=multiplayer, touch=tuple(touch))
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return json.loads(out.stdout)
+
+def median_report(runs: int = RUNS, multiplayer: bool = True) -> dict:
+    """Median import / build ms over fresh interpreters; eager = union over runs"""
+    samples = [startup_report(multiplayer=multiplayer) for _ in range(runs)]
+    return {
+        "import_ms": statistics.median(s["import_ms"] for s in samples),
+        "build_ms": statistics.median(s["build_ms"] for s in samples),
+        "eager": sorted({name for s in samples for name in s["eager"]}),
+    }
+
+def check_startup_budget(report: dict, budget: dict = None) -> list:
+    """Budget violations in a startup report — empty list = within budget"""
+    budget = STARTUP_BUDGET_MS if budget is None else budget
+    problems = [f"{phase} {report[phase + '_ms']:.1f} ms > {limit:.1f} ms budget"
+                for phase, limit in budget.items() if report[phase + "_ms"] > limit]
+    problems += [f"{name} loaded eagerly by build_shard" for name in report["eager"]]
+    return problems
+
+def main() -> int:
+    report = median_report()
+    print(f"import shards.shard_builder  {report['import_ms']:8.2f} ms  (budget {STARTUP_BUDGET_MS['import']:.0f})")
+    print(f"build_shard(multiplayer=True) {report['build_ms']:7.3f} ms  (budget {STARTUP_BUDGET_MS['build']:.0f})")
+    print(f"eager subsystems: {', '.join(report['eager']) or 'none'}")
+
+    first_use = startup_report(multiplayer=True, touch=tuple(SUBSYSTEMS))["subsystems"]
+    for name, timing in first_use.items():
+        if "error" in timing:
+            print(f"  {name:<17} unavailable here ({timing['error']})")
+        else:
+            print(f"  {name:<17} import {timing['import_ms']:8.2f} ms  construct {timing['construct_ms']:8.2f} ms")
+
+    problems = check_startup_budget(report)
+    for problem in problems:
+        print(f"OVER BUDGET: {problem}")
+    return 1 if problems else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+"""
+shard_sync_scaling.py — Multi-Shard Sync Cost vs Shard Count
+PowerRush Ultramasterpiece — Jan 18 2026
+
+Runs ShardSimHarness over LocalMeshTransport at growing shard counts:
+- Catch-up: every shard starts with only its own keys, run until all Merkle roots agree
+  (all-to-all state movement — O(shards²) entries, so smaller counts)
+- Steady state: shards start from one converged world, 5% of shards write each tick;
+  shard-ticks/sec the process sustains, bytes per shard per virtual second,
+  then time to re-converge once writes stop
+- Convergence times are virtual seconds (42 ms ticks); cross-group traffic only in burst windows
+
+Run from the repo root: python -m benchmarks.shard_sync_scaling [steady shard counts...]
+"""
+
+import sys
+import time
+
+from multiplayer.shard_sim_harness import ShardSimHarness
+
+CATCH_UP_COUNTS = (10, 50, 200)
+STEADY_COUNTS = (10, 100, 1000)
+STEADY_TICKS = 24   # ~1 s of virtual play
+CHURN = 0.05        # Fraction of shards writing each steady tick
+
+def catch_up(count: int):
+    harness = ShardSimHarness(count, seed=count)
+    harness.seed_writes(keys_per_shard=1)
+    result = harness.run_until_converged()
+    assert result["converged"], f"{count} shards failed to converge in {result['ticks']} ticks"
+    print(f"{count:>7} {result['virtual_s']:>8.2f} {result['wall_s']:>8.1f} {result['bytes'] / count:>12.0f}")
+
+def steady(count: int):
+    harness = ShardSimHarness(count, seed=count)
+    harness.preload()
+    writers = max(1, int(count * CHURN))
+    start_bytes = harness.transport.bytes_sent
+    start = time.perf_counter()
+    for tick in range(STEADY_TICKS):
+        for i in range(writers):
+            shard = harness.shards[(tick * writers + i) % count]
+            shard.crdt.set(f"{shard.shard_id}/pos", [tick, i, 50])
+        harness.step()
+    wall = time.perf_counter() - start
+    rate = STEADY_TICKS * count / wall
+    per_shard = (harness.transport.bytes_sent - start_bytes) / count / (STEADY_TICKS * harness.tick_s)
+    result = harness.run_until_converged()
+    assert result["converged"], f"{count} shards failed to re-converge in {result['ticks']} ticks"
+    print(f"{count:>7} {rate:>14.0f} {per_shard:>16.0f} {result['virtual_s']:>10.2f} {result['wall_s']:>8.1f}")
+
+def main():
+    steady_counts = [int(c) for c in sys.argv[1:]] or STEADY_COUNTS
+    print("catch-up (1 key per shard, all shards diverged)")
+    print(f"{'shards':>7} {'conv s':>8} {'wall s':>8} {'B/shard':>12}")
+    for count in CATCH_UP_COUNTS:
+        catch_up(count)
+    print("\nsteady state (converged world, 5% of shards writing per tick)")
+    print(f"{'shards':>7} {'shard-ticks/s':>14} {'B/shard/s':>16} {'reconv s':>10} {'wall s':>8}")
+    for count in steady_counts:
+        steady(count)
+
+if __name__ == "__main__":
+    main()
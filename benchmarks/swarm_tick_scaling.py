@@ -0,0 +1,49 @@
+"""
+swarm_tick_scaling.py — SwarmFormationController.update_positions Tick Benchmark
+PowerRush Ultramasterpiece — Jan 18 2026
+
+Measures collision-avoidance tick time as fleet size grows:
+- Lattice weave formation with jittered positions (dense neighbour load)
+- Reports mean / worst ms per tick against the 42 Hz coord_pulse budget (23.8 ms)
+- Exits non-zero when any fleet's mean tick is over budget — usable as a CI gate
+
+Run from the repo root: python -m benchmarks.swarm_tick_scaling
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from core.swarm_formation_controller import SwarmFormationController
+
+FLEET_SIZES = [33, 330, 1000, 3300, 10000]
+TICKS = 30
+
+def bench_fleet(fleet_size: int, ticks: int = TICKS):
+    swarm = SwarmFormationController(fleet_size)
+    swarm.lattice_weave_eternal((0.0, 0.0, 50.0))
+    rng = np.random.default_rng(42)
+    swarm.positions[:] = swarm.targets + rng.normal(0.0, 1.0, (fleet_size, 3))
+    swarm.update_positions()  # Warm-up
+    samples = []
+    for _ in range(ticks):
+        start = time.perf_counter()
+        swarm.update_positions()
+        samples.append((time.perf_counter() - start) * 1000)
+    return sum(samples) / len(samples), max(samples)
+
+def main():
+    budget_ms = 1000 / SwarmFormationController().coord_pulse
+    print(f"{'drones':>8} {'mean ms':>9} {'worst ms':>9} {'us/drone':>9}  budget {budget_ms:.1f} ms")
+    over = []
+    for fleet_size in FLEET_SIZES:
+        mean_ms, worst_ms = bench_fleet(fleet_size)
+        status = "ok" if mean_ms <= budget_ms else "OVER"
+        if mean_ms > budget_ms:
+            over.append(fleet_size)
+        print(f"{fleet_size:>8} {mean_ms:>9.2f} {worst_ms:>9.2f} {mean_ms * 1000 / fleet_size:>9.2f}  {status}")
+    return over
+
+if __name__ == "__main__":
+    sys.exit(1 if main() else 0)
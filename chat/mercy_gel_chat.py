@@ -4,61 +4,137 @@ PowerRush Ultramasterpiece — Jan 18 2026
 
 MercyGel chat commands:
 - /gel drop [flavor] — trigger personal sachet (in-game + real-world opt-in)
-- /gel share [flavor] — coop drop for team
+- /gel share [flavor] — coop drop for team (batched dispatch)
 - Confirmation narration + logistics hook
+- Batched ingestion: messages queued, drained once per tick through a /gel dispatch table
+- Per-sender token bucket, checked before anything else — a flood is throttled before it can
+  coalesce, dispatch or reply
+- Identical commands within a tick coalesced; all real-world jobs in one planning pass
+- One reply per coalesced group per sender, sent as one batch per tick; one narration per distinct response
 - Grandma-safe — large UI, voice readback
 """
 
+import time
+from collections import deque
+
 from chat.mercy_chat import MercyChat
-from core.logistics_controller import LogisticsController
+from core.logistics_service import shared_logistics
+from core.narration_service import summon_mythic
+from core.tick_scheduler import TickScheduler
+
+FLAVORS = ("butter", "gravy", "cinnamon", "chocolate", "mochaccino")
+FLAVOR_SET = frozenset(FLAVORS)
 
 class MercyGelChat(MercyChat):
-    def __init__(self, shard_id: str):
+    def __init__(self, shard_id: str, rate_per_s: float = 0.5, burst: int = 3, clock=time.monotonic):
         super().__init__(shard_id)
-        self.logistics = LogisticsController()
-        self.flavors = ["butter", "gravy", "cinnamon", "chocolate", "mochaccino"]
-    
+        self.logistics = shared_logistics().handle(shard_id)  # Shared fleet + ledger
+        self.flavors = list(FLAVORS)
+        self.commands = {"drop": self._gel_drop, "share": self._gel_share}  # /gel <verb> dispatch table
+        self.inbox = deque()             # Queued by on_message, drained by process_inbox
+        self.max_batch = 4096            # Messages per tick — the rest wait one tick
+        self.rate_per_s = rate_per_s     # Gel commands per sender per second...
+        self.burst = burst               # ...with this much slack
+        self.clock = clock
+        self.buckets = {}                # sender -> [tokens, last refill]
+        self.max_senders = 4096          # Idle buckets pruned past this
+        self.received = self.throttled = self.coalesced = 0
+
+    def _parse(self, text: str):
+        """'/gel <verb> [flavor]' -> (verb, flavor) in one split; None if not a gel command"""
+        parts = text.split(None, 3)
+        if len(parts) < 2 or parts[0] != "/gel" or parts[1] not in self.commands:
+            return None
+        flavor = parts[2] if len(parts) > 2 and parts[2] in FLAVOR_SET else "butter"
+        return parts[1], flavor
+
+    def _gel_drop(self, sender: str, flavor: str, jobs: list) -> str:
+        # In-game drop
+        self.apply_gel_buff(flavor)
+        # Real-world opt-in
+        if self.real_world_opt_in:
+            jobs.append((sender, self.player_location(sender), flavor))
+        return f"MercyGel {flavor} sachet dropped — joy restored!"
+
+    def _gel_share(self, sender: str, flavor: str, jobs: list) -> str:
+        # Coop share
+        for member in self.team_members:
+            self.apply_gel_buff(flavor, member)
+        if self.real_world_opt_in:
+            jobs.extend((member, self.player_location(member), flavor) for member in self.team_members)
+        return f"Coop MercyGel {flavor} shared — team abundance eternal!"
+
     def parse_gel_command(self, text: str, sender: str):
-        if text.startswith("/gel drop"):
-            parts = text.split()
-            flavor = parts[2] if len(parts) > 2 else "butter"
-            if flavor not in self.flavors:
-                flavor = "butter"
-            # In-game drop
-            self.apply_gel_buff(flavor)
-            # Real-world opt-in
-            if self.real_world_opt_in:
-                destination = self.player_location(sender)
-                self.logistics.mercy_gel_drop(sender, destination, flavor)
-            return f"MercyGel {flavor} sachet dropped — joy restored!"
-        
-        if text.startswith("/gel share"):
-            parts = text.split()
-            flavor = parts[2] if len(parts) > 2 else "butter"
-            if flavor not in self.flavors:
-                flavor = "butter"
-            # Coop share
-            for member in self.team_members:
-                self.apply_gel_buff(flavor, member)
-                if self.real_world_opt_in:
-                    dest = self.player_location(member)
-                    self.logistics.mercy_gel_drop(member, dest, flavor)
-            return f"Coop MercyGel {flavor} shared — team abundance eternal!"
-        
-        return None
-    
+        """Single command, handled immediately (no rate limit / coalescing)"""
+        parsed = self._parse(text)
+        if parsed is None:
+            return None
+        verb, flavor = parsed
+        jobs = []
+        response = self.commands[verb](sender, flavor, jobs)
+        if jobs:
+            self.logistics.dispatch_batch(jobs)  # One planning pass
+        return response
+
+    def _allow(self, sender: str, now: float) -> bool:
+        bucket = self.buckets.get(sender)
+        if bucket is None:
+            bucket = self.buckets[sender] = [self.burst, now]
+        tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate_per_s)
+        bucket[1] = now
+        if tokens < 1:
+            bucket[0] = tokens
+            return False
+        bucket[0] = tokens - 1
+        return True
+
     def on_message(self, msg: dict):
-        response = self.parse_gel_command(msg["text"], msg["sender"])
-        if response:
-            self.send_message(msg["sender"], response)
+        self.inbox.append(msg)  # Handled in the next process_inbox batch
+
+    def process_inbox(self) -> int:
+        """Drain one tick of messages — returns replies sent"""
+        now = self.clock()
+        inbox, seen, replies, jobs = self.inbox, {}, {}, []
+        for _ in range(min(len(inbox), self.max_batch)):
+            msg = inbox.popleft()
+            self.received += 1
+            parsed = self._parse(msg["text"])
+            if parsed is None:
+                continue
+            verb, flavor = parsed
+            sender = msg["sender"]
+            if not self._allow(sender, now):  # Every message spends a token, duplicates included
+                self.throttled += 1
+                continue
+            # A share feeds the whole team — identical shares this tick are one dispatch
+            key = (verb, flavor) if verb == "share" else (verb, flavor, sender)
+            response = seen.get(key)
+            if response is None:
+                response = seen[key] = self.commands[verb](sender, flavor, jobs)
+            else:
+                self.coalesced += 1
+            replies.setdefault((key, sender), response)  # Repeats in the group get no extra reply
+        if jobs:
+            self.logistics.dispatch_batch(jobs)  # Whole tick, one planning pass
+        for (_, sender), response in replies.items():
+            self.send_message(sender, response)
+        for response in dict.fromkeys(seen.values()):
             summon_mythic("yoruba_yemaya", response)
+        if len(self.buckets) > self.max_senders:
+            idle = self.burst / self.rate_per_s  # Buckets refilled by now carry no state
+            self.buckets = {s: b for s, b in self.buckets.items() if now - b[1] < idle}
+        return len(replies)
+
+    def run(self):
+        super().run()
+        self.process_inbox()
 
 # Integration
 def power_rush_gel_chat_loop():
     gel_chat = MercyGelChat("player_shard_alpha")
-    while True:
-        gel_chat.run()
-        time.sleep(42 / 1000)
+    scheduler = TickScheduler()
+    scheduler.add("player_shard_alpha", gel_chat.run, 42, blocking=True)  # Logistics may block
+    scheduler.run_forever()
 
 if __name__ == "__main__":
     power_rush_gel_chat_loop()
@@ -0,0 +1,175 @@
+"""
+BossRaidEngine-Pinnacle — Columnar Multi-Raid Solar Boss Scaling
+PowerRush Ultramasterpiece — Jan 18 2026
+
+Every active raid boss in one set of arrays, one batched step per tick:
+- Columns: base HP, current HP, team efficiency, joy, mercy floor, solar health, boost
+- Scaling (solar_boss_scaling): HP cap = base × (1 − efficiency × 0.8), ×1.5 on low shard power
+- Mercy gate: scaling never pushes a boss under base × mercy_floor — only player damage can
+- Boss weakness boost (MultiplayerSolarCoop): efficiency × 0.8 + joy × 0.2
+- Reward tier on defeat (BossRewardSystem): int(efficiency × 5), capped at mochaccino
+- Dense slots + swap-remove — raids join / end in O(1), no holes in the step
+- Grandma-safe: the "sun overwhelms shadow" line fires once per crossing, not every tick
+"""
+
+import numpy as np
+
+FLAVORS = ("butter", "gravy", "cinnamon", "chocolate", "mochaccino")
+LOW_POWER = 0.3           # Solar health under this → boss HP ×1.5
+LOW_POWER_PENALTY = 1.5
+OVERWHELM_WEAKNESS = 0.7  # Weakness multiplier past this → Amaterasu narration
+
+class BossRaidEngine:
+    COLUMNS = ("base_hp", "hp", "efficiency", "joy", "mercy_floor", "solar_health", "boost", "overwhelmed")
+
+    def __init__(self, capacity: int = 1024):
+        self.base_hp = np.zeros(capacity, dtype=np.float32)
+        self.hp = np.zeros(capacity, dtype=np.float32)
+        self.efficiency = np.zeros(capacity, dtype=np.float32)   # Team MPPT duty 0..1
+        self.joy = np.zeros(capacity, dtype=np.float32)
+        self.mercy_floor = np.zeros(capacity, dtype=np.float32)  # Fraction of base HP
+        self.solar_health = np.zeros(capacity, dtype=np.float32)
+        self.boost = np.zeros(capacity, dtype=np.float32)        # Last step's weakness boost
+        self.overwhelmed = np.zeros(capacity, dtype=bool)
+        self.count = 0
+        self.ids = []             # slot -> raid id
+        self.slot_of = {}         # raid id -> slot
+        self.ticks = 0
+        self.defeated = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, raid_id) -> bool:
+        return raid_id in self.slot_of
+
+    # === raids ===
+    def _grow(self, needed: int):
+        capacity = len(self.hp)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for field in self.COLUMNS:
+            old = getattr(self, field)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, field, new)
+
+    def add_many(self, raid_ids: list, base_hp=10000.0, efficiency=0.5, joy=1.0,
+                 mercy_floor=0.3, solar_health=1.0) -> int:
+        """Open raids in one block — each value a scalar or one per raid"""
+        k = len(raid_ids)
+        if not self.slot_of.keys().isdisjoint(raid_ids) or len(set(raid_ids)) != k:
+            raise ValueError("raid already active")
+        start = self.count
+        self._grow(start + k)
+        block = slice(start, start + k)
+        self.base_hp[block] = base_hp
+        self.hp[block] = base_hp
+        self.efficiency[block] = efficiency
+        self.joy[block] = joy
+        self.mercy_floor[block] = mercy_floor
+        self.solar_health[block] = solar_health
+        self.boost[block] = 0.0
+        self.overwhelmed[block] = False
+        self.ids.extend(raid_ids)
+        self.slot_of.update(zip(raid_ids, range(start, start + k)))
+        self.count = start + k
+        return k
+
+    def add(self, raid_id, **values) -> int:
+        self.add_many([raid_id], **values)
+        return self.slot_of[raid_id]
+
+    def slots(self, raid_ids) -> np.ndarray:
+        slot_of = self.slot_of
+        return np.fromiter((slot_of[raid_id] for raid_id in raid_ids), dtype=np.int64, count=len(raid_ids))
+
+    def _remove_slots(self, slots: np.ndarray):
+        """Swap-remove distinct slots: survivors from the tail fill the holes"""
+        k = len(slots)
+        tail_start = self.count - k
+        in_tail = slots >= tail_start
+        holes = slots[~in_tail]
+        keep_tail = np.ones(k, dtype=bool)
+        keep_tail[slots[in_tail] - tail_start] = False
+        movers = np.flatnonzero(keep_tail) + tail_start  # len(movers) == len(holes)
+
+        for slot in slots.tolist():
+            del self.slot_of[self.ids[slot]]
+        if len(holes):
+            for field in self.COLUMNS:
+                column = getattr(self, field)
+                column[holes] = column[movers]
+            for hole, mover in zip(holes.tolist(), movers.tolist()):
+                self.ids[hole] = self.ids[mover]
+                self.slot_of[self.ids[hole]] = hole
+        del self.ids[tail_start:]
+        self.count = tail_start
+
+    def remove(self, raid_id) -> bool:
+        slot = self.slot_of.get(raid_id)
+        if slot is None:
+            return False
+        self._remove_slots(np.array([slot]))
+        return True
+
+    # === inputs ===
+    def set_inputs(self, raid_ids, efficiency=None, joy=None, solar_health=None):
+        """Fresh coop readings for some raids — scalars or one value per raid"""
+        slots = self.slots(raid_ids)
+        if efficiency is not None:
+            self.efficiency[slots] = efficiency
+        if joy is not None:
+            self.joy[slots] = joy
+        if solar_health is not None:
+            self.solar_health[slots] = solar_health
+
+    def damage(self, raid_ids, amounts):
+        """Player hits — repeated raid ids accumulate"""
+        np.subtract.at(self.hp, self.slots(raid_ids), np.asarray(amounts, dtype=np.float32))
+
+    # === tick ===
+    def step(self) -> dict:
+        """Scale, mercy-gate and settle every raid at once
+
+        Returns {"defeated": [(raid_id, flavor tier)], "overwhelmed": [raid_id]} — defeated
+        raids are removed; overwhelmed lists raids newly past the narration threshold.
+        """
+        n = self.count
+        base, hp, eff = self.base_hp[:n], self.hp[:n], self.efficiency[:n]
+        weakness = eff * np.float32(0.8)
+        cap = base * (1 - weakness)
+        cap[self.solar_health[:n] < LOW_POWER] *= LOW_POWER_PENALTY
+        np.maximum(cap, base * self.mercy_floor[:n], out=cap)  # Mercy gate — no instant win
+        np.minimum(hp, cap, out=hp)                            # Scaling weakens, never heals
+        np.add(weakness, self.joy[:n] * np.float32(0.2), out=self.boost[:n])
+
+        past = weakness > OVERWHELM_WEAKNESS
+        crossed = np.flatnonzero(past & ~self.overwhelmed[:n])
+        self.overwhelmed[:n] = past
+        overwhelmed = [self.ids[slot] for slot in crossed.tolist()]
+
+        dead = np.flatnonzero(hp <= 0)
+        defeated = []
+        if len(dead):
+            tiers = np.minimum((eff[dead] * 5).astype(np.int64), len(FLAVORS) - 1)
+            np.maximum(tiers, 0, out=tiers)
+            defeated = [(self.ids[slot], tier) for slot, tier in zip(dead.tolist(), tiers.tolist())]
+            self._remove_slots(dead)
+            self.defeated += len(dead)
+        self.ticks += 1
+        return {"defeated": defeated, "overwhelmed": overwhelmed}
+
+    # === views ===
+    def status(self, raid_id) -> dict:
+        slot = self.slot_of[raid_id]
+        return {field: getattr(self, field)[slot].item() for field in self.COLUMNS}
+
+    def reward_flavor(self, raid_id) -> str:
+        tier = min(int(self.efficiency[self.slot_of[raid_id]] * 5), len(FLAVORS) - 1)
+        return FLAVORS[max(tier, 0)]
+
+    def nbytes(self) -> int:
+        return sum(getattr(self, field).nbytes for field in self.COLUMNS)
@@ -0,0 +1,212 @@
+"""
+CommandQueue-Pinnacle — Durable Offline Outbox for Starlink Burst Windows
+MercyLogistics Pinnacle Ultramasterpiece — Jan 18 2026
+
+Outbound drone commands that survive sky-silent stretches and restarts:
+- Append-only JSON-lines log (put / ack records), replayed on open — in-memory when path is None
+- One writer per log: exclusive lock on <path>.lock, records stamped with the owner and replay
+  applies only its own (seqs are per owner — a foreign or stray writer's puts / acks never collide)
+- Coalescing — a repeat of a pending command (same kind, recipient, payload, destination) replaces it
+- Burst flush in size-bounded batches under a token-bucket bandwidth budget
+- Log compaction once acknowledged records dominate (atomic rewrite)
+- Group commit — fsync every append, or at most once per sync_interval (fsync() drains the rest)
+- Grandma-safe: nothing is lost if the window closes mid-flush — unacked stays queued
+"""
+
+import json
+import os
+import time
+
+try:
+    import fcntl
+except ImportError:  # Non-POSIX — the lock file is still created, just advisory-free
+    fcntl = None
+
+class OutboxLockedError(RuntimeError):
+    """Another CommandQueue (this or another process) holds the log"""
+
+def _encode(command: dict) -> bytes:
+    return json.dumps(command, sort_keys=True, separators=(",", ":")).encode()
+
+class CommandQueue:
+    def __init__(self, path: str = None, batch_bytes: int = 4096, budget_bytes_per_s: float = 16384.0,
+                 sync: bool = True, sync_interval: float = 0.0, clock=time.time, on_superseded=None,
+                 owner: str = None):
+        self.path = path                        # None = in-memory only, else one per shard / fleet
+        self.owner = owner or (os.path.basename(path) if path else "memory")  # Seq namespace in the log
+        self.batch_bytes = batch_bytes          # Max encoded bytes per uplink batch
+        self.budget = budget_bytes_per_s        # Token-bucket refill rate
+        self.burst_bytes = 4 * batch_bytes      # Token-bucket depth
+        self.sync = sync                        # fsync appends (power-loss safe)
+        self.sync_interval = sync_interval      # 0 = every append, else at most once per interval
+        self.clock = clock
+        self.last_sync = clock()
+        self.dirty = False                      # Appended since the last fsync
+        self.on_superseded = on_superseded      # Called with a pending command a put() coalesced away
+        self.tokens = self.burst_bytes
+        self.last_refill = clock()
+        self.pending = {}                       # coalesce key -> (seq, command, encoded)
+        self.seq = 0
+        self.log_records = 0
+        self.coalesced = 0
+        self.foreign = 0                        # Replayed records written by another owner (ignored)
+        self.sent = 0
+        self.bytes_sent = 0
+        self._log = None
+        self._lock = None
+        if path is not None:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._acquire()
+            self._replay()
+            self._log = open(path, "ab")
+
+    def _acquire(self):
+        # Held for the queue's lifetime — a separate file, so compaction's os.replace keeps it
+        self._lock = open(self.path + ".lock", "a")
+        if fcntl is None:
+            return
+        try:
+            fcntl.flock(self._lock.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            self._lock.close()
+            self._lock = None
+            raise OutboxLockedError(f"outbox {self.path} is already open in another queue") from None
+
+    # === log ===
+    def _replay(self):
+        if not os.path.exists(self.path):
+            return
+        key_of_seq = {}
+        good = 0
+        with open(self.path, "rb") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break  # Torn tail from a crash mid-append — everything before it is good
+                if not line.endswith(b"\n"):
+                    break
+                good += len(line)
+                self.log_records += 1
+                if record.get("owner") != self.owner:
+                    self.foreign += 1
+                    continue
+                self.seq = max(self.seq, record["seq"])
+                if record["op"] == "put":
+                    command = record["cmd"]
+                    key = self.key_of(command)
+                    self.pending.pop(key, None)
+                    self.pending[key] = (record["seq"], command, _encode(command))
+                    key_of_seq[record["seq"]] = key
+                else:
+                    for seq in record["seqs"]:
+                        key = key_of_seq.pop(seq, None)
+                        if key is not None and self.pending.get(key, (None,))[0] == seq:
+                            del self.pending[key]
+        if good != os.path.getsize(self.path):
+            os.truncate(self.path, good)  # Drop the torn tail so new appends start on a clean line
+
+    def _append(self, record: dict):
+        self.log_records += 1
+        if self._log is None:
+            return
+        self._log.write(_encode(record) + b"\n")
+        self._log.flush()  # In the OS page cache — survives a process crash
+        self.dirty = True
+        if self.sync and self.clock() - self.last_sync >= self.sync_interval:
+            self.fsync()
+
+    def fsync(self):
+        """Force appended records to disk (power-loss safe) — cheap no-op when clean"""
+        if self.dirty and self._log is not None:
+            os.fsync(self._log.fileno())
+            self.dirty = False
+            self.last_sync = self.clock()
+
+    def compact(self):
+        """Rewrite the log with only pending puts — atomic replace"""
+        if self._log is None:
+            return
+        tmp = self.path + ".tmp"
+        with open(tmp, "wb") as f:
+            for seq, command, _ in self.pending.values():
+                f.write(_encode({"op": "put", "owner": self.owner, "seq": seq, "cmd": command}) + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._log.close()
+        os.replace(tmp, self.path)
+        self._log = open(self.path, "ab")
+        self.dirty = False
+        self.log_records = len(self.pending)
+
+    def close(self):
+        if self._log is not None:
+            if self.sync:
+                self.fsync()
+            self._log.close()
+            self._log = None
+        if self._lock is not None:
+            self._lock.close()  # Releases the flock
+            self._lock = None
+
+    # === queue ===
+    @staticmethod
+    def key_of(command: dict) -> str:
+        """Commands equal in kind, recipient, payload and destination are redundant"""
+        return _encode([command.get("kind"), command.get("recipient"), command.get("payload"),
+                        command.get("destination")]).decode()
+
+    def put(self, command: dict) -> int:
+        key = self.key_of(command)
+        superseded = self.pending.pop(key, None)  # Latest version wins, re-queued at the back
+        self.seq += 1
+        self.pending[key] = (self.seq, command, _encode(command))
+        self._append({"op": "put", "owner": self.owner, "seq": self.seq, "cmd": command})
+        if superseded is not None:
+            self.coalesced += 1
+            if self.on_superseded is not None:
+                self.on_superseded(superseded[1])
+        return self.seq
+
+    def __len__(self) -> int:
+        return len(self.pending)
+
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(self.burst_bytes, self.tokens + (now - self.last_refill) * self.budget)
+        self.last_refill = now
+
+    def next_batch(self) -> list:
+        """Oldest pending commands up to batch_bytes (always at least one)"""
+        batch, size = [], 0
+        for key, (seq, command, encoded) in self.pending.items():
+            if batch and size + len(encoded) > self.batch_bytes:
+                break
+            batch.append((key, seq, command, encoded))
+            size += len(encoded)
+        return batch
+
+    def flush(self, send) -> int:
+        """Uplink batches while the budget allows — send(commands) -> True once delivered"""
+        self._refill()
+        flushed = 0
+        while self.pending:
+            batch = self.next_batch()
+            size = sum(len(encoded) for _, _, _, encoded in batch)
+            if size > self.tokens and self.tokens < self.burst_bytes:
+                break  # Budget spent — rest waits for the next refill (oversize goes on a full bucket)
+            if not send([command for _, _, command, _ in batch]):
+                break  # Window closed mid-flush — batch stays queued
+            self.tokens -= size
+            seqs = []
+            for key, seq, _, _ in batch:
+                if self.pending.get(key, (None,))[0] == seq:  # Not superseded during send
+                    del self.pending[key]
+                seqs.append(seq)
+            self._append({"op": "ack", "owner": self.owner, "seq": seqs[-1], "seqs": seqs})
+            flushed += len(batch)
+            self.sent += len(batch)
+            self.bytes_sent += size
+        if self.log_records > 4 * len(self.pending) + 256:
+            self.compact()
+        return flushed
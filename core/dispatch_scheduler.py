@@ -0,0 +1,155 @@
+"""
+DispatchScheduler-Pinnacle — Fleet-Aware MercyGel Drop Scheduling
+MercyLogistics Pinnacle Ultramasterpiece — Jan 18 2026
+
+Spreads drops across the whole StarlinkDroneController fleet:
+- Priority queue of pending drops (lower number = sooner, FIFO within a priority)
+- Availability index: per-cell heaps keyed by (in-flight jobs, battery) + one fleet-wide heap
+- Selection: nearest ring of grid cells with an eligible drone, else fleet-wide best — O(log n)
+- Lazy invalidation (per-drone version stamps) — no heap rebuild on every state change
+- Drones below min_battery or at max_in_flight drop out of the index until they recover
+"""
+
+import heapq
+import math
+
+_EARTH_M_PER_DEG = 111_320.0
+
+def destination_xy(destination: dict) -> tuple:
+    """Local metres — {"x", "y"} as given, {"lat", "lon"} via equirectangular projection at its own
+    latitude. Shared by dispatch and logistics clustering, so mixed job lists agree on units"""
+    if "x" in destination:
+        return float(destination["x"]), float(destination.get("y", 0.0))
+    lat = destination.get("lat", 0.0)
+    return (destination.get("lon", 0.0) * _EARTH_M_PER_DEG * math.cos(math.radians(lat)),
+            lat * _EARTH_M_PER_DEG)
+
+class DispatchScheduler:
+    def __init__(self, drones: list, cell_size: float = 500.0, max_in_flight: int = 4,
+                 min_battery: float = 20.0, drain_per_km: float = 0.5, search_rings: int = 2):
+        self.drones = drones                # Shared with StarlinkDroneController.drones
+        self.cell_size = cell_size
+        self.max_in_flight = max_in_flight  # Sachets aboard at once
+        self.min_battery = min_battery      # % — below this a drone heads home
+        self.drain_per_km = drain_per_km    # % battery per km flown
+        self.search_rings = search_rings    # Cell rings tried before the fleet-wide pick
+        self.pending = []                   # heap of (priority, seq, destination, payload)
+        self._seq = 0
+        self.cells = {}                     # cell -> heap of (in_flight, -battery, drone_id, version)
+        self.fleet = []                     # Same entries, whole fleet
+        self.version = [0] * len(drones)
+        self.dispatched = 0
+        self.last_legs = []                 # Metres flown per drop of the last dispatch()
+        for drone_id, drone in enumerate(drones):
+            drone.setdefault("position", (0.0, 0.0))
+            drone.setdefault("in_flight", 0)
+            self._index(drone_id)
+
+    # === availability index ===
+    def _cell(self, xy: tuple) -> tuple:
+        return int(xy[0] // self.cell_size), int(xy[1] // self.cell_size)
+
+    def _eligible(self, drone: dict) -> bool:
+        return (drone["status"] == "nominal" and drone["battery"] >= self.min_battery
+                and drone["in_flight"] < self.max_in_flight)
+
+    def _index(self, drone_id: int):
+        """(Re)publish a drone after any state change — older entries go stale"""
+        self.version[drone_id] += 1
+        drone = self.drones[drone_id]
+        if not self._eligible(drone):
+            return
+        entry = (drone["in_flight"], -drone["battery"], drone_id, self.version[drone_id])
+        heapq.heappush(self.cells.setdefault(self._cell(drone["position"]), []), entry)
+        heapq.heappush(self.fleet, entry)
+        if len(self.fleet) > 4 * len(self.drones) + 64:
+            self._rebuild()
+
+    def _rebuild(self):
+        # Drop stale entries in bulk once they outnumber live ones
+        self.cells, self.fleet = {}, []
+        for drone_id in range(len(self.drones)):
+            self.version[drone_id] += 1
+            drone = self.drones[drone_id]
+            if self._eligible(drone):
+                entry = (drone["in_flight"], -drone["battery"], drone_id, self.version[drone_id])
+                self.cells.setdefault(self._cell(drone["position"]), []).append(entry)
+                self.fleet.append(entry)
+        for heap in self.cells.values():
+            heapq.heapify(heap)
+        heapq.heapify(self.fleet)
+
+    def _top(self, heap: list):
+        while heap:
+            entry = heap[0]
+            drone = self.drones[entry[2]]
+            if entry[3] == self.version[entry[2]] and self._eligible(drone):
+                return entry
+            heapq.heappop(heap)  # Stale, or drained since indexed (telemetry)
+        return None
+
+    def select(self, xy: tuple):
+        """Least-loaded, best-charged drone in the nearest occupied ring of cells"""
+        cx, cy = self._cell(xy)
+        for ring in range(self.search_rings + 1):
+            best = None
+            for dx in range(-ring, ring + 1):
+                for dy in range(-ring, ring + 1):
+                    if max(abs(dx), abs(dy)) != ring:
+                        continue
+                    heap = self.cells.get((cx + dx, cy + dy))
+                    entry = self._top(heap) if heap else None
+                    if entry is not None and (best is None or entry < best):
+                        best = entry
+            if best is not None:
+                return best[2]
+        entry = self._top(self.fleet)
+        return None if entry is None else entry[2]
+
+    # === jobs ===
+    def submit(self, destination: dict, payload: str = "MercyGel", priority: int = 5) -> int:
+        self._seq += 1
+        heapq.heappush(self.pending, (priority, self._seq, destination, payload))
+        return self._seq
+
+    def assign(self, drone_id: int, destination: dict) -> float:
+        """Load one sachet and fly it — returns the leg length in metres"""
+        drone = self.drones[drone_id]
+        xy = destination_xy(destination)
+        px, py = drone["position"]
+        leg = math.hypot(xy[0] - px, xy[1] - py)
+        drone["battery"] -= leg / 1000 * self.drain_per_km
+        drone["position"] = xy
+        drone["in_flight"] += 1
+        self.dispatched += 1
+        self._index(drone_id)
+        return leg
+
+    def dispatch(self, limit: int = None) -> list:
+        """Pop pending drops by priority onto drones — [(job_id, drone_id, destination, payload)]"""
+        drops = []
+        self.last_legs = []
+        while self.pending and (limit is None or len(drops) < limit):
+            _, job_id, destination, payload = self.pending[0]
+            drone_id = self.select(destination_xy(destination))
+            if drone_id is None:
+                break  # Whole fleet busy or low — jobs wait in order
+            heapq.heappop(self.pending)
+            self.last_legs.append(self.assign(drone_id, destination))
+            drops.append((job_id, drone_id, destination, payload))
+        return drops
+
+    def hold(self, drone_id: int):
+        """Take a payload slot for a drop already in flight (e.g. replayed from the outbox)"""
+        self.drones[drone_id]["in_flight"] += 1
+        self._index(drone_id)
+
+    def complete(self, drone_id: int):
+        """Sachet delivered (or its command dropped) — frees one payload slot"""
+        drone = self.drones[drone_id]
+        drone["in_flight"] = max(0, drone["in_flight"] - 1)
+        self._index(drone_id)
+
+    def recharge(self, drone_id: int, level: float = 98.0):
+        self.drones[drone_id]["battery"] = level
+        self._index(drone_id)
@@ -0,0 +1,185 @@
+"""
+DroneTelemetry-Pinnacle — Columnar Fleet Telemetry + Ring-Buffer History
+MercyLogistics Pinnacle Ultramasterpiece — Jan 18 2026
+
+Struct-of-arrays telemetry for StarlinkDroneController (replaces list of per-drone dicts):
+- Columns: battery (float32), status code (uint8), position (float64 x/y), in-flight payload (int16)
+- Fleet-wide updates are single vectorized ops (drain, recharge, status masks)
+- Per-drone rows keep the old dict interface (drone["battery"]) for the scheduler
+- Ring buffer of recent snapshots, written twice (mirrored) — any recent window is one contiguous view
+- Downsampled aggregates per window of snapshots: min / mean battery per drone
+- Dashboards read history as NumPy views — no copies, no Python loops over the fleet
+"""
+
+import numpy as np
+
+STATUSES = ["nominal", "returning", "charging", "fault"]
+
+class DroneRow:
+    """One drone's slice of the columns — mapping-style, like the old dict"""
+    __slots__ = ("store", "drone_id")
+
+    def __init__(self, store, drone_id: int):
+        self.store = store
+        self.drone_id = drone_id
+
+    def __getitem__(self, key: str):
+        store, i = self.store, self.drone_id
+        if key == "battery":
+            return float(store.battery[i])
+        if key == "status":
+            return store.status_names[store.status[i]]
+        if key == "position":
+            return tuple(store.position[i].tolist())
+        if key == "in_flight":
+            return int(store.in_flight[i])
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value):
+        store, i = self.store, self.drone_id
+        if key == "battery":
+            store.battery[i] = value
+        elif key == "status":
+            store.status[i] = store.status_code(value)
+        elif key == "position":
+            store.position[i] = value
+        elif key == "in_flight":
+            store.in_flight[i] = value
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in DroneTelemetry.FIELDS
+
+    def get(self, key: str, default=None):
+        return self[key] if key in self else default
+
+    def setdefault(self, key: str, default=None):
+        return self[key]  # Every column always has a value
+
+class DroneTelemetry:
+    FIELDS = ("battery", "status", "position", "in_flight")
+
+    def __init__(self, fleet_size: int, battery: float = 98.0, history: int = 64, window: int = 8,
+                 windows: int = 32):
+        n = fleet_size
+        self.battery = np.full(n, battery, dtype=np.float32)
+        self.status = np.zeros(n, dtype=np.uint8)           # Index into status_names
+        self.position = np.zeros((n, 2), dtype=np.float64)
+        self.in_flight = np.zeros(n, dtype=np.int16)        # Sachets aboard
+        self.status_names = list(STATUSES)
+        self._status_codes = {name: code for code, name in enumerate(self.status_names)}
+        self.rows = [DroneRow(self, i) for i in range(n)]
+
+        # Snapshot ring — 2× depth, each snapshot written at head and head + depth
+        self.history = history
+        self.times = np.zeros(2 * history)
+        self.battery_hist = np.zeros((2 * history, n), dtype=np.float32)
+        self.status_hist = np.zeros((2 * history, n), dtype=np.uint8)
+        self.position_hist = np.zeros((2 * history, n, 2), dtype=np.float32)
+        self.head = 0
+        self.snapshots = 0
+
+        # Aggregate ring — one row per window of snapshots
+        self.window = window
+        self.windows = windows
+        self.window_times = np.zeros(2 * windows)
+        self.battery_min = np.zeros((2 * windows, n), dtype=np.float32)
+        self.battery_mean = np.zeros((2 * windows, n), dtype=np.float32)
+        self.agg_head = 0
+        self.aggregates = 0
+        self._win_min = np.full(n, np.inf, dtype=np.float32)
+        self._win_sum = np.zeros(n, dtype=np.float64)
+        self._win_count = 0
+
+    def __len__(self) -> int:
+        return len(self.battery)
+
+    def status_code(self, name: str) -> int:
+        code = self._status_codes.get(name)
+        if code is None:
+            code = len(self.status_names)
+            self.status_names.append(name)
+            self._status_codes[name] = code
+        return code
+
+    # === vectorized fleet updates ===
+    def drain(self, amount, drones=None):
+        """Battery -= amount (scalar or per-drone array), floored at 0"""
+        if drones is None:
+            np.subtract(self.battery, amount, out=self.battery)
+            np.maximum(self.battery, 0, out=self.battery)
+        else:
+            self.battery[drones] = np.maximum(self.battery[drones] - amount, 0)
+
+    def recharge(self, level: float = 98.0, drones=None):
+        if drones is None:
+            self.battery.fill(level)
+        else:
+            self.battery[drones] = level
+
+    def mask(self, status: str) -> np.ndarray:
+        return self.status == self._status_codes.get(status, 255)
+
+    def set_status(self, status: str, drones):
+        self.status[drones] = self.status_code(status)
+
+    def summary(self) -> dict:
+        """Fleet-wide snapshot — O(n) in C"""
+        counts = np.bincount(self.status, minlength=len(self.status_names))
+        return {
+            "drones": len(self),
+            "battery_mean": float(self.battery.mean()) if len(self) else 0.0,
+            "battery_min": float(self.battery.min()) if len(self) else 0.0,
+            "in_flight": int(self.in_flight.sum()),
+            "status": {name: int(count) for name, count in zip(self.status_names, counts) if count},
+        }
+
+    # === history ===
+    def snapshot(self, now: float):
+        """Record the current columns into the ring; closes an aggregate window every `window` calls"""
+        for slot in (self.head, self.head + self.history):
+            self.times[slot] = now
+            self.battery_hist[slot] = self.battery
+            self.status_hist[slot] = self.status
+            self.position_hist[slot] = self.position
+        self.head = (self.head + 1) % self.history
+        self.snapshots += 1
+
+        np.minimum(self._win_min, self.battery, out=self._win_min)
+        self._win_sum += self.battery
+        self._win_count += 1
+        if self._win_count == self.window:
+            for slot in (self.agg_head, self.agg_head + self.windows):
+                self.window_times[slot] = now
+                self.battery_min[slot] = self._win_min
+                self.battery_mean[slot] = self._win_sum / self._win_count
+            self.agg_head = (self.agg_head + 1) % self.windows
+            self.aggregates += 1
+            self._win_min.fill(np.inf)
+            self._win_sum.fill(0.0)
+            self._win_count = 0
+
+    def _recent(self, ring: np.ndarray, head: int, depth: int, filled: int, last: int):
+        last = min(filled, depth) if last is None else min(last, filled, depth)
+        end = head + depth  # Mirror half: [end - last, end) is chronological and contiguous
+        return ring[end - last:end]
+
+    def recent(self, field: str = "battery", last: int = None, drone_id: int = None) -> np.ndarray:
+        """Last snapshots oldest-first — (last, n[, 2]) view, or (last[, 2]) for one drone"""
+        ring = {"battery": self.battery_hist, "status": self.status_hist,
+                "position": self.position_hist, "time": self.times}[field]
+        view = self._recent(ring, self.head, self.history, self.snapshots, last)
+        return view if drone_id is None or field == "time" else view[:, drone_id]
+
+    def windowed(self, stat: str = "mean", last: int = None, drone_id: int = None) -> np.ndarray:
+        """Downsampled battery per window (stat "min" / "mean" / "time") — view, oldest-first"""
+        ring = {"min": self.battery_min, "mean": self.battery_mean, "time": self.window_times}[stat]
+        view = self._recent(ring, self.agg_head, self.windows, self.aggregates, last)
+        return view if drone_id is None or stat == "time" else view[:, drone_id]
+
+    def nbytes(self) -> int:
+        return sum(a.nbytes for a in (
+            self.battery, self.status, self.position, self.in_flight, self.times,
+            self.battery_hist, self.status_hist, self.position_hist,
+            self.window_times, self.battery_min, self.battery_mean))
@@ -0,0 +1,340 @@
+"""
+Instrumentation-Pinnacle — Per-Tick Timing, Histograms, Counters, Sampling Profiler
+PowerRush Ultramasterpiece — Jan 18 2026
+
+Where does the 42 ms go:
+- @hot_path("name") marks run() / update_positions — wrapped only while enabled
+  (disabled = the original function object, zero per-call cost); budget_ms= gives a path its own
+  tick budget (update_positions: 23.8 ms coord pulse), the rest share the 42 ms default
+- HDR-style log-linear latency histograms per subsystem (≤ ~3% bucket error, ns to minutes)
+- Self time: nested hot paths (CoopGelDelivery.run → super().run() → …) are timed on a per-thread
+  span stack and each histogram gets its own time only — the subsystem histograms sum to the tick
+- Counters: tick overruns (outermost span over its path's budget, counted once), dispatches, bytes synced
+  — each thread adds to its own dict, merged at export, so concurrent ticks never lose an increment
+- TickScheduler task stats folded into the export
+- Optional sampling profiler thread (collapsed stacks, flamegraph-ready)
+- Export: Prometheus text to a file (textfile collector) or a local /metrics endpoint
+"""
+
+import functools
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+
+SUB_BITS = 5                      # 32 linear sub-buckets per power of two
+SUB_COUNT = 1 << SUB_BITS
+TICK_BUDGET_NS = 42_000_000       # Default per-path budget — 42 ms ≈ one 24 Hz tick (1/24 s)
+
+class LatencyHistogram:
+    """Log-linear buckets over integer nanoseconds — record is O(1), no allocation"""
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self):
+        self.counts = [0] * (SUB_COUNT * 40)   # Up to ~4.8 h in ns
+        self.count = 0
+        self.total = 0
+        self.min = 1 << 62
+        self.max = 0
+
+    @staticmethod
+    def index_of(value: int) -> int:
+        if value < SUB_COUNT:
+            return value
+        shift = value.bit_length() - SUB_BITS - 1
+        return (shift << SUB_BITS) + (value >> shift)
+
+    @staticmethod
+    def upper_of(index: int) -> int:
+        """Largest value landing in bucket index"""
+        if index < SUB_COUNT:
+            return index
+        shift = index // SUB_COUNT - 1
+        return ((index % SUB_COUNT + SUB_COUNT + 1) << shift) - 1
+
+    def record(self, value: int):
+        if value < SUB_COUNT:
+            index = value
+        else:
+            shift = value.bit_length() - SUB_BITS - 1
+            index = (shift << SUB_BITS) + (value >> shift)
+            if index >= len(self.counts):
+                index = len(self.counts) - 1
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+        if value < self.min:
+            self.min = value
+
+    def percentile(self, q: float) -> int:
+        if not self.count:
+            return 0
+        rank = max(1, round(q / 100 * self.count))
+        seen = 0
+        for index, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return min(self.upper_of(index), self.max)
+        return self.max
+
+    def buckets(self):
+        """(upper bound, cumulative count) for non-empty buckets"""
+        seen = 0
+        for index, n in enumerate(self.counts):
+            if n:
+                seen += n
+                yield self.upper_of(index), seen
+
+class Metrics:
+    def __init__(self):
+        self.enabled = False
+        self.histograms = {}          # name -> LatencyHistogram
+        self.hot_paths = []           # (owner class, attribute, name, original function, budget ns)
+        self.schedulers = []          # TickScheduler instances folded into exports
+        self.budget_ns = TICK_BUDGET_NS
+        self.profiler = None
+        self._lock = threading.Lock()
+        self._spans = threading.local()  # .stack — child-time accumulator per open span
+        self._tally = threading.local()  # .counters — this thread's name -> count (only it writes)
+        self._tallies = []               # Every thread's counters dict, merged by .counters
+        self._server = None
+
+    # === hooks ===
+    def register(self, owner, attr: str, name: str, budget_ns: int = None):
+        fn = owner.__dict__[attr]
+        self.hot_paths.append((owner, attr, name, fn, budget_ns))
+        if self.enabled:
+            setattr(owner, attr, self._timed(fn, name, budget_ns))
+
+    def _timed(self, fn, name: str, budget_ns: int = None):
+        histogram = self.histograms.setdefault(name, LatencyHistogram())
+        budget = self.budget_ns if budget_ns is None else budget_ns
+        add, clock, spans = self._add, time.perf_counter_ns, self._spans
+        overruns = f"{name}_overruns"
+
+        @functools.wraps(fn)
+        def timed(*args, **kwargs):
+            try:
+                stack = spans.stack
+            except AttributeError:
+                stack = spans.stack = []
+            stack.append(0)
+            start = clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                histogram.record(elapsed - stack.pop())  # Self time — children recorded their own
+                if stack:
+                    stack[-1] += elapsed                 # Charge the whole span to the parent's children
+                elif elapsed > budget:
+                    add(overruns, 1)                     # Outermost span only
+        timed.__wrapped_hot_path__ = fn
+        return timed
+
+    def enable(self):
+        """Wrap every registered hot path (idempotent)"""
+        with self._lock:
+            if not self.enabled:
+                self.enabled = True
+                for owner, attr, name, fn, budget_ns in self.hot_paths:
+                    setattr(owner, attr, self._timed(fn, name, budget_ns))
+
+    def disable(self):
+        """Put the original functions back — no residual per-call cost"""
+        with self._lock:
+            if self.enabled:
+                self.enabled = False
+                for owner, attr, _, fn, _ in self.hot_paths:
+                    setattr(owner, attr, fn)
+
+    def count(self, name: str, n: int = 1):
+        if self.enabled:
+            self._add(name, n)
+
+    def _add(self, name: str, n: int):
+        try:
+            counters = self._tally.counters
+        except AttributeError:  # First count on this thread (or since reset)
+            counters = self._tally.counters = {}
+            with self._lock:
+                self._tallies.append(counters)
+        counters[name] = counters.get(name, 0) + n
+
+    @property
+    def counters(self) -> dict:
+        """name -> total, summed over every thread's counters"""
+        with self._lock:
+            tallies = list(self._tallies)
+        totals = {}
+        for counters in tallies:
+            for name, n in counters.copy().items():  # copy() is one C call — safe against the owner's adds
+                totals[name] = totals.get(name, 0) + n
+        return totals
+
+    def watch(self, scheduler):
+        """Fold a TickScheduler's per-task overrun / skip / error counts into exports"""
+        self.schedulers.append(scheduler)
+        return scheduler
+
+    def reset(self):
+        self.histograms = {name: LatencyHistogram() for name in self.histograms}
+        with self._lock:  # Fresh thread-local — every thread starts a new dict on its next count
+            self._tally, self._tallies = threading.local(), []
+        if self.enabled:  # Re-bind wrappers to the fresh histograms
+            self.disable()
+            self.enable()
+
+    # === profiler ===
+    def start_profiler(self, interval: float = 0.005, thread_id: int = None):
+        """Sample stacks every interval seconds (all threads, or one) until stop_profiler"""
+        if self.profiler is None:
+            self.profiler = SamplingProfiler(interval, thread_id)
+            self.profiler.start()
+        return self.profiler
+
+    def stop_profiler(self):
+        profiler, self.profiler = self.profiler, None
+        if profiler is not None:
+            profiler.stop()
+        return profiler
+
+    # === export ===
+    def summary(self) -> dict:
+        return {name: {"count": h.count, "p50_ms": h.percentile(50) / 1e6, "p99_ms": h.percentile(99) / 1e6,
+                       "max_ms": h.max / 1e6} for name, h in self.histograms.items() if h.count}
+
+    def prometheus(self, prefix: str = "powerrush") -> str:
+        lines = []
+        for name, h in sorted(self.histograms.items()):
+            if not h.count:
+                continue
+            metric = _metric(f"{prefix}_{name}_seconds")
+            lines.append(f"# TYPE {metric} histogram")
+            for upper, seen in h.buckets():
+                lines.append(f'{metric}_bucket{{le="{upper / 1e9:.9g}"}} {seen}')
+            lines.append(f'{metric}_bucket{{le="+Inf"}} {h.count}')
+            lines.append(f"{metric}_sum {h.total / 1e9:.9g}")
+            lines.append(f"{metric}_count {h.count}")
+        for name, total in sorted(self.counters.items()):
+            metric = _metric(f"{prefix}_{name}_total")
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {total}")
+        for field in ("overruns", "skipped", "errors", "ticks"):
+            metric = f"{prefix}_tick_{field}_total"
+            samples = [f'{metric}{{task="{task.name}"}} {getattr(task, field)}'
+                       for scheduler in self.schedulers for task in scheduler.tasks.values()]
+            if samples:
+                lines.append(f"# TYPE {metric} counter")
+                lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str, prefix: str = "powerrush"):
+        """Atomic Prometheus-text file (node_exporter textfile collector friendly)"""
+        tmp = f"{path}.tmp"
+        with open(tmp, "w") as f:
+            f.write(self.prometheus(prefix))
+        os.replace(tmp, path)
+
+    def serve(self, port: int = 9464, host: str = "127.0.0.1"):
+        """Local Prometheus endpoint on a daemon thread — GET /metrics"""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path != "/metrics":
+                    self.send_error(404)
+                    return
+                body = metrics.prometheus().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass  # Scrapes are not news
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=self._server.serve_forever, name="metrics", daemon=True).start()
+        return self._server.server_address
+
+    def shutdown(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+class SamplingProfiler:
+    """Background stack sampler — counts collapsed stacks (root;...;leaf)"""
+    def __init__(self, interval: float = 0.005, thread_id: int = None):
+        self.interval = interval
+        self.thread_id = thread_id    # None = every thread but the sampler
+        self.stacks = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self):
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for ident, frame in sys._current_frames().items():
+                if ident == own or (self.thread_id is not None and ident != self.thread_id):
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                    frame = frame.f_back
+                self.stacks[";".join(reversed(stack))] += 1
+            self.samples += 1
+
+    def top(self, n: int = 10) -> list:
+        """Hottest leaf functions — [(function, share of samples)]"""
+        leaves = Counter()
+        for stack, count in self.stacks.items():
+            leaves[stack.rsplit(";", 1)[-1]] += count
+        total = sum(leaves.values()) or 1
+        return [(leaf, count / total) for leaf, count in leaves.most_common(n)]
+
+    def write_collapsed(self, path: str):
+        with open(path, "w") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+def _metric(name: str) -> str:
+    return re.sub(r"[^a-zA-Z0-9_:]", "_", name)
+
+METRICS = Metrics()
+
+class hot_path:
+    """Method decorator — registers the method with METRICS, returns it unchanged.
+
+    budget_ms: this path's overrun threshold (default: the metrics' 42 ms tick budget)
+    """
+    def __init__(self, name: str, metrics: Metrics = METRICS, budget_ms: float = None):
+        self.name = name
+        self.metrics = metrics
+        self.budget_ns = None if budget_ms is None else int(budget_ms * 1_000_000)
+
+    def __call__(self, fn):
+        self.fn = fn
+        return self
+
+    def __set_name__(self, owner, attr: str):
+        setattr(owner, attr, self.fn)
+        self.metrics.register(owner, attr, self.name, self.budget_ns)
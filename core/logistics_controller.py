@@ -1,42 +1,147 @@
 """
 LogisticsController-Pinnacle — Full Loop + Pyrolysis Recycle Integration
 MercyLogistics Pinnacle Ultramasterpiece — Jan 18 2026
+
+- Batched multi-recipient dispatch: cluster by destination, spread clusters across the fleet,
+  one recycle mint for the whole drop
+- Subsystems imported + built on first use; fleet / recycle / print line each behind their own lock
+  (one controller shared process-wide via core.logistics_service)
 """
 
-from core.gel_printer import GelPrinter
-from core.drone_pod import DronePod
-from core.robot_hand_off import RobotHandOff
-from core.pyrolysis_recycle import PyrolysisRecycle
-from core.starlink_drone_controller import StarlinkDroneController
+import importlib
+import threading
+import numpy as np
+
+from core.dispatch_scheduler import destination_xy
+
+def _centroid(destinations: list) -> dict:
+    """Mean drop point, in the same keys the destinations came in (local x/y metres if they mix)"""
+    with_xy = sum("x" in d for d in destinations)
+    if 0 < with_xy < len(destinations):
+        x, y = np.mean([destination_xy(d) for d in destinations], axis=0)
+        return {"x": float(x), "y": float(y)}
+    keys = ("x", "y") if with_xy else ("lat", "lon")
+    return {k: sum(d.get(k, 0.0) for d in destinations) / len(destinations) for k in keys}
+
+def _lazy(name: str, module: str, cls: str):
+    """Subsystem property — module imported and object constructed on first access, once"""
+    attr = "_" + name
+
+    def factory():
+        return getattr(importlib.import_module(module), cls)()
+
+    def get(self):
+        value = self.__dict__.get(attr)
+        if value is None:
+            with self._init_lock:
+                value = self.__dict__.get(attr)
+                if value is None:
+                    value = factory()
+                    setattr(self, attr, value)
+        return value
+
+    def set(self, value):
+        setattr(self, attr, value)
+
+    return property(get, set)
 
 class LogisticsController:
+    printer = _lazy("printer", "core.gel_printer", "GelPrinter")
+    drone = _lazy("drone", "core.drone_pod", "DronePod")
+    robot = _lazy("robot", "core.robot_hand_off", "RobotHandOff")
+    recycle = _lazy("recycle", "core.pyrolysis_recycle", "PyrolysisRecycle")
+    drone_fleet = _lazy("drone_fleet", "core.starlink_drone_controller", "StarlinkDroneController")
+
     def __init__(self):
-        self.printer = GelPrinter()
-        self.drone = DronePod()
-        self.robot = RobotHandOff()
-        self.recycle = PyrolysisRecycle()
-        self.drone_fleet = StarlinkDroneController()
+        self._init_lock = threading.Lock()
+        self.fleet_lock = threading.RLock()     # Scheduler queue + drone telemetry
+        self.recycle_lock = threading.RLock()   # Tag store / ledger
+        self.cycle_lock = threading.Lock()      # Printer → pod → robot line
+        self.cluster_radius = 250.0     # Metres — one drone serves a cell this size
+        self.payload_per_drone = 4      # Sachets per sortie
+        self.last_plan = []             # [{"drone", "destination", "players", "flavors"}]
     
     def full_cycle(self, flavor: str, vitamins: dict, destination: dict):
-        print_step = self.printer.print_sachet(flavor, vitamins)
-        drone_step = self.drone.deploy()
-        robot_step = self.robot.transfer("sachet-001")
-        recycle_step = self.recycle.close_loop()  # Auto reclaim on cycle
+        with self.cycle_lock:
+            print_step = self.printer.print_sachet(flavor, vitamins)
+            drone_step = self.drone.deploy()
+            robot_step = self.robot.transfer("sachet-001")
+        with self.recycle_lock:
+            recycle_step = self.recycle.close_loop()  # Auto reclaim on cycle
         return f"Cycle complete: {print_step} → {drone_step} → {robot_step} → {recycle_step}"
     
+    def _fleet_drop(self, destination: dict, payload: str, recipient: str) -> str:
+        with self.fleet_lock:
+            job = self.drone_fleet.queue_drop(destination, payload, recipient=recipient)
+            dispatched = self.drone_fleet.dispatch_pending()
+        if job in dispatched:
+            return dispatched[job][1]
+        return f"Fleet busy — {payload} drop queued, mercy waits."
+
     def mercy_gel_drop(self, player_id: str, destination: dict, flavor: str = "butter"):
-        status = self.drone_fleet.command_drop(0, destination, f"MercyGel-{flavor}")
+        status = self._fleet_drop(destination, f"MercyGel-{flavor}", player_id)
         # Trigger reclaim simulation on delivery
-        self.recycle.collect_fragment(f"gel_{player_id}")
+        with self.recycle_lock:
+            self.recycle.collect_fragment(f"gel_{player_id}")
         return f"{status} — {flavor} abundance delivered."
     
     def boss_reward_gel_drop(self, player_id: str, destination: dict, flavor: str = "butter"):
-        status = self.drone_fleet.command_drop(0, destination, f"MercyGel-{flavor}")
-        self.recycle.collect_fragment(f"boss_gel_{player_id}")
+        status = self._fleet_drop(destination, f"MercyGel-{flavor}", player_id)
+        with self.recycle_lock:
+            self.recycle.collect_fragment(f"boss_gel_{player_id}")
         return f"{status} — boss reward {flavor} dispatched — joy restored."
-    
+
+    def plan_dispatch(self, jobs: list) -> list:
+        """Cluster (player, destination, flavor) jobs by grid cell, split to payload-sized sorties"""
+        if not jobs:
+            return []
+        xy = np.array([destination_xy(dest) for _, dest, _ in jobs], dtype=float)  # Each in its own units
+        cells = np.floor(xy / self.cluster_radius).astype(np.int64)
+        _, labels = np.unique(cells, axis=0, return_inverse=True)
+        order = np.argsort(labels.ravel(), kind="stable")
+        groups = np.split(order, np.flatnonzero(np.diff(labels.ravel()[order])) + 1)
+        plan = []
+        for group in groups:
+            for i in range(0, len(group), self.payload_per_drone):
+                members = group[i:i + self.payload_per_drone]
+                dests = [jobs[j][1] for j in members]
+                plan.append({
+                    "drone": None,  # Filled by the fleet scheduler
+                    "destination": dests[0] if len(dests) == 1 else _centroid(dests),
+                    "players": [jobs[j][0] for j in members],
+                    "flavors": [jobs[j][2] for j in members],
+                })
+        return plan
+
+    def dispatch_batch(self, jobs: list, fragment_prefix: str = "gel"):
+        """One planning pass for a team drop — jobs = [(player_id, destination, flavor)]"""
+        self.last_plan, status = self.dispatch_plan(jobs, fragment_prefix)
+        return status
+
+    def dispatch_plan(self, jobs: list, fragment_prefix: str = "gel"):
+        """dispatch_batch without touching last_plan — returns (plan, status); safe to share"""
+        plan = self.plan_dispatch(jobs)  # Pure — planned outside the locks
+        if not plan:
+            return plan, "No recipients — mercy waits."
+        with self.fleet_lock:
+            job_ids = [self.drone_fleet.queue_drop(
+                sortie["destination"],
+                f"MercyGel-{'+'.join(sorted(set(sortie['flavors'])))} x{len(sortie['players'])}",
+                recipient=",".join(sortie["players"]),
+            ) for sortie in plan]
+            dispatched = self.drone_fleet.dispatch_pending()  # Sorties spread across the fleet
+        for sortie, job in zip(plan, job_ids):
+            if job in dispatched:
+                sortie["drone"] = dispatched[job][0]
+        with self.recycle_lock:
+            self.recycle.collect_fragments([f"{fragment_prefix}_{player}" for player, _, _ in jobs])
+        drones = len({s["drone"] for s in plan if s["drone"] is not None})
+        return plan, f"Batch dispatch — {len(jobs)} sachets in {len(plan)} sorties across {drones} drones — abundance shared."
+
     def reclaim_status(self):
-        return self.recycle.status()
+        with self.recycle_lock:
+            return self.recycle.status()
 
     def fleet_status(self):
-        return self.drone_fleet.telemetry_sync()
+        with self.fleet_lock:
+            return self.drone_fleet.telemetry_sync()
@@ -0,0 +1,78 @@
+"""
+LogisticsService-Pinnacle — One Shared MercyLogistics Backend per Process
+MercyLogistics Pinnacle Ultramasterpiece — Jan 18 2026
+
+Process-wide logistics for every chat shard and coop group:
+- One LogisticsController (one fleet, one tag ledger) instead of one per caller
+- Built on first use — importing or taking a handle constructs nothing
+- Thread-safe: fleet, recycle and print line each behind their own lock
+- Lightweight per-caller handles (caller id + own last plan, no subsystems)
+- Grandma-safe: every caller sees the same drones and the same reclaim count
+"""
+
+import threading
+
+from core.logistics_controller import LogisticsController
+
+class LogisticsHandle:
+    """Caller-scoped view of the shared controller — same call surface as LogisticsController"""
+    __slots__ = ("service", "caller", "last_plan")
+
+    def __init__(self, service, caller: str):
+        self.service = service
+        self.caller = caller
+        self.last_plan = []   # This caller's most recent batch plan
+
+    @property
+    def controller(self) -> LogisticsController:
+        return self.service.controller
+
+    def full_cycle(self, flavor: str, vitamins: dict, destination: dict):
+        return self.controller.full_cycle(flavor, vitamins, destination)
+
+    def mercy_gel_drop(self, player_id: str, destination: dict, flavor: str = "butter"):
+        return self.controller.mercy_gel_drop(player_id, destination, flavor)
+
+    def boss_reward_gel_drop(self, player_id: str, destination: dict, flavor: str = "butter"):
+        return self.controller.boss_reward_gel_drop(player_id, destination, flavor)
+
+    def dispatch_batch(self, jobs: list, fragment_prefix: str = "gel"):
+        self.last_plan, status = self.controller.dispatch_plan(jobs, fragment_prefix)
+        return status
+
+    def reclaim_status(self):
+        return self.controller.reclaim_status()
+
+    def fleet_status(self):
+        return self.controller.fleet_status()
+
+class LogisticsService:
+    def __init__(self, factory=LogisticsController):
+        self.factory = factory
+        self._controller = None
+        self._lock = threading.Lock()
+
+    @property
+    def controller(self) -> LogisticsController:
+        controller = self._controller
+        if controller is None:
+            with self._lock:
+                if self._controller is None:
+                    self._controller = self.factory()
+                controller = self._controller
+        return controller
+
+    def handle(self, caller: str) -> LogisticsHandle:
+        return LogisticsHandle(self, caller)
+
+_shared = None
+_shared_lock = threading.Lock()
+
+def shared_logistics() -> LogisticsService:
+    """The process-wide service — created once, on first call"""
+    global _shared
+    if _shared is None:
+        with _shared_lock:
+            if _shared is None:
+                _shared = LogisticsService()
+    return _shared
@@ -0,0 +1,141 @@
+"""
+NarrationService-Pinnacle — Cached, Non-Blocking Mythic Voice Narration
+MercyLogistics Pinnacle Ultramasterpiece — Jan 18 2026
+
+summon_mythic(voice, text) for game-tick call sites, off the tick:
+- Callers only enqueue — synthesis + playback on one background voice thread
+- Bounded LRU of rendered narration keyed by (voice, template, template params)
+- Identical narrations within dedupe_window seconds are spoken once
+- Full queue drops the line (counted) — a tick never waits on the voice
+- A failing render / playback is logged + counted (stats()["errors"]), the voice thread carries on
+- Voice pack (voices.mythic_lattice_pack) loaded on the voice thread; absent = caption text only
+- Grandma-safe: the same warm line, the same voice, never a stutter of repeats
+"""
+
+import importlib
+import logging
+import queue
+import threading
+import time
+from collections import OrderedDict, deque
+
+log = logging.getLogger(__name__)
+
+def _voice_pack_render():
+    try:
+        return importlib.import_module("voices.mythic_lattice_pack").summon_mythic
+    except ImportError:
+        return lambda voice, text: text  # No voice pack on this shard — captions only
+
+class NarrationService:
+    def __init__(self, render=None, play=None, cache_size: int = 256, dedupe_window: float = 2.0,
+                 max_queue: int = 1024, clock=time.monotonic):
+        self.render = render                  # fn(voice, text) -> clip (slow; None = voice pack)
+        self.play = play                      # fn(voice, clip) (None = keep in self.played)
+        self.played = deque(maxlen=64)        # Recent (voice, clip) — caption feed
+        self.cache_size = cache_size
+        self.cache = OrderedDict()            # key -> clip, least recent first (voice thread only)
+        self.dedupe_window = dedupe_window
+        self.clock = clock
+        self.queue = queue.Queue(max_queue)
+        self._recent = {}                     # key -> last enqueue time
+        self._lock = threading.Lock()
+        self._worker = None
+        self.hits = self.misses = 0
+        self.deduped = self.dropped = self.spoken = 0
+        self.errors = 0                       # Render / playback failures (voice thread)
+        self.last_error = None                # repr of the most recent one
+
+    @staticmethod
+    def key_of(voice: str, text: str, params: dict) -> tuple:
+        return voice, text, tuple(sorted(params.items()))
+
+    def narrate(self, voice: str, text: str, **params) -> bool:
+        """Queue a narration (text may be a str.format template) — never blocks"""
+        key = self.key_of(voice, text, params)
+        now = self.clock()
+        with self._lock:
+            last = self._recent.get(key)
+            if last is not None and now - last < self.dedupe_window:
+                self.deduped += 1
+                return False
+            self._recent[key] = now
+            if len(self._recent) > 4 * self.cache_size:
+                cutoff = now - self.dedupe_window
+                self._recent = {k: t for k, t in self._recent.items() if t >= cutoff}
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="narration", daemon=True)
+                self._worker.start()
+        try:
+            self.queue.put_nowait(key)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            return False
+        return True
+
+    def _clip(self, key: tuple):
+        clip = self.cache.get(key)
+        if clip is not None:
+            self.hits += 1
+            self.cache.move_to_end(key)
+            return clip
+        self.misses += 1
+        voice, text, params = key
+        clip = self.render(voice, text.format(**dict(params)) if params else text)
+        self.cache[key] = clip
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return clip
+
+    def _run(self):
+        if self.render is None:
+            self.render = _voice_pack_render()
+        while True:
+            key = self.queue.get()
+            try:
+                if key is None:
+                    return
+                clip = self._clip(key)
+                if self.play is None:
+                    self.played.append((key[0], clip))
+                else:
+                    self.play(key[0], clip)
+                self.spoken += 1
+            except Exception as exc:  # A bad line never silences the voice thread — mercy, no crash
+                self.errors += 1
+                self.last_error = repr(exc)
+                log.exception("narration failed for voice %r: %r", key[0], key[1])
+            finally:
+                self.queue.task_done()
+
+    def drain(self):
+        """Block until everything queued so far has been spoken (tests / shutdown)"""
+        if self._worker is not None:
+            self.queue.join()
+
+    def close(self):
+        if self._worker is not None:
+            self.queue.put(None)
+            self._worker.join()
+            self._worker = None
+
+    def stats(self) -> dict:
+        return {"spoken": self.spoken, "deduped": self.deduped, "dropped": self.dropped, "errors": self.errors,
+                "cache_hits": self.hits, "cache_misses": self.misses, "queued": self.queue.qsize()}
+
+_shared = None
+_shared_lock = threading.Lock()
+
+def shared_narration() -> NarrationService:
+    """The process-wide narration service — created once, on first call"""
+    global _shared
+    if _shared is None:
+        with _shared_lock:
+            if _shared is None:
+                _shared = NarrationService()
+    return _shared
+
+def summon_mythic(voice: str, text: str, **params) -> bool:
+    """Drop-in for the voice pack call — queued, cached, de-duplicated"""
+    return shared_narration().narrate(voice, text, **params)
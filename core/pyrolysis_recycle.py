@@ -4,8 +4,10 @@ MercyLogistics Pinnacle Ultramasterpiece — Jan 18 2026
 
 Complete pyrolysis recycle with advanced RF-tag collection:
 - Encrypted RF-tags on every fragment
-- Multi-drone coordinated grid sweep
-- Purity verification pre-process
+- Multi-drone coordinated grid sweep — whole sweep minted in one batch
+- Purity verification pre-process — whole batch in one vectorized pass
+- Compact array-backed tag store (8-byte tags, float32 purity, interned fragment IDs)
+- Optional memory-mapped ledger — tags + collected count survive restarts
 - Energy accounting — 0.7 kWh / 100 sachets net
 - Grandma-safe material loop
 """
@@ -13,47 +15,78 @@ Complete pyrolysis recycle with advanced RF-tag collection:
 import time
 import random
 import math
+import secrets
+import numpy as np
+from core.rf_tag_store import RfTagStore
+from core.tag_ledger import TagLedger
 
 class PyrolysisRecycle:
-    def __init__(self, drone_count: int = 8):
-        self.collected_fragments = 0
-        self.tag_database = {}          # tag_id: purity_score
+    def __init__(self, drone_count: int = 8, ledger_path: str = None):
+        self.ledger = TagLedger(ledger_path) if ledger_path else None  # On-disk backend
+        self.tag_store = RfTagStore() if self.ledger is None else self.ledger  # tag -> purity, fragment id
+        self._collected = 0
+        self.rng = np.random.default_rng()  # Purity draws (tags themselves come from secrets)
         self.filament_yield = 0.97      # 97% polymer back
         self.energy_per_100 = 0.7       # kWh
         self.purity_threshold = 99.9    # % safe reclaim
         self.drone_count = drone_count
         self.sweep_grid_size = 100.0    # meters side
     
+    @property
+    def collected_fragments(self) -> int:
+        return self.ledger.collected if self.ledger is not None else self._collected
+
+    @collected_fragments.setter
+    def collected_fragments(self, value: int):
+        if self.ledger is not None:
+            self.ledger.collected = value  # Header counter — persisted with the ledger
+        else:
+            self._collected = value
+
     def generate_tag(self, fragment_id: str) -> str:
         """Simulate encrypted RF-tag generation"""
-        tag = secrets.token_hex(8)
-        self.tag_database[tag] = {"id": fragment_id, "purity": random.uniform(99.5, 100.0)}
-        return tag
+        tag = secrets.randbits(64)
+        self.tag_store.add(tag, fragment_id, random.uniform(99.5, 100.0))
+        return f"{tag:016x}"
     
+    def mint_tags(self, count: int, fragment_ids: list = None) -> np.ndarray:
+        """Batched tag minting — one CSPRNG read, one purity vector, one bulk insert"""
+        tags = np.frombuffer(secrets.token_bytes(8 * count), dtype=np.uint64)
+        purity = self.rng.uniform(99.5, 100.0, count)
+        if fragment_ids is None:
+            first = self.collected_fragments
+            fragment_ids = [f"frag_{i}" for i in range(first, first + count)]
+        self.tag_store.add_many(tags, fragment_ids, purity)
+        self.collected_fragments += count
+        return tags
+
+    def collect_fragment(self, fragment_id: str) -> str:
+        """Delivered sachet enters the reclaim loop"""
+        tag = self.generate_tag(fragment_id)
+        self.collected_fragments += 1
+        return tag
+
+    def collect_fragments(self, fragment_ids: list) -> np.ndarray:
+        """Whole batch of delivered sachets — one mint for the lot"""
+        return self.mint_tags(len(fragment_ids), list(fragment_ids))
+
     def drone_sweep_simulation(self, area_coverage: float = 1.0):
         """Multi-drone coordinated grid sweep"""
         fragments_found = int(50 * area_coverage * self.drone_count * random.uniform(0.9, 1.1))
-        for _ in range(fragments_found):
-            tag = self.generate_tag(f"frag_{self.collected_fragments}")
-            self.collected_fragments += 1
+        self.mint_tags(fragments_found)
         return f"Drone sweep complete — {fragments_found} fragments tagged/collected."
     
     def verify_purity(self, tag: str) -> bool:
-        if tag in self.tag_database:
-            return self.tag_database[tag]["purity"] >= self.purity_threshold
-        return False
+        purity = self.tag_store.purity_of(int(tag, 16))
+        return purity is not None and purity >= self.purity_threshold
     
     def process_batch(self, batch_size: int = 100):
         if self.collected_fragments < batch_size:
             return "Insufficient fragments — mercy waits."
         
-        valid_count = 0
-        for _ in range(batch_size):
-            # Simulate tag read + verify
-            tag = random.choice(list(self.tag_database.keys()))
-            if self.verify_purity(tag):
-                valid_count += 1
-            del self.tag_database[tag]
+        # Simulate tag reads — random draw + swap-remove, then one vectorized verify
+        _, purity = self.tag_store.pop_random(batch_size)
+        valid_count = int(np.count_nonzero(purity >= self.purity_threshold))
         
         reclaimed = valid_count * self.filament_yield
         energy_used = (valid_count / 100) * self.energy_per_100
@@ -66,8 +99,15 @@ class PyrolysisRecycle:
         process = self.process_batch()
         return f"Pyrolysis loop closed — {sweep} → {process} — cradle-to-cradle eternal."
     
+    def checkpoint(self):
+        """Flush the on-disk ledger (no-op in memory)"""
+        if self.ledger is not None:
+            self.ledger.flush()
+            return f"Ledger checkpoint — {len(self.ledger)} live tags safe on disk."
+        return "In-memory ledger — nothing to flush."
+
     def status(self):
-        return f"Fragments collected: {self.collected_fragments} | Tags active: {len(self.tag_database)} — reclaim ready."
+        return f"Fragments collected: {self.collected_fragments} | Tags active: {len(self.tag_store)} — reclaim ready."
 
 # Integration test
 if __name__ == "__main__":
@@ -0,0 +1,172 @@
+"""
+RfTagStore-Pinnacle — Compact Array-Backed RF-Tag Index for Pyrolysis Reclaim
+MercyLogistics Pinnacle Ultramasterpiece — Jan 18 2026
+
+Struct-of-arrays tag store (replaces hex-string -> dict per tag):
+- Tags as 8-byte ints (uint64), purity as float32, fragment IDs interned to int32
+- Dense slots 0..n-1 — O(1) random sampling, O(1) swap-remove
+- Bulk insert for whole sweeps (slice copies, one index update)
+- Batch pop returns tag + purity arrays for one vectorized purity pass
+- Interned fragment names recycled once no tag references them
+- ~16 bytes of arrays + one index entry per tag (vs ~400 bytes of nested dicts)
+"""
+
+import numpy as np
+
+class RfTagStore:
+    def __init__(self, capacity: int = 1024, seed: int = None):
+        self.tags = np.zeros(capacity, dtype=np.uint64)
+        self.purity = np.zeros(capacity, dtype=np.float32)
+        self.fragments = np.zeros(capacity, dtype=np.int32)  # Interned fragment id
+        self.count = 0
+        self.slot_of = {}            # tag -> slot (point lookups / verify by tag)
+        self.names = []              # Fragment id -> fragment name
+        self._name_ids = {}          # Fragment name -> id
+        self._name_refs = []         # Tags still pointing at each name
+        self._free_names = []
+        self.rng = np.random.default_rng(seed)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, tag: int) -> bool:
+        return tag in self.slot_of
+
+    # === interning ===
+    def _intern(self, name: str) -> int:
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            if self._free_names:
+                name_id = self._free_names.pop()
+                self.names[name_id] = name
+                self._name_refs[name_id] = 0
+            else:
+                name_id = len(self.names)
+                self.names.append(name)
+                self._name_refs.append(0)
+            self._name_ids[name] = name_id
+        self._name_refs[name_id] += 1
+        return name_id
+
+    def _intern_many(self, names: list) -> list:
+        """Intern a batch — all-new names take a block of ids without per-name lookups"""
+        k = len(names)
+        if len(set(names)) != k or not self._name_ids.keys().isdisjoint(names):
+            return [self._intern(name) for name in names]  # Shared names — refcount each
+        reuse = min(len(self._free_names), k)
+        ids = self._free_names[len(self._free_names) - reuse:]
+        del self._free_names[len(self._free_names) - reuse:]
+        for name_id, name in zip(ids, names):
+            self.names[name_id] = name
+            self._name_refs[name_id] = 1
+        first = len(self.names)
+        ids.extend(range(first, first + k - reuse))
+        self.names.extend(names[reuse:])
+        self._name_refs.extend([1] * (k - reuse))
+        self._name_ids.update(zip(names, ids))
+        return ids
+
+    def _release(self, name_ids):
+        for name_id in name_ids.tolist():
+            self._name_refs[name_id] -= 1
+            if not self._name_refs[name_id]:
+                del self._name_ids[self.names[name_id]]
+                self.names[name_id] = None
+                self._free_names.append(name_id)
+
+    # === writes ===
+    def _grow(self, needed: int):
+        capacity = len(self.tags)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for field in ("tags", "purity", "fragments"):
+            old = getattr(self, field)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, field, new)
+
+    def add(self, tag: int, fragment_id: str, purity: float) -> int:
+        slot = self.slot_of.get(tag)
+        if slot is not None:  # Re-read of a known tag — refresh in place
+            self._release(self.fragments[slot:slot + 1])
+        else:
+            self._grow(self.count + 1)
+            slot = self.count
+            self.count += 1
+            self.slot_of[tag] = slot
+            self.tags[slot] = tag
+        self.purity[slot] = purity
+        self.fragments[slot] = self._intern(fragment_id)
+        return slot
+
+    def add_many(self, tags: np.ndarray, fragment_ids, purity: np.ndarray) -> int:
+        """Bulk insert — array copies + one C-level index update"""
+        k = len(tags)
+        tag_list = tags.tolist()
+        if len(set(tag_list)) != k or not self.slot_of.keys().isdisjoint(tag_list):
+            # 64-bit collision (astronomically rare) — per-tag path handles refresh
+            for tag, name, score in zip(tag_list, fragment_ids, purity.tolist()):
+                self.add(tag, name, score)
+            return k
+        start = self.count
+        self._grow(start + k)
+        self.tags[start:start + k] = tags
+        self.purity[start:start + k] = purity
+        self.fragments[start:start + k] = self._intern_many(list(fragment_ids))
+        self.slot_of.update(zip(tag_list, range(start, start + k)))
+        self.count = start + k
+        return k
+
+    def remove(self, tag: int) -> bool:
+        slot = self.slot_of.get(tag)
+        if slot is None:
+            return False
+        self._remove_slots(np.array([slot]))
+        return True
+
+    def _remove_slots(self, slots: np.ndarray):
+        """Swap-remove distinct slots: survivors from the tail fill the holes"""
+        k = len(slots)
+        tail_start = self.count - k
+        in_tail = slots >= tail_start
+        holes = slots[~in_tail]
+        keep_tail = np.ones(k, dtype=bool)
+        keep_tail[slots[in_tail] - tail_start] = False
+        movers = np.flatnonzero(keep_tail) + tail_start  # len(movers) == len(holes)
+
+        for tag in self.tags[slots].tolist():
+            del self.slot_of[tag]
+        self._release(self.fragments[slots])
+        if len(holes):
+            for field in (self.tags, self.purity, self.fragments):
+                field[holes] = field[movers]
+            for tag, slot in zip(self.tags[holes].tolist(), holes.tolist()):
+                self.slot_of[tag] = slot
+        self.count = tail_start
+
+    # === reads ===
+    def purity_of(self, tag: int):
+        slot = self.slot_of.get(tag)
+        return None if slot is None else float(self.purity[slot])
+
+    def fragment_of(self, tag: int):
+        slot = self.slot_of.get(tag)
+        return None if slot is None else self.names[self.fragments[slot]]
+
+    def sample(self, k: int) -> np.ndarray:
+        """k distinct random slots — O(k), no key-list rebuild"""
+        k = min(k, self.count)
+        return self.rng.choice(self.count, size=k, replace=False, shuffle=False)
+
+    def pop_random(self, k: int):
+        """Remove k random tags; returns (tags, purity) arrays for vectorized checks"""
+        slots = self.sample(k)
+        tags = self.tags[slots].copy()
+        purity = self.purity[slots].copy()
+        self._remove_slots(slots)
+        return tags, purity
+
+    def nbytes(self) -> int:
+        return self.tags.nbytes + self.purity.nbytes + self.fragments.nbytes
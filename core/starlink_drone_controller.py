@@ -4,37 +4,167 @@ MercyLogistics Pinnacle Ultramasterpiece — Jan 18 2026
 
 Starlink burst for drone swarm:
 - 60s opportunistic command downlink
-- Telemetry uplink (position, battery, payload)
-- MercyGel dispatch specific command
+- Telemetry uplink (position, battery, payload) — columnar store, vectorized sync, ring-buffer history
+- MercyGel dispatch specific command (single drop or whole batched plan per burst check)
+- Fleet-aware scheduling — queued drops go to the nearest least-loaded charged drone
+- Delivery timers — a payload slot frees after the flight (leg / cruise speed + hand-off dwell);
+  coalesced-away offline drops free theirs at once, and waiting drops take the freed slot
 - Offline-first local mesh fallback
+- Outbox — offline commands coalesced, flushed within the burst budget; in memory by default,
+  durable with an explicit per-fleet outbox_path (locked to this controller, replayed drops retake
+  their drone's slot; fsyncs grouped to at most one per outbox_sync_s, 0 = every put)
+- Link window + telemetry on a timer wheel — flush fires on window open, no modulo polling
 """
 
 import time
+from collections import deque
+from functools import partial
+from core.dispatch_scheduler import DispatchScheduler
+from core.drone_telemetry import DroneTelemetry
+from core.command_queue import CommandQueue
+from core.timer_wheel import TimerWheel
+from core.instrumentation import METRICS, hot_path
 
 class StarlinkDroneController:
-    def __init__(self, fleet_size: int = 33):
+    def __init__(self, fleet_size: int = 33, outbox_path: str = None, clock=time.time,
+                 outbox_sync_s: float = 1.0):
         self.fleet_size = fleet_size
-        self.drones = [{"battery": 98, "status": "nominal"} for _ in range(fleet_size)]
+        self.telemetry = DroneTelemetry(fleet_size)
+        self.drones = self.telemetry.rows        # Dict-style views onto the telemetry columns
+        self.dispatcher = DispatchScheduler(self.drones)
+        # Commands waiting for the sky — give each fleet its own outbox_path to survive restarts
+        self.outbox = CommandQueue(outbox_path, sync_interval=outbox_sync_s, clock=clock,
+                                   on_superseded=self._superseded)
+        self._reclaim()
+        self.uplinked = []                       # Flushed batches (simulated downlink)
+        self.recipients = {}                     # Queued job -> recipient (outbox coalescing key)
+        self.cruise_speed = 15.0                 # m/s — delivery timer = leg / cruise_speed + drop_dwell
+        self.drop_dwell = 5.0                    # s hovering over the hand-off
+        self.deliveries = {}                     # drone_id -> deque of pending delivery timers
+        self.delivered = 0
         self.burst_interval = 60
-        self.last_burst = 0
-    
+        self.flush_every = 1.0                   # Outbox retry cadence while the link is up
+        self.timers = TimerWheel(clock)          # Injectable clock — simulations run fast
+        self.link = self.timers.window(120, 30, on_open=self._link_up, on_close=self._link_down)  # Simulated intermittent
+        self._flush_timer = None
+        self.timers.every(self.burst_interval, self.telemetry_sync)
+        if outbox_sync_s > 0:
+            self.timers.every(outbox_sync_s, self.outbox.fsync)  # Group commit for puts since the last fsync
+
+    def _link_up(self):
+        # Flush now, then retry while the window lasts (the bandwidth budget may need several passes)
+        self._flush_timer = self.timers.every(self.flush_every, self.flush_outbox, start=self.timers.now)
+
+    def _link_down(self):
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
     def is_starlink_online(self) -> bool:
-        return time.time() % 120 < 30  # Simulated intermittent
+        self.timers.advance()
+        return self.link.is_open
     
-    def command_drop(self, drone_id: int, destination: dict, payload: str = "MercyGel"):
-        if self.is_starlink_online():
+    def command_drop(self, drone_id: int, destination: dict, payload: str = "MercyGel", recipient: str = None):
+        return self._drop_status(self.is_starlink_online(), drone_id, destination, payload, recipient)
+
+    def _drop_status(self, online: bool, drone_id: int, destination: dict, payload: str, recipient: str = None,
+                     leg: float = None) -> str:
+        # leg (metres) is set only for scheduler-assigned drops — those hold a payload slot until delivered
+        if online:
+            if leg is not None:
+                self._fly(drone_id, leg)
             return f"Starlink burst command — Drone {drone_id} deploy {payload} to {destination}."
+        # Same recipient + destination + payload while offline = one drop
+        command = {"kind": "drop", "drone": drone_id, "destination": destination,
+                   "payload": payload, "recipient": recipient}
+        if leg is not None:
+            command["leg"] = leg
+        self.outbox.put(command)
         return f"Local mesh command — Drone {drone_id} queued for {payload} drop."
+
+    # === delivery ===
+    def _fly(self, drone_id: int, leg: float):
+        # Slot frees when the sachet lands — the scheduler re-offers the drone then
+        timer = self.timers.schedule(self.timers.now + leg / self.cruise_speed + self.drop_dwell, None)
+        timer.callback = partial(self._delivered, drone_id, timer)
+        self.deliveries.setdefault(drone_id, deque()).append(timer)
+
+    def _delivered(self, drone_id: int, timer):
+        self.deliveries[drone_id].remove(timer)
+        self._release(drone_id)
+
+    def _release(self, drone_id: int):
+        self.dispatcher.complete(drone_id)
+        self.delivered += 1
+        if self.dispatcher.pending:
+            self.dispatch_pending(online=self.link.is_open)  # Waiting drops take the freed slot
+
+    def _reclaim(self):
+        # Replayed scheduler drops hold their drone's slot again; ones for drones this fleet lacks fly untracked
+        for _, command, _ in self.outbox.pending.values():
+            if command.get("kind") == "drop" and "leg" in command:
+                if 0 <= command.get("drone", -1) < self.fleet_size:
+                    self.dispatcher.hold(command["drone"])
+                else:
+                    del command["leg"]
+
+    def _superseded(self, command: dict):
+        # Offline drop coalesced into a newer one — its drone never flies it
+        if command.get("kind") == "drop" and "leg" in command:
+            self.dispatcher.complete(command["drone"])
+
+    def _uplink(self, commands: list) -> bool:
+        # Simulated Starlink send — False once the window has closed
+        if not self.is_starlink_online():
+            return False
+        self.uplinked.append(commands)
+        for command in commands:
+            if command.get("kind") == "drop" and "leg" in command:
+                self._fly(command["drone"], command["leg"])
+        return True
+
+    def flush_outbox(self) -> str:
+        if not self.outbox or not self.is_starlink_online():
+            return f"Outbox holding {len(self.outbox)} commands — mercy waits for the sky."
+        sent = self.outbox.flush(self._uplink)
+        METRICS.count("outbox_commands_sent", sent)
+        return f"Outbox flushed {sent} commands — {len(self.outbox)} still queued."
+
+    def queue_drop(self, destination: dict, payload: str = "MercyGel", priority: int = 5, recipient: str = None) -> int:
+        job = self.dispatcher.submit(destination, payload, priority)
+        if recipient is not None:
+            self.recipients[job] = recipient
+        return job
+
+    def dispatch_pending(self, online: bool = None) -> dict:
+        """Hand every queued drop a drone, one link check — job_id -> (drone_id, status)"""
+        if online is None:
+            online = self.is_starlink_online()  # Landed deliveries free their slots first
+        drops = self.dispatcher.dispatch()
+        METRICS.count("drone_dispatches", len(drops))
+        statuses = [self._drop_status(online, drone_id, dest, payload, self.recipients.pop(job, None), leg)
+                    for (job, drone_id, dest, payload), leg in zip(drops, self.dispatcher.last_legs)]
+        return {job_id: (drone_id, status) for (job_id, drone_id, _, _), status in zip(drops, statuses)}
+
+    def drop_delivered(self, drone_id: int):
+        """Sachet landed — free the slot (early confirmations cancel the flight timer)"""
+        queue = self.deliveries.get(drone_id)
+        if queue:
+            queue.popleft().cancel()
+        self._release(drone_id)
+
+    def command_drops(self, drops: list) -> list:
+        """Whole plan [(drone_id, destination, payload[, recipient])] under one link check"""
+        online = self.is_starlink_online()
+        return [self._drop_status(online, *drop) for drop in drops]
     
     def telemetry_sync(self):
-        # Simulated update
-        for d in self.drones:
-            d["battery"] -= 0.1
+        # Simulated update — one vectorized drain, then into the history ring
+        self.telemetry.drain(0.1)
+        self.telemetry.snapshot(self.timers.now)
         return "Telemetry synced — fleet nominal, mercy flow active."
     
+    @hot_path("starlink_drone_controller")
     def run(self):
-        current_time = time.time()
-        if current_time - self.last_burst > self.burst_interval:
-            self.telemetry_sync()
-            self.last_burst = current_time
+        self.timers.advance()  # Telemetry sync, link window, outbox flush — all timer-driven
         return "Drone fleet heartbeat — mercy eternal."
@@ -6,18 +6,133 @@ Mercy-aligned geometric formations with full environmental resilience:
 - Previous: Trinity, Circle, Spiral, Heart, Hex + collision/obstacle/wind/rain/fog/sensor
 - New: V mercy wedge, Diamond nurture core, Starburst abundance bloom, Helix renewal spiral, Lattice weave eternal
 - All patterns preserve avoidance, grandma-safe, energy-efficient
+- Array-backed drone state (N×3 NumPy) — every formation batched in one expression, 10k+ fleets
+- Spatial-hash collision avoidance — ~O(N) neighbour repulsion per 42 Hz tick, each pair found once
+  (drones spawn on a min_distance launch-pad grid, so no cell starts over the occupancy cap)
+- Travel-minimising slot assignment within a per-deploy latency budget + cached formation templates
+- Streaming transition frames — lazy per-tick generator over one reused buffer
 """
 
 import math
-import time
 import random
+import functools
+
+import numpy as np
+
+from core.spatial_hash_grid import SpatialHashGrid
+from core.formation_assignment import assign_slots
+from core.tick_scheduler import TickScheduler
+from core.instrumentation import hot_path
+
+COORD_PULSE_HZ = 42  # Swarm ticks per second — update_positions has 1000 / 42 ≈ 23.8 ms
+
+# === FORMATION TEMPLATES (offsets from center, cached per fleet size + params) ===
+def _trinity(n, radius):
+    angle_rad = np.radians(np.array([0.0, 120.0, 240.0])[:min(3, n)])
+    return radius * np.cos(angle_rad), radius * np.sin(angle_rad), 5.0
+
+def _circle(n, radius):
+    angle_rad = 2 * np.pi * np.arange(n) / n
+    return radius * np.cos(angle_rad), radius * np.sin(angle_rad), 8.0
+
+def _spiral(n, turns, max_radius):
+    i = np.arange(n, dtype=np.float64)
+    theta = turns * 2 * np.pi * i / n
+    r = max_radius * i / n
+    return r * np.cos(theta), r * np.sin(theta), 10.0 + i * 0.5
+
+def _heart(n, scale):
+    t = 2 * np.pi * np.arange(n) / n
+    x = scale * (16 * np.sin(t)**3)
+    y = scale * (13 * np.cos(t) - 5 * np.cos(2*t) - 2 * np.cos(3*t) - np.cos(4*t))
+    return x, y, 12.0
+
+def _hex(n, spacing):
+    rows = int(math.sqrt(n)) + 1
+    row, col = np.divmod(np.arange(n, dtype=np.float64), rows)
+    offset = row % 2 * spacing / 2
+    return col * spacing + offset, row * spacing * math.sqrt(3) / 2, 10.0
+
+def _v_wedge(n, length, width):
+    row, col = np.divmod(np.arange(n, dtype=np.float64), 5)
+    col -= 2  # -2 to +2
+    step = length / max(n // 5, 1)
+    return row * step, col * (width / 4), 8.0
+
+def _diamond(n, size):
+    i = np.arange(n)
+    ring = np.minimum(i // 8, 3)
+    angle = np.radians((i % 8) * 45)
+    r = ring * (size / 3)
+    return r * np.cos(angle), r * np.sin(angle), 10.0
+
+def _starburst(n, arms, radius):
+    drones_per_arm = n // arms
+    count = min(arms * drones_per_arm, n)
+    if count == 0:
+        return np.empty(0), np.empty(0), np.empty(0)
+    a, d = np.divmod(np.arange(count, dtype=np.float64), drones_per_arm)
+    angle = np.radians(a * (360 / arms))
+    dist = (d + 1) * (radius / drones_per_arm)
+    return dist * np.cos(angle), dist * np.sin(angle), 8.0 + d * 0.5
+
+def _helix(n, height, radius):
+    turns = 5
+    frac = np.arange(n) / n
+    theta = turns * 2 * np.pi * frac
+    r = radius * frac
+    return r * np.cos(theta), r * np.sin(theta), height * frac
+
+def _lattice(n, spacing):
+    grid_size = int(math.sqrt(n)) + 1
+    row, col = np.divmod(np.arange(n, dtype=np.float64), grid_size)
+    offset = (row % 2) * spacing / 2
+    x = col * spacing + offset
+    y = row * spacing * 0.866  # Hex-like weave
+    z = 10.0 + (row % 3) * 3  # Gentle height variation
+    return x, y, z
+
+_TEMPLATE_BUILDERS = {
+    "trinity": _trinity,
+    "circle": _circle,
+    "spiral": _spiral,
+    "heart": _heart,
+    "hex": _hex,
+    "v_wedge": _v_wedge,
+    "diamond": _diamond,
+    "starburst": _starburst,
+    "helix": _helix,
+    "lattice": _lattice,
+}
+
+@functools.lru_cache(maxsize=64)
+def formation_template(formation: str, fleet_size: int, params: tuple) -> np.ndarray:
+    """Read-only (count×3) offsets for a formation — shared by every redeploy"""
+    x, y, z = _TEMPLATE_BUILDERS[formation](fleet_size, *params)
+    offsets = np.empty((len(x), 3))
+    offsets[:, 0] = x
+    offsets[:, 1] = y
+    offsets[:, 2] = z
+    offsets.flags.writeable = False
+    return offsets
+
+def launch_pad(fleet_size: int, spacing: float, altitude: float = 50.0) -> np.ndarray:
+    """Square spawn grid centred on the origin — never stacked, so no cell starts over the cap"""
+    side = max(1, math.ceil(math.sqrt(fleet_size)))
+    row, col = np.divmod(np.arange(fleet_size, dtype=np.float64), side)
+    pad = np.empty((fleet_size, 3))
+    pad[:, 0] = (col - (side - 1) / 2) * spacing
+    pad[:, 1] = (row - (side - 1) / 2) * spacing
+    pad[:, 2] = altitude
+    return pad
 
 class SwarmFormationController:
     def __init__(self, fleet_size: int = 33):
         self.fleet_size = fleet_size
-        self.drone_positions = [(0.0, 0.0, 50.0) for _ in range(fleet_size)]
-        self.target_positions = [(0.0, 0.0, 50.0) for _ in range(fleet_size)]
         self.min_distance = 10.0
+        # N×3 float arrays — one row per drone (x, y, z), spawned on a launch-pad grid
+        self.positions = launch_pad(fleet_size, self.min_distance)
+        self.targets = self.positions.copy()
         self.detect_range = 15.0
         self.repulse_strength = 800.0
         self.max_deflect = 1.5
@@ -27,125 +142,164 @@ class SwarmFormationController:
         self.wind_direction = 0.0
         self.rain_intensity = 0.0
         self.fog_density = 0.0
-        self.coord_pulse = 42
+        self.coord_pulse = COORD_PULSE_HZ
+        self.velocities = np.zeros((fleet_size, 3))  # Last applied per-tick step
+        self.spatial_index = SpatialHashGrid(cell_size=self.detect_range)
+        self.hungarian_limit = 64   # Exact assignment up to this fleet size, Morton + swaps above
+        self.assign_budget_ms = 20.0  # Slot assignment runs inside deploy_formation's tick
+
+    # === COMPATIBILITY VIEWS (list of (x, y, z) tuples) ===
+    @property
+    def drone_positions(self) -> list:
+        return list(map(tuple, self.positions.tolist()))
+
+    @drone_positions.setter
+    def drone_positions(self, value):
+        self.positions[:] = np.asarray(value, dtype=np.float64).reshape(self.fleet_size, 3)
+
+    @property
+    def target_positions(self) -> list:
+        return list(map(tuple, self.targets.tolist()))
+
+    @target_positions.setter
+    def target_positions(self, value):
+        self.targets[:] = np.asarray(value, dtype=np.float64).reshape(self.fleet_size, 3)
+
+    def _place(self, formation: str, center: tuple, *params):
+        """Translate the cached formation template to center — no trig on redeploy"""
+        offsets = formation_template(formation, self.fleet_size, params)
+        block = self.targets[:len(offsets)]
+        np.add(offsets, np.asarray(center, dtype=np.float64)[:3], out=block)
 
     # === PREVIOUS RESILIENCE FUNCTIONS (collision, obstacle, wind, rain, fog, sensor) ===
     # (kept intact from previous full version — omitted here for brevity, assume included)
 
+    # === COLLISION AVOIDANCE INTEGRATION STEP ===
+    def effective_thrust(self) -> float:
+        """Per-tick step cap — rain sheds up to 30% of max_thrust"""
+        return self.max_thrust * (1.0 - 0.3 * min(self.rain_intensity, 1.0))
+
+    @hot_path("swarm_update_positions", budget_ms=1000 / COORD_PULSE_HZ)
+    def update_positions(self, dt: float = None):
+        """One coord_pulse tick — target seek + spatial-hash neighbour repulsion + weather"""
+        dt = 1.0 / self.coord_pulse if dt is None else dt
+        pos = self.positions
+
+        # Target seek — step capped at (rain-adjusted) max_thrust per tick
+        thrust = self.effective_thrust()
+        seek = self.targets - pos
+        seek_len = np.sqrt(np.einsum("ij,ij->i", seek, seek))
+        seek *= np.minimum(1.0, thrust / np.maximum(seek_len, 1e-9))[:, None]
+
+        # Neighbour repulsion — fog widens the sensing buffer
+        detect = self.detect_range * (1.0 + 0.5 * min(self.fog_density, 1.0))
+        self.spatial_index.cell_size = detect
+        i, j, diff, dist = self.spatial_index.query_pairs(pos, detect, both=False)  # Each pair once
+        stacked = dist < 1e-6
+        if stacked.any():  # Coincident drones — deterministic split direction
+            phi = (i[stacked] - j[stacked]) * 2.399963  # Golden angle
+            diff[stacked] = np.stack([np.cos(phi), np.sin(phi), np.zeros_like(phi)], axis=1)
+            dist[stacked] = 1.0
+        weight = self.repulse_strength * dt / np.maximum(dist, 0.5 * self.min_distance) ** 2
+        push = diff * (weight / dist)[:, None]
+        n = self.fleet_size
+        deflect = np.stack(  # i is pushed along diff, j equally the other way
+            [np.bincount(i, weights=push[:, k], minlength=n) - np.bincount(j, weights=push[:, k], minlength=n)
+             for k in range(3)],
+            axis=1,
+        ).astype(np.float64, copy=False)  # Empty weights give int64 counts — no pairs in range
+        deflect_len = np.sqrt(np.einsum("ij,ij->i", deflect, deflect))
+        deflect *= np.minimum(1.0, self.max_deflect / np.maximum(deflect_len, 1e-9))[:, None]
+
+        # Wind drift (direction in degrees, horizontal only)
+        wind = math.radians(self.wind_direction)
+        drift = self.wind_speed * dt * np.array([math.cos(wind), math.sin(wind), 0.0])
+
+        np.add(seek, deflect, out=self.velocities)
+        self.velocities += drift
+        pos += self.velocities
+        return f"Positions updated — {len(i)} avoidance pairs, mercy spacing held."
+
     def trinity_triangle(self, center: tuple, radius: float = 10.0):
-        angles = [0, 120, 240]
-        for i in range(min(3, self.fleet_size)):
-            angle_rad = math.radians(angles[i])
-            x = center[0] + radius * math.cos(angle_rad)
-            y = center[1] + radius * math.sin(angle_rad)
-            z = center[2] + 5.0
-            self.target_positions[i] = (x, y, z)
+        self._place("trinity", center, radius)
         return "Trinity Triangle formed — mercy shield active."
 
     def abundance_circle(self, center: tuple, radius: float = 50.0):
-        for i in range(self.fleet_size):
-            angle_rad = 2 * math.pi * i / self.fleet_size
-            x = center[0] + radius * math.cos(angle_rad)
-            y = center[1] + radius * math.sin(angle_rad)
-            z = center[2] + 8.0
-            self.target_positions[i] = (x, y, z)
+        self._place("circle", center, radius)
         return "Abundance Circle formed — even nurture coverage."
 
     def mercy_spiral(self, center: tuple, turns: int = 5, max_radius: float = 80.0):
-        for i in range(self.fleet_size):
-            theta = turns * 2 * math.pi * i / self.fleet_size
-            r = max_radius * i / self.fleet_size
-            x = center[0] + r * math.cos(theta)
-            y = center[1] + r * math.sin(theta)
-            z = center[2] + 10.0 + i * 0.5
-            self.target_positions[i] = (x, y, z)
+        self._place("spiral", center, turns, max_radius)
         return "Mercy Spiral formed — expanding compassionate reach."
 
     def nurture_heart(self, center: tuple, scale: float = 30.0):
-        for i in range(self.fleet_size):
-            t = 2 * math.pi * i / self.fleet_size
-            x = scale * (16 * math.sin(t)**3)
-            y = scale * (13 * math.cos(t) - 5 * math.cos(2*t) - 2 * math.cos(3*t) - math.cos(4*t))
-            self.target_positions[i] = (center[0] + x, center[1] + y, center[2] + 12.0)
+        self._place("heart", center, scale)
         return "Nurture Heart formed — compassionate drop pattern."
 
     def eternal_hex_lattice(self, center: tuple, spacing: float = 15.0):
-        rows = int(math.sqrt(self.fleet_size)) + 1
-        for i in range(self.fleet_size):
-            row = i // rows
-            col = i % rows
-            offset = row % 2 * spacing / 2
-            x = center[0] + col * spacing + offset
-            y = center[1] + row * spacing * math.sqrt(3) / 2
-            z = center[2] + 10.0
-            self.target_positions[i] = (x, y, z)
+        self._place("hex", center, spacing)
         return "Eternal Hex Lattice formed — optimal scalable coverage."
 
     # === NEW MERCY FORMATIONS ===
     def v_mercy_wedge(self, center: tuple, length: float = 60.0, width: float = 40.0):
         """V mercy wedge — forward nurture spearhead"""
-        for i in range(self.fleet_size):
-            row = i // 5
-            col = i % 5 - 2  # -2 to +2
-            x = center[0] + row * (length / (self.fleet_size // 5))
-            y = center[1] + col * (width / 4)
-            z = center[2] + 8.0
-            self.target_positions[i] = (x, y, z)
+        self._place("v_wedge", center, length, width)
         return "V Mercy Wedge formed — forward compassionate advance."
 
     def diamond_nurture_core(self, center: tuple, size: float = 40.0):
         """Diamond nurture core — central protection diamond"""
-        for i in range(self.fleet_size):
-            ring = min(i // 8, 3)
-            pos_in_ring = i % 8
-            angle = pos_in_ring * 45
-            r = ring * (size / 3)
-            x = center[0] + r * math.cos(math.radians(angle))
-            y = center[1] + r * math.sin(math.radians(angle))
-            z = center[2] + 10.0
-            self.target_positions[i] = (x, y, z)
+        self._place("diamond", center, size)
         return "Diamond Nurture Core formed — central compassionate protection."
 
     def starburst_abundance_bloom(self, center: tuple, arms: int = 8, radius: float = 60.0):
         """Starburst abundance bloom — radial mercy burst"""
-        drones_per_arm = self.fleet_size // arms
-        for a in range(arms):
-            angle = a * (360 / arms)
-            for d in range(drones_per_arm):
-                dist = (d + 1) * (radius / drones_per_arm)
-                x = center[0] + dist * math.cos(math.radians(angle))
-                y = center[1] + dist * math.sin(math.radians(angle))
-                z = center[2] + 8.0 + d * 0.5
-                idx = a * drones_per_arm + d
-                if idx < self.fleet_size:
-                    self.target_positions[idx] = (x, y, z)
+        self._place("starburst", center, arms, radius)
         return "Starburst Abundance Bloom formed — radial compassionate expansion."
 
     def helix_renewal_spiral(self, center: tuple, height: float = 50.0, radius: float = 30.0):
         """Helix renewal spiral — vertical ascending mercy"""
-        turns = 5
-        for i in range(self.fleet_size):
-            theta = turns * 2 * math.pi * i / self.fleet_size
-            r = radius * (i / self.fleet_size)
-            x = center[0] + r * math.cos(theta)
-            y = center[1] + r * math.sin(theta)
-            z = center[2] + (height * i / self.fleet_size)
-            self.target_positions[i] = (x, y, z)
+        self._place("helix", center, height, radius)
         return "Helix Renewal Spiral formed — ascending compassionate renewal."
 
     def lattice_weave_eternal(self, center: tuple, spacing: float = 12.0):
         """Lattice weave eternal — interlocking mercy grid"""
-        grid_size = int(math.sqrt(self.fleet_size)) + 1
-        for i in range(self.fleet_size):
-            row = i // grid_size
-            col = i % grid_size
-            offset = (row % 2) * spacing / 2
-            x = center[0] + col * spacing + offset
-            y = center[1] + row * spacing * 0.866  # Hex-like weave
-            z = center[2] + 10.0 + (row % 3) * 3  # Gentle height variation
-            self.target_positions[i] = (x, y, z)
+        self._place("lattice", center, spacing)
         return "Lattice Weave Eternal formed — interlocking compassionate grid."
 
+    # === SLOT ASSIGNMENT ===
+    def assign_targets(self):
+        """Re-pair drones with formation slots to minimise total travel"""
+        perm = assign_slots(self.positions, self.targets, self.hungarian_limit, budget_ms=self.assign_budget_ms)
+        self.targets[:] = self.targets[perm]
+        travel = np.linalg.norm(self.targets - self.positions, axis=1).sum()
+        return f"Slots assigned — {travel:.1f} m total travel, no crossed paths."
+
+    # === STREAMING TRANSITIONS ===
+    def transition_ticks(self) -> int:
+        """coord_pulse ticks the current → target transition needs at effective thrust"""
+        delta = self.targets - self.positions
+        longest = np.sqrt(np.einsum("ij,ij->i", delta, delta).max(initial=0.0))
+        return max(1, math.ceil(longest / self.effective_thrust()))
+
+    def trajectory(self, out: np.ndarray = None):
+        """Lazily yield one N×3 frame per coord_pulse tick from current to target formation.
+
+        Every drone flies a straight line and all arrive on the same tick, so the
+        longest leg runs at effective thrust and no step exceeds it. Each frame is
+        the same reused buffer (`out` if given) — copy it to keep a frame.
+        """
+        end = self.targets.copy()  # Snapshot — redeploys mid-stream don't tear frames
+        frame = np.empty_like(end) if out is None else out
+        frame[:] = self.positions
+        ticks = self.transition_ticks()
+        step = end - frame
+        step /= ticks
+        for _ in range(ticks - 1):
+            frame += step
+            yield frame
+        frame[:] = end  # Land exactly on the slots
+        yield frame
+
     def deploy_formation(self, formation: str, center: tuple = (0,0,0)):
         formations = {
             "trinity": self.trinity_triangle,
@@ -161,6 +315,7 @@ class SwarmFormationController:
         }
         if formation in formations:
             formations[formation](center)
+            self.assign_targets()
             self.update_positions()
             return f"{formation.capitalize()} formation deployed — mercy harmony active."
         return "Formation not bloomed — mercy awaits."
@@ -169,6 +324,6 @@ class SwarmFormationController:
 if __name__ == "__main__":
     swarm = SwarmFormationController()
     swarm.deploy_formation("v_wedge", (0,0,50))
-    while True:
-        swarm.update_positions()
-        time.sleep(1/42)
+    scheduler = TickScheduler()
+    scheduler.add("swarm", swarm.update_positions, 1000 / swarm.coord_pulse)
+    scheduler.run_forever()
@@ -0,0 +1,278 @@
+"""
+TagLedger-Pinnacle — Persistent Memory-Mapped RF-Tag Ledger
+MercyLogistics Pinnacle Ultramasterpiece — Jan 18 2026
+
+On-disk tag store backend for PyrolysisRecycle (drop-in for RfTagStore):
+- Fixed-width 64-byte records (tag u64, purity f32, fragment id ≤ 52 bytes UTF-8) in an append-only mmap
+  (longer ids, or ids with NUL, are stored as a readable prefix + 128-bit BLAKE2b digest — never
+  truncated, never rejected mid-dispatch, two ids can't collapse into one record)
+- Tombstone bitmap (<path>.tomb.<generation>) — processing a tag flips one bit, never rewrites records
+- Header counters (appended / live / tombstoned / collected) — status() never scans
+- Reopen maps the files; no per-record parsing (tag index built lazily on first point lookup)
+- Periodic compaction once tombstones outweigh live records — sampling stays O(k); the compacted
+  copy is written + fsynced beside the ledger, then swapped in with os.replace (crash leaves the old one)
+- Ledger grows past RAM — the OS pages records in and out
+"""
+
+import hashlib
+import os
+import numpy as np
+
+MAGIC = b"RFTL"
+LEDGER_VERSION = 2
+FRAGMENT_BYTES = 52
+
+RECORD = np.dtype([("tag", "<u8"), ("purity", "<f4"), ("fragment", f"S{FRAGMENT_BYTES}")])  # 64 bytes
+HEADER = np.dtype([
+    ("magic", "S4"), ("version", "<u4"),
+    ("appended", "<u8"),     # Records written since the last compaction
+    ("live", "<u8"),
+    ("tombstoned", "<u8"),
+    ("collected", "<u8"),    # PyrolysisRecycle.collected_fragments
+    ("compactions", "<u8"),
+    ("pad", "S16"),
+])  # 64 bytes
+
+class TagLedgerError(ValueError):
+    """File is not a tag ledger, or was written by an unknown version"""
+
+DIGEST_BYTES = 16  # Hashed ids: prefix + "#" + 32 hex chars
+
+def fragment_key(fragment_id: str) -> bytes:
+    """Record bytes for a fragment id — verbatim UTF-8 when it fits, else prefix#digest"""
+    raw = str(fragment_id).encode()
+    if len(raw) <= FRAGMENT_BYTES and b"\0" not in raw:
+        return raw
+    digest = hashlib.blake2b(raw, digest_size=DIGEST_BYTES).hexdigest().encode()
+    room = FRAGMENT_BYTES - len(digest) - 1
+    prefix = raw.replace(b"\0", b"")[:room].decode(errors="ignore").encode()  # Whole characters only
+    return prefix + b"#" + digest
+
+def _encode_fragments(fragment_ids) -> list:
+    return [fragment_key(fragment_id) for fragment_id in fragment_ids]
+
+def _fsync_dir(path: str):
+    fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+class TagLedger:
+    def __init__(self, path: str, capacity: int = 4096, compact_ratio: float = 1.0, seed: int = None):
+        self.path = path
+        self.compact_ratio = compact_ratio  # Compact when tombstoned > ratio × live
+        self.compact_min = 1024             # ...and at least this many tombstones
+        self.rng = np.random.default_rng(seed)
+        self._index = None                  # tag -> record (lazy)
+        fresh = not os.path.exists(path)
+        if fresh:
+            self.tomb_path = self._tomb_path(0)
+            self._resize_files(capacity)
+        else:
+            self._check()  # Before mapping — a foreign file has no tomb bitmap to map
+        self._map()
+        if fresh:
+            self.header["magic"] = MAGIC
+            self.header["version"] = LEDGER_VERSION
+            self.flush()
+
+    def _check(self):
+        header = np.fromfile(self.path, dtype=HEADER, count=1)
+        if len(header) != 1 or header["magic"][0] != MAGIC:
+            raise TagLedgerError(f"{self.path} is not a tag ledger")
+        if header["version"][0] != LEDGER_VERSION:
+            raise TagLedgerError(f"unsupported ledger version {header['version'][0]}")
+
+    # === files ===
+    def _tomb_path(self, generation: int) -> str:
+        # One bitmap per compaction generation — the header names which one is current
+        return f"{self.path}.tomb.{generation}"
+
+    def _resize_files(self, capacity: int):
+        with open(self.path, "ab") as f:
+            f.truncate(HEADER.itemsize + capacity * RECORD.itemsize)
+        with open(self.tomb_path, "ab") as f:
+            f.truncate((capacity + 7) // 8)
+
+    def _map(self):
+        size = os.path.getsize(self.path)
+        self.capacity = (size - HEADER.itemsize) // RECORD.itemsize
+        self.header = np.memmap(self.path, dtype=HEADER, mode="r+", shape=(1,))
+        self.tomb_path = self._tomb_path(int(self.header["compactions"][0]))
+        self.records = np.memmap(self.path, dtype=RECORD, mode="r+", offset=HEADER.itemsize,
+                                 shape=(self.capacity,))
+        self.tombs = np.memmap(self.tomb_path, dtype=np.uint8, mode="r+", shape=((self.capacity + 7) // 8,))
+
+    def _grow(self, needed: int):
+        if needed <= self.capacity:
+            return
+        capacity = max(self.capacity, 1)
+        while capacity < needed:
+            capacity *= 2
+        self.flush()
+        del self.header, self.records, self.tombs
+        self._resize_files(capacity)
+        self._map()
+
+    def flush(self):
+        self.records.flush()
+        self.tombs.flush()
+        self.header.flush()
+
+    def close(self):
+        self.flush()
+        del self.header, self.records, self.tombs
+
+    # === counters (header — O(1)) ===
+    def _count(self, field: str) -> int:
+        return int(self.header[field][0])
+
+    def _bump(self, field: str, delta: int):
+        self.header[field] = self._count(field) + delta
+
+    def __len__(self) -> int:
+        return self._count("live")
+
+    @property
+    def appended(self) -> int:
+        return self._count("appended")
+
+    @property
+    def tombstoned(self) -> int:
+        return self._count("tombstoned")
+
+    @property
+    def collected(self) -> int:
+        return self._count("collected")
+
+    @collected.setter
+    def collected(self, value: int):
+        self.header["collected"] = value
+
+    # === writes (append-only) ===
+    def add(self, tag: int, fragment_id: str, purity: float) -> int:
+        return self.add_many(np.array([tag], dtype=np.uint64), [fragment_id], np.array([purity]))
+
+    def add_many(self, tags: np.ndarray, fragment_ids, purity: np.ndarray) -> int:
+        """Append records; tags are 64-bit CSPRNG draws, so no duplicate probe on disk"""
+        k = len(tags)
+        start = self.appended
+        self._grow(start + k)
+        block = self.records[start:start + k]
+        block["tag"] = tags
+        block["purity"] = purity
+        block["fragment"] = _encode_fragments(fragment_ids)
+        self._bump("appended", k)
+        self._bump("live", k)
+        if self._index is not None:
+            self._index.update(zip(np.asarray(tags).tolist(), range(start, start + k)))
+        return k
+
+    def _dead(self, rows: np.ndarray) -> np.ndarray:
+        return (self.tombs[rows >> 3] >> (rows & 7).astype(np.uint8)) & 1 == 1
+
+    def _kill(self, rows: np.ndarray):
+        np.bitwise_or.at(self.tombs, rows >> 3, (1 << (rows & 7)).astype(np.uint8))
+        if self._index is not None:
+            for tag in self.records["tag"][rows].tolist():
+                self._index.pop(tag, None)
+        k = len(rows)
+        self._bump("live", -k)
+        self._bump("tombstoned", k)
+
+    def remove(self, tag: int) -> bool:
+        row = self._lookup(tag)
+        if row is None:
+            return False
+        self._kill(np.array([row]))
+        return True
+
+    # === reads ===
+    def _lookup(self, tag: int):
+        if self._index is None:
+            # First point lookup after open — one vectorized pass over live records
+            n = self.appended
+            rows = np.flatnonzero(self._live_mask(n))
+            self._index = dict(zip(self.records["tag"][rows].tolist(), rows.tolist()))
+        return self._index.get(tag)
+
+    def __contains__(self, tag: int) -> bool:
+        return self._lookup(tag) is not None
+
+    def purity_of(self, tag: int):
+        row = self._lookup(tag)
+        return None if row is None else float(self.records["purity"][row])
+
+    def fragment_of(self, tag: int):
+        row = self._lookup(tag)
+        return None if row is None else self.records["fragment"][row].decode()
+
+    def _live_mask(self, n: int) -> np.ndarray:
+        return np.unpackbits(self.tombs[:(n + 7) // 8], bitorder="little")[:n] == 0
+
+    def sample(self, k: int) -> np.ndarray:
+        """k distinct live rows — rejection sampling, live fraction kept >= 1/2 by compaction"""
+        k = min(k, len(self))
+        n = self.appended
+        picked = np.empty(0, dtype=np.int64)
+        while len(picked) < k:
+            need = k - len(picked)
+            draw = self.rng.integers(0, n, size=int(need * n / max(len(self), 1) * 1.25) + 8)
+            draw = draw[~self._dead(draw)]
+            picked = np.unique(np.concatenate((picked, draw)))
+        return self.rng.permutation(picked)[:k]
+
+    def pop_random(self, k: int):
+        """Tombstone k random live tags; returns (tags, purity) arrays"""
+        rows = self.sample(k)
+        tags = np.array(self.records["tag"][rows])
+        purity = np.array(self.records["purity"][rows])
+        self._kill(rows)
+        if self.tombstoned >= self.compact_min and self.tombstoned > self.compact_ratio * len(self):
+            self.compact()
+        return tags, purity
+
+    # === maintenance ===
+    def compact(self, chunk: int = 1 << 16) -> int:
+        """Copy live records into a fresh ledger + empty bitmap, swap it in — returns records reclaimed
+
+        Nothing is rewritten in place: the new generation's bitmap and the compacted
+        file are fsynced first, and os.replace of the ledger is the commit point.
+        A crash before it leaves the old ledger + bitmap untouched.
+        """
+        n = self.appended
+        rows = np.flatnonzero(self._live_mask(n))
+        live = len(rows)
+        generation = self._count("compactions") + 1
+        tomb_path = self._tomb_path(generation)
+        with open(tomb_path, "wb") as f:
+            f.truncate((self.capacity + 7) // 8)
+            os.fsync(f.fileno())
+        header = np.array(self.header)
+        header["appended"] = live
+        header["live"] = live
+        header["tombstoned"] = 0
+        header["compactions"] = generation
+        tmp = self.path + ".compact"
+        with open(tmp, "wb") as f:
+            f.write(header.tobytes())
+            for start in range(0, live, chunk):  # Bounded memory — the ledger may exceed RAM
+                f.write(self.records[rows[start:start + chunk]].tobytes())
+            f.truncate(HEADER.itemsize + self.capacity * RECORD.itemsize)
+            os.fsync(f.fileno())
+        old_tomb = self.tomb_path
+        del self.header, self.records, self.tombs
+        try:
+            os.replace(tmp, self.path)
+        except BaseException:
+            self._map()  # Old generation still current — keep serving it
+            raise
+        _fsync_dir(self.path)
+        os.remove(old_tomb)
+        self._map()
+        self._index = None
+        return n - live
+
+    def nbytes(self) -> int:
+        return self.appended * RECORD.itemsize
@@ -0,0 +1,148 @@
+"""
+TickScheduler-Pinnacle — One Event Loop for Every 42 ms Subsystem Step
+PowerRush Ultramasterpiece — Jan 18 2026
+
+Fixed-rate asyncio scheduler for shard + subsystem run() steps:
+- Many shards per process on one event loop (no blocking while/sleep loops)
+- Absolute deadlines — work time is subtracted, so ticks never drift
+- Overrun + skip accounting — late ticks are dropped, never burst-replayed
+- Blocking steps offloaded to a thread pool, coroutine steps awaited in place
+- A failing step is counted and retried next tick — mercy, no crash
+"""
+
+import asyncio
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+
+class TickTask:
+    def __init__(self, name: str, step, interval_ms: float = 42, blocking: bool = False):
+        self.name = name
+        self.step = step
+        self.interval = interval_ms / 1000
+        self.blocking = blocking
+        self.is_coroutine = inspect.iscoroutinefunction(step)
+        self.active = True
+        self.ticks = 0
+        self.overruns = 0        # Steps that took longer than one interval
+        self.skipped = 0         # Deadlines dropped to catch up
+        self.errors = 0
+        self.last_error = None
+        self.work_time = 0.0     # Seconds spent inside step
+        self.max_work = 0.0
+        self.max_lag = 0.0       # Worst start delay past deadline
+
+    def stats(self) -> dict:
+        return {
+            "ticks": self.ticks,
+            "overruns": self.overruns,
+            "skipped": self.skipped,
+            "errors": self.errors,
+            "mean_ms": self.work_time / self.ticks * 1000 if self.ticks else 0.0,
+            "max_ms": self.max_work * 1000,
+            "max_lag_ms": self.max_lag * 1000,
+        }
+
+class TickScheduler:
+    def __init__(self, max_workers: int = None):
+        self.tasks = {}
+        self.executor = ThreadPoolExecutor(max_workers, thread_name_prefix="tick")
+        self._drivers = {}
+        self._loop = None
+        self._stopped = None
+
+    def add(self, name: str, step, interval_ms: float = 42, blocking: bool = False) -> TickTask:
+        task = TickTask(name, step, interval_ms, blocking)
+        self.tasks[name] = task
+        if self._loop is not None:  # Joining a running loop
+            self._loop.call_soon_threadsafe(self._start, task)
+        return task
+
+    def remove(self, name: str):
+        task = self.tasks.pop(name, None)
+        if task:
+            task.active = False
+
+    def _start(self, task: TickTask):
+        self._drivers[task.name] = self._loop.create_task(self._drive(task))
+
+    async def _drive(self, task: TickTask):
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        while task.active and not self._stopped.is_set():
+            start = loop.time()
+            task.max_lag = max(task.max_lag, start - deadline)
+            try:
+                if task.blocking:
+                    await loop.run_in_executor(self.executor, task.step)
+                elif task.is_coroutine:
+                    await task.step()
+                else:
+                    task.step()
+            except Exception as exc:
+                task.errors += 1
+                task.last_error = repr(exc)
+            now = loop.time()
+            elapsed = now - start
+            task.ticks += 1
+            task.work_time += elapsed
+            task.max_work = max(task.max_work, elapsed)
+            if elapsed > task.interval:
+                task.overruns += 1
+
+            deadline += task.interval
+            if now >= deadline + task.interval:  # Missed whole ticks — drop them
+                missed = int((now - deadline) // task.interval)
+                task.skipped += missed
+                deadline += missed * task.interval
+            await asyncio.sleep(max(0.0, deadline - now))
+
+    async def run(self, duration: float = None):
+        """Drive every task until stop() or for duration seconds"""
+        self._loop = asyncio.get_running_loop()
+        self._stopped = asyncio.Event()
+        for task in list(self.tasks.values()):
+            self._start(task)
+        try:
+            if duration is None:
+                await self._stopped.wait()
+            else:
+                try:
+                    await asyncio.wait_for(self._stopped.wait(), duration)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._stopped.set()
+            await asyncio.gather(*self._drivers.values(), return_exceptions=True)
+            self._drivers.clear()
+            self._loop = None
+
+    def stop(self):
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._stopped.set)
+
+    def run_forever(self):
+        asyncio.run(self.run())
+
+    def run_for(self, seconds: float):
+        asyncio.run(self.run(seconds))
+        return self.report()
+
+    def report(self) -> str:
+        lines = [f"{'task':<24} {'ticks':>7} {'over':>5} {'skip':>5} {'err':>4} {'mean ms':>8} {'max ms':>8}"]
+        for name, task in self.tasks.items():
+            s = task.stats()
+            lines.append(
+                f"{name:<24} {s['ticks']:>7} {s['overruns']:>5} {s['skipped']:>5} {s['errors']:>4} "
+                f"{s['mean_ms']:>8.2f} {s['max_ms']:>8.2f}"
+            )
+        return "\n".join(lines)
+
+# Many shards, one process
+if __name__ == "__main__":
+    from multiplayer.multiplayer_shard_sync import MultiplayerShardSync
+
+    scheduler = TickScheduler()
+    for i in range(64):
+        shard = MultiplayerShardSync(f"player_shard_{i:03d}", joy_valence=0.95)
+        scheduler.add(shard.shard_id, shard.run, shard.sync_interval)
+    print(scheduler.run_for(2.0))
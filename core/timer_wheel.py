@@ -0,0 +1,189 @@
+"""
+TimerWheel-Pinnacle — Hierarchical Timer Wheel + Burst Windows
+PowerRush Ultramasterpiece — Jan 18 2026
+
+Event-driven timing for Starlink bursts and refills (replaces time.time() % N polling):
+- Three 64-slot levels (~3 s / ~3.4 min / ~3.6 h at 50 ms resolution) + overflow list
+- O(1) schedule / cancel; advance() cascades only at level boundaries
+- Overrun ticks are caught up in one advance — nothing due is ever skipped
+- Periodic windows: on_open / on_close fire exactly once per window, wall-clock aligned
+- Windows missed entirely (suspend, long stall) are counted, not burst-replayed
+- Injectable clock — simulations drive virtual time faster than real time
+"""
+
+import math
+import time
+
+SLOT_BITS = 6
+SLOTS = 1 << SLOT_BITS
+SLOT_MASK = SLOTS - 1
+LEVELS = 3
+
+class Timer:
+    __slots__ = ("when", "due", "callback", "interval", "cancelled")
+
+    def __init__(self, when: float, due: int, callback, interval: float = None):
+        self.when = when
+        self.due = due              # Wheel tick it fires on
+        self.callback = callback
+        self.interval = interval    # Repeat period (None = one-shot)
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+class BurstWindow:
+    """Window of `length` seconds opening every `period` (at offset + k × period)"""
+    def __init__(self, wheel, period: float, length: float, on_open=None, on_close=None, offset: float = 0.0):
+        self.wheel = wheel
+        self.period = period
+        self.length = length
+        self.offset = offset
+        self.on_open = on_open
+        self.on_close = on_close
+        self.is_open = False
+        self.opens = self.closes = self.missed = 0
+        self.timer = None
+        now = wheel.clock()
+        start = offset + math.floor((now - offset) / period) * period
+        self._arm(start if now < start + length else start + period)
+
+    def _arm(self, start: float):
+        self.start = start
+        self.timer = self.wheel.schedule(start, self._open)
+
+    def _next_start(self) -> float:
+        # Next window not already over — ones that passed entirely during a stall are counted
+        start = self.start + self.period
+        now = self.wheel.now
+        if start + self.length <= now:
+            skip = math.floor((now - self.length - start) / self.period) + 1
+            self.missed += skip
+            start += skip * self.period
+        return start
+
+    def _open(self):
+        if self.wheel.now >= self.start + self.length:
+            self.missed += 1  # Whole window passed during a stall — link already gone
+            self._arm(self._next_start())
+            return
+        self.is_open = True
+        self.opens += 1
+        self.timer = self.wheel.schedule(self.start + self.length, self._close)
+        if self.on_open is not None:
+            self.on_open()
+
+    def _close(self):
+        self.is_open = False
+        self.closes += 1
+        if self.on_close is not None:
+            self.on_close()
+        self._arm(self._next_start())
+
+    def cancel(self):
+        if self.timer is not None:
+            self.timer.cancel()
+        self.is_open = False
+
+class TimerWheel:
+    def __init__(self, clock=time.time, resolution: float = 0.05):
+        self.clock = clock               # Injectable (virtual clock in simulation)
+        self.resolution = resolution     # Seconds per wheel tick
+        self.now = clock()
+        self.current = math.floor(self.now / resolution)
+        self.levels = [[[] for _ in range(SLOTS)] for _ in range(LEVELS)]
+        self.overflow = []               # Beyond the top level's span
+        self.ready = []                  # Due at or before the current tick
+        self.pending = 0
+        self.fired = 0
+
+    # === scheduling ===
+    def _place(self, timer: Timer):
+        delta = timer.due - self.current
+        if delta <= 0:
+            self.ready.append(timer)
+            return
+        for level in range(LEVELS):
+            if delta < 1 << (SLOT_BITS * (level + 1)):
+                self.levels[level][(timer.due >> (SLOT_BITS * level)) & SLOT_MASK].append(timer)
+                return
+        self.overflow.append(timer)
+
+    def schedule(self, when: float, callback, interval: float = None) -> Timer:
+        """callback() at clock time `when` (never early; late by at most one advance)"""
+        timer = Timer(when, math.ceil(when / self.resolution), callback, interval)
+        self.pending += 1
+        self._place(timer)
+        return timer
+
+    def call_later(self, delay: float, callback) -> Timer:
+        return self.schedule(self.now + delay, callback)
+
+    def every(self, interval: float, callback, start: float = None) -> Timer:
+        """Repeating timer — one firing per interval, catch-up firings collapsed"""
+        return self.schedule(self.now + interval if start is None else start, callback, interval)
+
+    def window(self, period: float, length: float, on_open=None, on_close=None, offset: float = 0.0) -> BurstWindow:
+        return BurstWindow(self, period, length, on_open, on_close, offset)
+
+    # === driving ===
+    def _cascade(self, level: int):
+        slot = self.levels[level][(self.current >> (SLOT_BITS * level)) & SLOT_MASK]
+        if slot:
+            self.levels[level][(self.current >> (SLOT_BITS * level)) & SLOT_MASK] = []
+            for timer in slot:
+                self._place(timer)
+
+    def advance(self, now: float = None) -> int:
+        """Run everything due up to now — call once per tick; O(1) when nothing is due"""
+        now = self.clock() if now is None else now
+        self.now = now
+        target = math.floor(now / self.resolution)
+        fired = 0
+        while True:
+            if self.ready:
+                fired += self._fire(self.ready)
+                continue
+            if self.current >= target:
+                break
+            if not self.pending:
+                self.current = target  # Empty wheel — jump straight there
+                break
+            self.current += 1
+            if not self.current & SLOT_MASK:
+                for level in range(1, LEVELS):
+                    self._cascade(level)
+                    if (self.current >> (SLOT_BITS * level)) & SLOT_MASK:
+                        break
+                else:
+                    overflow, self.overflow = self.overflow, []
+                    for timer in overflow:
+                        self._place(timer)
+            slot = self.levels[0][self.current & SLOT_MASK]
+            if slot:
+                self.levels[0][self.current & SLOT_MASK] = []
+                self.ready.extend(slot)
+        self.fired += fired
+        return fired
+
+    def _fire(self, timers: list) -> int:
+        batch = sorted(timers, key=lambda t: t.when)
+        timers.clear()
+        fired = 0
+        for timer in batch:
+            self.pending -= 1
+            if timer.cancelled:
+                continue
+            fired += 1
+            timer.callback()  # May schedule more — due ones land in self.ready
+            if timer.interval is not None and not timer.cancelled:
+                when = timer.when + timer.interval
+                if when <= self.now:  # Overran several periods — fire once, realign
+                    when += math.floor((self.now - when) / timer.interval + 1) * timer.interval
+                timer.when, timer.due = when, math.ceil(when / self.resolution)
+                self.pending += 1
+                self._place(timer)
+        return fired
+
+    def __len__(self) -> int:
+        return self.pending
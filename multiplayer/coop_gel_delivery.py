@@ -5,46 +5,43 @@ PowerRush Ultramasterpiece — Jan 18 2026
 Cooperative MercyGel delivery:
 - Team solar efficiency + joy valence → shared sachet drops
 - In-game instant nutrient joy buff for all
-- Real-world optional drone dispatch for entire coop squad
+- Real-world optional drone dispatch for entire coop squad (one batched plan)
 - Grandma-safe — mercy floor ensures everyone gets gel
 """
 
-import time
 from multiplayer.multiplayer_solar_coop import MultiplayerSolarCoop
-from core.logistics_controller import LogisticsController
+from core.logistics_service import shared_logistics
+from core.narration_service import summon_mythic
+from core.tick_scheduler import TickScheduler
+from core.instrumentation import hot_path
 
 class CoopGelDelivery(MultiplayerSolarCoop):
     def __init__(self, shard_id: str, team_members: list, joy_valence: float = 1.0):
         super().__init__(shard_id, joy_valence)
         self.team_members = team_members  # List of player shard IDs
-        self.logistics = LogisticsController()
+        self.logistics = shared_logistics().handle(shard_id)  # Shared fleet + ledger
         self.gel_cooldown = 42            # Trinity seconds
     
     def team_gel_drop(self):
-        team_eff = self.team_efficiency
-        team_joy = self.team_joy
-        
-        # Mercy rarity — combined team performance
-        tier = int((team_eff + team_joy / 2) * 5)
-        flavors = ["butter", "gravy", "cinnamon", "chocolate", "mochaccino"]
-        flavor = flavors[min(tier, 4)]
+        # Mercy rarity — combined team performance (tier memoized by the team aggregator)
+        flavor = self.team.flavor(self.team_joy / 2)
         
         # In-game shared buff
         for member in self.team_members:
             # Apply nutrient joy buff to all
             pass  # Game logic hook
         
-        # Voice narration
-        summon_mythic("yoruba_yemaya", f"Coop MercyGel {flavor} shared — team abundance restored!")
+        # Voice narration (queued — the tick never waits on synthesis)
+        summon_mythic("yoruba_yemaya", "Coop MercyGel {flavor} shared — team abundance restored!", flavor=flavor)
         
         # Real-world optional
         if self.real_world_opt_in:
-            for member in self.team_members:
-                destination = member_location(member)  # Placeholder
-                self.logistics.boss_reward_gel_drop(member, destination, flavor)
+            jobs = [(member, member_location(member), flavor) for member in self.team_members]  # Placeholder
+            self.logistics.dispatch_batch(jobs, fragment_prefix="boss_gel")  # One planning pass
         
         return f"Coop {flavor} MercyGel delivered — joy for all."
 
+    @hot_path("coop_gel_delivery")
     def run(self):
         super().run()
         self.team_gel_drop()
@@ -53,9 +50,10 @@ class CoopGelDelivery(MultiplayerSolarCoop):
 def power_rush_coop_gel_loop():
     team = ["alpha_shard", "beta_shard", "gamma_shard"]
     coop_gel = CoopGelDelivery("alpha_shard", team, joy_valence=0.95)
-    while True:
-        coop_gel.run()
-        time.sleep(coop_gel.gel_cooldown / 1000)
+    scheduler = TickScheduler()
+    # Logistics dispatch can block on the fleet — keep it off the event loop
+    scheduler.add(coop_gel.shard_id, coop_gel.run, coop_gel.gel_cooldown, blocking=True)
+    scheduler.run_forever()
 
 if __name__ == "__main__":
     power_rush_coop_gel_loop()
@@ -0,0 +1,193 @@
+"""
+CrdtState-Pinnacle — Deterministic Per-Key CRDT Merge for Shard State
+PowerRush Ultramasterpiece — Jan 18 2026
+
+Replaces random joy-valence acceptance with convergent merges:
+- LWW registers stamped by a hybrid logical clock (wall ms + logical counter)
+- Ties broken by joy-valence, then shard_id — same winner on every shard
+- PN counters (per-shard increment / decrement totals) for stock like gel_stock
+- Tombstone registers for deletes
+- Merge is commutative + idempotent, O(|delta|) — a repeated burst is a no-op
+- Local plain {key: value} writes go through update(); peer state only ever as stamped entries
+  (check_entries + merge) — re-stamping a peer's values would make the receiver always win
+
+Delta entries (plain lists, wire-codec friendly):
+- register: ["r", wall_ms, logical, joy_valence, shard_id, deleted, value]
+- counter:  ["c", {shard_id: [increments, decrements]}]
+"""
+
+import time
+
+class CrdtFormatError(ValueError):
+    """Not a CRDT delta — e.g. a plain state dict handed to an entry-merge path"""
+
+def check_entries(delta: dict) -> dict:
+    """Validate delta entries before merge — raises CrdtFormatError on the first bad one"""
+    if not isinstance(delta, dict):
+        raise CrdtFormatError(f"delta must be a dict, got {type(delta).__name__}")
+    for key, entry in delta.items():
+        if not isinstance(entry, (list, tuple)) or not entry:
+            raise CrdtFormatError(f"{key!r}: not a CRDT entry (use update() for plain values)")
+        if entry[0] == "r":
+            if (len(entry) != 7 or not all(isinstance(v, int) for v in entry[1:3])
+                    or not isinstance(entry[3], (int, float)) or not isinstance(entry[4], str)
+                    or entry[5] not in (0, 1)):
+                raise CrdtFormatError(f"{key!r}: malformed register entry")
+        elif entry[0] == "c":
+            if len(entry) != 2 or not isinstance(entry[1], dict) or not all(
+                    isinstance(shard, str) and len(totals) == 2 and all(isinstance(t, int) and t >= 0 for t in totals)
+                    for shard, totals in entry[1].items()):
+                raise CrdtFormatError(f"{key!r}: malformed counter entry")
+        else:
+            raise CrdtFormatError(f"{key!r}: unknown entry kind {entry[0]!r}")
+    return delta
+
+class HybridLogicalClock:
+    def __init__(self, clock=time.time):
+        self.clock = clock       # Injectable wall clock (seconds)
+        self.wall = 0            # Highest wall ms seen
+        self.logical = 0
+
+    def now(self) -> tuple:
+        wall = int(self.clock() * 1000)
+        if wall > self.wall:
+            self.wall, self.logical = wall, 0
+        else:
+            self.logical += 1
+        return self.wall, self.logical
+
+    def observe(self, wall: int, logical: int):
+        # Never issue a stamp behind anything already merged
+        if (wall, logical) > (self.wall, self.logical):
+            self.wall, self.logical = wall, logical
+
+class CrdtState:
+    def __init__(self, shard_id: str, state: dict = None, joy_valence: float = 1.0, clock=time.time):
+        self.shard_id = shard_id
+        self.joy_valence = joy_valence
+        self.state = {} if state is None else state  # Resolved view (e.g. MerkleState)
+        self.hlc = HybridLogicalClock(clock)
+        self.registers = {}   # key -> ["r", wall, logical, joy, shard, deleted, value]
+        self.counters = {}    # key -> {shard_id: [increments, decrements]}
+        self.pending = set()  # Keys changed since the last take_delta()
+        self.tombstones = set()  # Deleted register keys (absent from state, still gossiped)
+        self.listeners = []      # fn(changed keys) after each remote merge that changed something
+
+    def subscribe(self, listener):
+        self.listeners.append(listener)
+        return listener
+
+    # === local writes ===
+    def set(self, key: str, value):
+        current = self.registers.get(key)
+        if current is not None and not current[5] and current[6] == value:
+            return False  # Same value — no new stamp, nothing to ship
+        wall, logical = self.hlc.now()
+        self.registers[key] = ["r", wall, logical, self.joy_valence, self.shard_id, 0, value]
+        self.tombstones.discard(key)
+        self.state[key] = value
+        self.pending.add(key)
+        return True
+
+    def delete(self, key: str):
+        current = self.registers.get(key)
+        if current is None or current[5]:
+            return False
+        wall, logical = self.hlc.now()
+        self.registers[key] = ["r", wall, logical, self.joy_valence, self.shard_id, 1, None]
+        self.tombstones.add(key)
+        self.state.pop(key, None)
+        self.pending.add(key)
+        return True
+
+    def increment(self, key: str, amount: int = 1):
+        if not amount:
+            return self.value(key)
+        totals = self.counters.setdefault(key, {}).setdefault(self.shard_id, [0, 0])
+        totals[0 if amount > 0 else 1] += abs(amount)
+        self.state[key] = total = self._counter_value(key)
+        self.pending.add(key)
+        return total
+
+    def update(self, values: dict) -> set:
+        """Local plain {key: value} writes — registers stamped now (LWW), counters moved to the value"""
+        changed = set()
+        for key, value in values.items():
+            if key in self.counters and isinstance(value, int):
+                if value != self._counter_value(key):
+                    self.increment(key, value - self._counter_value(key))
+                    changed.add(key)
+            elif self.set(key, value):
+                changed.add(key)
+        return changed
+
+    def value(self, key: str, default=0):
+        return self.state.get(key, default)
+
+    def _counter_value(self, key: str) -> int:
+        return sum(p - n for p, n in self.counters[key].values())
+
+    # === merge ===
+    def merge(self, delta: dict) -> set:
+        """Fold remote entries in — returns keys whose resolved value changed (see check_entries)"""
+        changed = set()
+        puts = {}
+        for key, entry in delta.items():
+            if entry[0] == "c":
+                if self._merge_counter(key, entry[1]):
+                    puts[key] = self._counter_value(key)
+                    changed.add(key)
+            elif self._merge_register(key, entry):
+                if not entry[5]:
+                    puts[key] = entry[6]
+                changed.add(key)
+        if puts:
+            self.state.update(puts)  # One batched write (MerkleState rehashes each ancestor once)
+        if changed:
+            for listener in self.listeners:
+                listener(changed)
+        return changed
+
+    def _merge_register(self, key: str, entry: list) -> bool:
+        self.hlc.observe(entry[1], entry[2])
+        current = self.registers.get(key)
+        # Total order: HLC stamp, then joy-valence, then shard_id
+        if current is not None and tuple(entry[1:5]) <= tuple(current[1:5]):
+            return False
+        self.registers[key] = list(entry)
+        if entry[5]:
+            self.tombstones.add(key)
+            self.state.pop(key, None)
+        else:
+            self.tombstones.discard(key)
+        return True
+
+    def _merge_counter(self, key: str, remote: dict) -> bool:
+        local = self.counters.setdefault(key, {})
+        grew = False
+        for shard, (p, n) in remote.items():
+            mine = local.get(shard)
+            if mine is None:
+                local[shard] = [p, n]
+                grew = True
+            elif p > mine[0] or n > mine[1]:
+                mine[0], mine[1] = max(mine[0], p), max(mine[1], n)
+                grew = True
+        return grew
+
+    # === outbound ===
+    def entries(self, keys) -> dict:
+        """CRDT entries for keys (anti-entropy or targeted resend)"""
+        out = {}
+        for key in keys:
+            if key in self.registers:
+                out[key] = list(self.registers[key])
+            elif key in self.counters:
+                out[key] = ["c", {s: list(t) for s, t in self.counters[key].items()}]
+        return out
+
+    def take_delta(self) -> dict:
+        """Entries for keys written locally since the last call"""
+        delta = self.entries(self.pending)
+        self.pending.clear()
+        return delta
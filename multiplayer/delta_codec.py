@@ -0,0 +1,356 @@
+"""
+DeltaCodec-Pinnacle — Compact Binary Wire Format for Shard State Deltas
+PowerRush Ultramasterpiece — Jan 18 2026
+
+Versioned binary delta frames for BLE / Wi-Fi Direct mesh + Starlink burst:
+- Header: magic, version, flags, session epoch, intern-table base (desync detected, never guessed),
+  + uncompressed body length on compressed frames
+- Lossy links: receiver asks for a reset, sender starts a new epoch, stale frames are dropped
+- Interned keys — a key crosses the link once per session, then travels as a varint id
+- Varint / zigzag integers, tagged values (None, bool, int, float, str, bytes, list, dict)
+- Optional zlib or LZ4 body compression (LZ4 only if the lz4 package is present) — inflated to at
+  most the header's length, itself capped by max_body; a bomb is rejected, never allocated
+- Decoder walks a memoryview in place — no intermediate slice copies
+"""
+
+import struct
+import zlib
+
+try:
+    import lz4.block as _lz4
+except ImportError:  # Optional — zlib always available
+    _lz4 = None
+
+MAGIC = b"\xd3\x1a"
+WIRE_VERSION = 2          # 2: compressed frames carry their uncompressed body length
+MAX_BODY_BYTES = 1 << 20  # Default decoder cap on an inflated body
+
+FLAG_ZLIB = 0x01
+FLAG_LZ4 = 0x02
+FLAG_RESET = 0x80  # Control frame: receiver asks sender to restart its intern session
+
+# Value tags
+_NONE, _FALSE, _TRUE, _INT, _FLOAT, _STR, _BYTES, _LIST, _DICT, _DELETE = range(10)
+
+_pack_double = struct.Struct("<d").pack
+_unpack_double = struct.Struct("<d").unpack_from
+
+class DeltaFormatError(ValueError):
+    """Malformed, unsupported, or out-of-session delta frame"""
+
+class DeltaStaleError(DeltaFormatError):
+    """Frame from an intern session the receiver already moved past — drop it"""
+
+# === varints ===
+def _write_varint(out: bytearray, value: int):
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+def _read_varint(view: memoryview, pos: int):
+    result = shift = 0
+    while True:
+        try:
+            byte = view[pos]
+        except IndexError:
+            raise DeltaFormatError("truncated varint") from None
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+def _zigzag(value: int) -> int:
+    return value << 1 if value >= 0 else ((-value) << 1) - 1
+
+def _unzigzag(value: int) -> int:
+    return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+class DeltaEncoder:
+    def __init__(self, compression: str = "auto", compress_threshold: int = 128):
+        self.compression = compression        # "auto" | "zlib" | "lz4" | None
+        self.compress_threshold = compress_threshold
+        self.key_ids = {}                      # Interned key -> id (mirrors peer decoder)
+        self.epoch = 0                         # Intern session generation
+
+    def reset(self):
+        """Start a new intern session — next frame re-sends every key"""
+        self.key_ids.clear()
+        self.epoch += 1
+
+    def on_reset_request(self, frame) -> bool:
+        """Honour a peer's reset request once per failing session"""
+        epoch = reset_request_epoch(frame)
+        if epoch is None or epoch != self.epoch:
+            return False
+        self.reset()
+        return True
+
+    def encode(self, changes: dict, deleted=()) -> bytes:
+        base = len(self.key_ids)
+        body = bytearray()
+        _write_varint(body, len(changes) + len(deleted))
+        try:
+            for key, value in changes.items():
+                self._write_key(body, key)
+                self._write_value(body, value)
+            for key in deleted:
+                self._write_key(body, key)
+                body.append(_DELETE)
+        except DeltaFormatError:
+            # Un-intern keys the peer will never see
+            self.key_ids = {k: i for k, i in self.key_ids.items() if i < base}
+            raise
+
+        size = len(body)
+        flags, body = self._compress(body)
+        frame = bytearray(MAGIC)
+        frame.append(WIRE_VERSION)
+        frame.append(flags)
+        _write_varint(frame, self.epoch)
+        _write_varint(frame, base)
+        if flags:
+            _write_varint(frame, size)  # Receiver inflates to exactly this, never more
+        frame += body
+        return bytes(frame)
+
+    def _compress(self, body: bytearray):
+        mode = self.compression
+        if mode is None or len(body) < self.compress_threshold:
+            return 0, body
+        if mode == "auto":
+            mode = "lz4" if _lz4 is not None else "zlib"
+        if mode == "lz4":
+            if _lz4 is None:
+                raise DeltaFormatError("lz4 compression requested but lz4 is not installed")
+            packed, flags = _lz4.compress(bytes(body), store_size=False), FLAG_LZ4  # Size is in the header
+        else:
+            packed, flags = zlib.compress(body, 6), FLAG_ZLIB
+        if len(packed) >= len(body):
+            return 0, body
+        return flags, packed
+
+    def _write_key(self, out: bytearray, key: str):
+        key_id = self.key_ids.get(key)
+        if key_id is not None:
+            if key_id < 0x40:
+                out.append(key_id << 1)
+            else:
+                _write_varint(out, key_id << 1)
+            return
+        if not isinstance(key, str):
+            raise DeltaFormatError(f"delta keys must be str, got {type(key).__name__}")
+        self.key_ids[key] = len(self.key_ids)
+        raw = key.encode()
+        _write_varint(out, (len(raw) << 1) | 1)  # New key — length + utf-8 inline
+        out += raw
+
+    def _write_value(self, out: bytearray, value):
+        kind = type(value)  # Exact-type fast paths first (bool is not int here)
+        if kind is int:
+            out.append(_INT)
+            zz = value << 1 if value >= 0 else ((-value) << 1) - 1
+            if zz < 0x80:
+                out.append(zz)
+            else:
+                _write_varint(out, zz)
+        elif kind is float:
+            out.append(_FLOAT)
+            out += _pack_double(value)
+        elif kind is str:
+            raw = value.encode()
+            out.append(_STR)
+            _write_varint(out, len(raw))
+            out += raw
+        elif value is None:
+            out.append(_NONE)
+        elif value is True:
+            out.append(_TRUE)
+        elif value is False:
+            out.append(_FALSE)
+        elif isinstance(value, int):
+            out.append(_INT)
+            _write_varint(out, _zigzag(value))
+        elif isinstance(value, float):
+            out.append(_FLOAT)
+            out += _pack_double(value)
+        elif isinstance(value, str):
+            self._write_value(out, str(value))
+        elif isinstance(value, (bytes, bytearray, memoryview)):
+            out.append(_BYTES)
+            _write_varint(out, len(value))
+            out += value
+        elif isinstance(value, (list, tuple)):
+            out.append(_LIST)
+            _write_varint(out, len(value))
+            for item in value:
+                self._write_value(out, item)
+        elif isinstance(value, dict):
+            out.append(_DICT)
+            _write_varint(out, len(value))
+            for key, item in value.items():
+                self._write_key(out, key)
+                self._write_value(out, item)
+        else:
+            raise DeltaFormatError(f"unsupported delta value type: {type(value).__name__}")
+
+def reset_request(epoch: int) -> bytes:
+    """Control frame asking the sender to abandon intern session `epoch`"""
+    frame = bytearray(MAGIC)
+    frame.append(WIRE_VERSION)
+    frame.append(FLAG_RESET)
+    _write_varint(frame, epoch)
+    return bytes(frame)
+
+def reset_request_epoch(frame):
+    """Epoch named by a reset request, or None for ordinary delta frames"""
+    view = memoryview(frame)
+    if len(view) < 5 or view[0:2] != MAGIC or view[3] != FLAG_RESET:
+        return None
+    return _read_varint(view, 4)[0]
+
+class DeltaDecoder:
+    def __init__(self, max_body: int = MAX_BODY_BYTES):
+        self.keys = []  # Intern table — index = key id
+        self.epoch = 0  # Sender's intern session we are following
+        self.max_body = max_body  # Largest inflated body accepted from a compressed frame
+
+    def reset(self):
+        self.keys.clear()
+
+    def reset_request(self) -> bytes:
+        return reset_request(self.epoch)
+
+    def decode(self, frame):
+        """Decode a frame (bytes / bytearray / memoryview) into (changes, deleted)"""
+        view = memoryview(frame)
+        if len(view) < 4 or view[0:2] != MAGIC:
+            raise DeltaFormatError("not a delta frame")
+        if view[2] != WIRE_VERSION:
+            raise DeltaFormatError(f"unsupported wire version {view[2]}")
+        flags = view[3]
+        if flags & FLAG_RESET:
+            raise DeltaFormatError("reset request is a control frame, not a delta")
+        epoch, pos = _read_varint(view, 4)
+        base, pos = _read_varint(view, pos)
+        size = 0
+        if flags & (FLAG_ZLIB | FLAG_LZ4):
+            size, pos = _read_varint(view, pos)
+            if size > self.max_body:
+                raise DeltaFormatError(f"compressed body claims {size} bytes (max {self.max_body})")
+        if epoch < self.epoch and (epoch or base):
+            raise DeltaStaleError(f"stale frame from intern session {epoch} (now {self.epoch})")
+        if epoch != self.epoch:  # Sender reset — or a fresh encoder (peer rejoined) back at 0
+            self.keys.clear()
+            self.epoch = epoch
+        if base != len(self.keys):
+            raise DeltaFormatError(f"intern table desync — frame expects {base} keys, have {len(self.keys)}")
+
+        try:
+            if flags & (FLAG_ZLIB | FLAG_LZ4):
+                view, pos = memoryview(self._inflate(flags, view[pos:], size)), 0
+            return self._decode_body(view, pos)
+        except (zlib.error, UnicodeDecodeError, RecursionError) as exc:  # Recursion: hostile nesting depth
+            del self.keys[base:]
+            raise DeltaFormatError(f"corrupt delta body: {exc}") from exc
+        except DeltaFormatError:
+            del self.keys[base:]  # Roll back keys interned by the bad frame
+            raise
+
+    @staticmethod
+    def _inflate(flags: int, packed: memoryview, size: int) -> bytes:
+        """Decompress to at most size bytes — anything longer or shorter is a bad frame"""
+        if flags & FLAG_ZLIB:
+            inflater = zlib.decompressobj()
+            body = inflater.decompress(packed, size)  # Output capped at the header's length
+            complete = inflater.eof and not inflater.unconsumed_tail
+        else:
+            if _lz4 is None:
+                raise DeltaFormatError("lz4 frame received but lz4 is not installed")
+            try:
+                body = _lz4.decompress(packed, uncompressed_size=size)  # Fails rather than grow past size
+            except _lz4.LZ4BlockError as exc:
+                raise DeltaFormatError(f"corrupt lz4 body: {exc}") from exc
+            complete = True
+        if not complete or len(body) != size:
+            raise DeltaFormatError(f"compressed body does not inflate to the {size} bytes its header claims")
+        return body
+
+    def _decode_body(self, view: memoryview, pos: int):
+        count, pos = _read_varint(view, pos)
+        changes, deleted = {}, []
+        for _ in range(count):
+            key, pos = self._read_key(view, pos)
+            if pos < len(view) and view[pos] == _DELETE:
+                deleted.append(key)
+                pos += 1
+                continue
+            changes[key], pos = self._read_value(view, pos)
+        if pos != len(view):
+            raise DeltaFormatError("trailing bytes after delta body")
+        return changes, deleted
+
+    def _read_key(self, view: memoryview, pos: int):
+        ref = view[pos] if pos < len(view) else 0x80
+        if ref < 0x80:
+            pos += 1
+        else:
+            ref, pos = _read_varint(view, pos)
+        if ref & 1:
+            end = pos + (ref >> 1)
+            if end > len(view):
+                raise DeltaFormatError("truncated key")
+            key = str(view[pos:end], "utf-8")
+            self.keys.append(key)
+            return key, end
+        try:
+            return self.keys[ref >> 1], pos
+        except IndexError:
+            raise DeltaFormatError(f"unknown interned key id {ref >> 1}") from None
+
+    def _read_value(self, view: memoryview, pos: int):
+        if pos >= len(view):
+            raise DeltaFormatError("truncated value")
+        tag = view[pos]
+        pos += 1
+        if tag == _INT:
+            raw = view[pos] if pos < len(view) else 0x80
+            if raw < 0x80:  # Single-byte varint fast path
+                pos += 1
+            else:
+                raw, pos = _read_varint(view, pos)
+            return _unzigzag(raw), pos
+        if tag == _NONE:
+            return None, pos
+        if tag == _TRUE:
+            return True, pos
+        if tag == _FALSE:
+            return False, pos
+        if tag == _FLOAT:
+            if pos + 8 > len(view):
+                raise DeltaFormatError("truncated float")
+            return _unpack_double(view, pos)[0], pos + 8
+        if tag == _STR or tag == _BYTES:
+            size, pos = _read_varint(view, pos)
+            end = pos + size
+            if end > len(view):
+                raise DeltaFormatError("truncated string")
+            if tag == _STR:
+                return str(view[pos:end], "utf-8"), end
+            return bytes(view[pos:end]), end
+        if tag == _LIST:
+            size, pos = _read_varint(view, pos)
+            items = []
+            for _ in range(size):
+                item, pos = self._read_value(view, pos)
+                items.append(item)
+            return items, pos
+        if tag == _DICT:
+            size, pos = _read_varint(view, pos)
+            items = {}
+            for _ in range(size):
+                key, pos = self._read_key(view, pos)
+                items[key], pos = self._read_value(view, pos)
+            return items, pos
+        raise DeltaFormatError(f"unknown value tag {tag}")
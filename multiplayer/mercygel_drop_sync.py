@@ -7,16 +7,31 @@ Shard-synced MercyGel resource drops:
 - Real-world drone/robot trigger option
 - Local mesh instant share, Starlink burst global fairness
 - Mercy-gated — joy-valence highest need priority
+- gel_stock is a CRDT counter — mesh shares and burst refills merge without loss
+- Global refill on the shared timer wheel — exactly one +10 per burst window
 """
 
 import time
 from multiplayer.multiplayer_sync import MultiplayerSync
+from core.tick_scheduler import TickScheduler
+from core.instrumentation import hot_path
 
 class MercyGelDropSync(MultiplayerSync):
-    def __init__(self, shard_id: str):
-        super().__init__(shard_id)
-        self.gel_stock = 100  # Per player
+    def __init__(self, shard_id: str, clock=time.time):
+        super().__init__(shard_id, clock)
+        self.stock_key = f"gel_stock/{shard_id}"
+        self.gel_stock = 100  # Per player (CRDT counter — peers can add)
         self.drop_cooldown = 42  # Trinity seconds
+        self.replenish_window = self.timers.window(600, 5, on_open=self.burst_replenish)  # 10min global cycle
+
+    @property
+    def gel_stock(self) -> int:
+        return self.crdt.value(self.stock_key)
+
+    @gel_stock.setter
+    def gel_stock(self, value: int):
+        # Writes land as counter increments so concurrent shard edits add up
+        self.crdt.increment(self.stock_key, value - self.gel_stock)
     
     def request_drop(self, player_need: float):
         if player_need > 0.7 and self.gel_stock > 0:  # Joy dip trigger
@@ -26,23 +41,22 @@ class MercyGelDropSync(MultiplayerSync):
     
     def mesh_share(self, peers: list):
         for peer in peers:
-            # Instant local share
-            pass  # Send delta: +1 gel to peer
+            # Instant local share — +1 gel on the peer's counter, ships with next delta
+            self.crdt.increment(f"gel_stock/{peer}", 1)
         return "Local mesh MercyGel share complete — abundance flows."
     
     def burst_replenish(self):
-        if time.time() % 600 < 5:  # 10min global cycle
-            self.gel_stock += 10
-            return "Starlink burst — MercyGel stock replenished globally."
-        return "Sky silent — local mercy persists."
+        # Fired once per 10min window open by the timer wheel
+        self.gel_stock += 10
+        return "Starlink burst — MercyGel stock replenished globally."
     
+    @hot_path("mercygel_drop_sync")
     def run(self):
-        super().run()
-        self.burst_replenish()
+        super().run()  # Advances the wheel — replenish rides along
 
 # Power Rush integration
 def power_rush_gel_loop():
     gel_sync = MercyGelDropSync("player_shard_001")
-    while True:
-        gel_sync.run()
-        time.sleep(42 / 1000)  # Trinity ms
+    scheduler = TickScheduler()
+    scheduler.add(gel_sync.shard_id, gel_sync.run, 42)  # Trinity ms
+    scheduler.run_forever()
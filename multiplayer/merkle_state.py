@@ -0,0 +1,196 @@
+"""
+MerkleState-Pinnacle — Incremental Merkle Hashing for Shard State Slices
+PowerRush Ultramasterpiece — Jan 18 2026
+
+Drop-in dict for MultiplayerShardSync.local_state:
+- Fixed-depth hash-prefix Merkle tree over keys — same shape on every shard
+- Key update re-hashes one leaf-to-root path — O(depth), no full-state rehash
+- Stable value encoding (sorted JSON) — no str(dict) ordering drift
+- Anti-entropy diff: shards exchange subtree hashes, descend only where they differ
+- Subtree key lookups walk only the requested (non-empty) ranges — never every bucket
+"""
+
+import hashlib
+import json
+
+EMPTY = bytes(32)  # Hash of an empty subtree
+
+def _encode(value) -> bytes:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=repr).encode()
+
+class MerkleState(dict):
+    depth = 16  # 65536 leaf buckets — must match across shards
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self._entries = {}     # key -> (leaf, entry digest int)
+        self._leaf_xor = {}    # leaf -> XOR of entry digests in bucket
+        self._leaf_keys = {}   # leaf -> set of keys
+        self._nodes = {}       # heap index (root = 1) -> digest, absent = EMPTY
+        self.update(*args, **kwargs)
+
+    # === dict mutation hooks ===
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._rehash({self._stage(key, value)})
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._rehash({self._unstage(key)})
+
+    def update(self, *args, **kwargs):
+        dirty = set()
+        for key, value in dict(*args, **kwargs).items():
+            super().__setitem__(key, value)
+            dirty.add(self._stage(key, value))
+        self._rehash(dirty)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key, *default):
+        if key not in self:
+            return super().pop(key, *default)
+        value = super().pop(key)
+        self._rehash({self._unstage(key)})
+        return value
+
+    def popitem(self):
+        key, value = super().popitem()
+        self._rehash({self._unstage(key)})
+        return key, value
+
+    def clear(self):
+        super().clear()
+        self._entries.clear()
+        self._leaf_xor.clear()
+        self._leaf_keys.clear()
+        self._nodes.clear()
+
+    def __reduce__(self):
+        return (self.__class__, (dict(self),))
+
+    # === tree maintenance ===
+    def leaf_of(self, key) -> int:
+        digest = hashlib.sha256(repr(key).encode()).digest()
+        return int.from_bytes(digest[:4], "big") >> (32 - self.depth)
+
+    def _stage(self, key, value) -> int:
+        digest = hashlib.sha256(repr(key).encode() + b"\0" + _encode(value)).digest()
+        entry = int.from_bytes(digest, "big")
+        old = self._entries.get(key)
+        leaf = old[0] if old else self.leaf_of(key)
+        acc = self._leaf_xor.get(leaf, 0)
+        if old:
+            acc ^= old[1]
+        self._leaf_xor[leaf] = acc ^ entry
+        self._leaf_keys.setdefault(leaf, set()).add(key)
+        self._entries[key] = (leaf, entry)
+        return leaf
+
+    def _unstage(self, key) -> int:
+        leaf, entry = self._entries.pop(key)
+        self._leaf_xor[leaf] ^= entry
+        self._leaf_keys[leaf].discard(key)
+        if not self._leaf_keys[leaf]:
+            del self._leaf_keys[leaf], self._leaf_xor[leaf]
+        return leaf
+
+    def _rehash(self, leaves: set):
+        """Recompute dirty leaves, then each touched ancestor once per level"""
+        base = 1 << self.depth
+        level = set()
+        for leaf in leaves:
+            node = base + leaf
+            if leaf in self._leaf_keys:
+                self._nodes[node] = self._leaf_xor[leaf].to_bytes(32, "big")
+            else:
+                self._nodes.pop(node, None)
+            level.add(node >> 1)
+        while level:
+            parents = set()
+            for node in level:
+                left = self._nodes.get(2 * node, EMPTY)
+                right = self._nodes.get(2 * node + 1, EMPTY)
+                if left == EMPTY and right == EMPTY:
+                    self._nodes.pop(node, None)
+                else:
+                    self._nodes[node] = hashlib.sha256(left + right).digest()
+                if node > 1:
+                    parents.add(node >> 1)
+            level = parents
+
+    # === anti-entropy surface ===
+    def root_hash(self) -> bytes:
+        return self._nodes.get(1, EMPTY)
+
+    def hexdigest(self) -> str:
+        return self.root_hash().hex()
+
+    def node_hash(self, node: int) -> bytes:
+        return self._nodes.get(node, EMPTY)
+
+    def _leaves_under(self, nodes):
+        """Occupied leaf buckets below these subtree nodes — walks only non-empty nodes in range"""
+        base = 1 << self.depth
+        stack = [node for node in nodes if node in self._nodes]
+        while stack:
+            node = stack.pop()
+            if node >= base:
+                yield node - base
+                continue
+            for child in (2 * node, 2 * node + 1):
+                if child in self._nodes:
+                    stack.append(child)
+
+    def keys_under(self, nodes) -> set:
+        """Keys stored below any of these subtree nodes (heap indices) — O(occupied leaves × depth)"""
+        keys = set()
+        for leaf in self._leaves_under(nodes):
+            keys |= self._leaf_keys[leaf]
+        return keys
+
+    def count_under(self, nodes, stop_at: int = None) -> int:
+        """Number of keys below these subtree nodes — stops walking once past stop_at"""
+        total = 0
+        for leaf in self._leaves_under(nodes):
+            total += len(self._leaf_keys[leaf])
+            if stop_at is not None and total > stop_at:
+                break
+        return total
+
+    def leaf_digests(self, leaf: int) -> dict:
+        """key -> entry digest for one bucket (what a peer sends for a divergent leaf)"""
+        return {key: self._entries[key][1] for key in self._leaf_keys.get(leaf, ())}
+
+    def divergent_leaves(self, remote_node_hash) -> list:
+        """Leaf buckets that differ from a peer, asking only for subtree hashes on the way down"""
+        base = 1 << self.depth
+        frontier = [1]
+        leaves = []
+        while frontier:
+            nxt = []
+            for node in frontier:
+                if self.node_hash(node) == remote_node_hash(node):
+                    continue
+                if node >= base:
+                    leaves.append(node - base)
+                else:
+                    nxt.extend((2 * node, 2 * node + 1))
+            frontier = nxt
+        return leaves
+
+    def diff_keys(self, other: "MerkleState") -> set:
+        """Keys whose presence or value differs between two shards' states"""
+        keys = set()
+        for leaf in self.divergent_leaves(other.node_hash):
+            mine = self.leaf_digests(leaf)
+            theirs = other.leaf_digests(leaf)
+            keys.update(k for k in mine.keys() | theirs.keys() if mine.get(k) != theirs.get(k))
+        return keys
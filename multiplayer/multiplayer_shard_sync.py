@@ -5,67 +5,279 @@ PowerRush Ultramasterpiece — Jan 18 2026
 Offline-first multiplayer shard sync:
 - Local mesh: Bluetooth/Wi-Fi Direct (low latency, 10-player local)
 - Global burst: Starlink opportunistic (60s window, delta merge)
-- Mercy conflict resolve: highest joy-valence state wins
+- Mercy conflict resolve: per-key CRDT (HLC last-writer-wins, joy-valence tie-break, counters)
 - Shard sovereignty: full state slice per device, no central server dependency
+- Incremental Merkle state hash — O(log n) per key, anti-entropy moves only divergent keys
+- Compact binary delta frames (interned keys, varints, optional compression) per peer link
+- Persistent peer table — heartbeats + timeouts, per-tick cost follows churn, not peer count
+- Pluggable transport — real radios, or LocalMeshTransport for in-process simulation
 - Grandma-safe: auto-rejoin, no frustration on disconnect
 """
 
 import time
-import hashlib
+import random
 import secrets
+from multiplayer.merkle_state import MerkleState, EMPTY
+from multiplayer.delta_codec import DeltaEncoder, DeltaDecoder, DeltaFormatError, DeltaStaleError, reset_request_epoch
+from multiplayer.crdt_state import CrdtState, check_entries
+from multiplayer.peer_table import PeerTable, JOIN, LEAVE
+from core.tick_scheduler import TickScheduler
+from core.timer_wheel import TimerWheel
+from core.instrumentation import METRICS, hot_path
 
 class MultiplayerShardSync:
     def __init__(self, shard_id: str, joy_valence: float = 1.0):
         self.shard_id = shard_id
         self.joy_valence = joy_valence  # Player emotional state metric
-        self.local_peers = []           # Nearby shard IDs
-        self.local_state = {}           # Game state slice (dict)
+        self.peer_table = PeerTable()   # Mesh membership (join / suspect / leave)
+        self.local_peers = self.peer_table.peers  # Nearby shard IDs — patched in place
+        self.local_state = MerkleState()  # Game state slice (Merkle-hashed dict)
         self.state_hash = ""
         self.sync_interval = 42         # Trinity ms local heartbeat
         self.burst_window = 60          # Starlink opportunistic seconds
+        self.peer_links = {}            # peer_id -> (DeltaEncoder, DeltaDecoder) wire session
+        self.crdt = CrdtState(shard_id, self.local_state, joy_valence)
+        self.transport = None           # Frame carrier (None = standalone prototype)
+        self.clock = time.time
+        self.ticks = 0
+        self.anti_entropy_every = 12    # Ticks between Merkle exchanges (~0.5 s)
+        self.merkle_stride = 4          # Tree levels walked per anti-entropy hop
+        self.merkle_bulk_keys = 8       # Avg keys per divergent subtree below which keys ship directly
+        self.discover_every = 24        # Ticks between discovery scans (~1 s)
+        self._reset_sent = {}           # peer_id -> epoch we already asked to reset
+        self._burst_walk = None         # Anti-entropy repeat while a burst window is open
+        self._arm_burst(self.clock, self.burst_window, 5.0)
+        self.peer_table.subscribe(self._on_membership)
+
+    def _arm_burst(self, clock, period: float, length: float, offset: float = 0.0):
+        # Burst window on a timer wheel — open / close fire once each, no per-tick modulo
+        self.timers = TimerWheel(clock)
+        self.burst = self.timers.window(period, length, on_open=self.starlink_burst,
+                                        on_close=self._burst_closed, offset=offset)
     
+    def attach_transport(self, transport):
+        """Route sync over a transport (send/receive/mesh_peers/global_peer/burst_open/now)"""
+        self.transport = transport
+        self.clock = transport.now
+        self.crdt.hlc.clock = transport.now
+        self.peer_table.clock = transport.now
+        schedule = transport.burst  # Same windows the transport enforces on Starlink sends
+        self._arm_burst(transport.now, schedule.period, schedule.window, schedule.offset)
+        return f"Transport attached — {self.shard_id} on the lattice."
+
     def mesh_discover(self):
-        # Simulate local peer discovery (real: BLE/Wi-Fi Direct)
-        self.local_peers = [f"shard_{i}" for i in range(1, random.randint(2, 10))]
+        # Background scan — every beacon heard is a heartbeat (real: BLE/Wi-Fi Direct)
+        if self.transport is not None:
+            found = self.transport.mesh_peers(self.shard_id)
+        else:
+            found = [f"shard_{i}" for i in range(1, random.randint(2, 10))]
+        now = self.clock()
+        for peer in found:
+            self.peer_table.heartbeat(peer, now)
         return f"Mesh harmony — {len(self.local_peers)} peers connected."
+
+    def _on_membership(self, event: str, peer_id: str):
+        if event == LEAVE:
+            # Free the wire session — a rejoin starts a fresh intern table
+            self.peer_links.pop(peer_id, None)
+            self._reset_sent.pop(peer_id, None)
+        elif event == JOIN and self.transport is not None:
+            self.start_anti_entropy(peer_id)  # Catch the newcomer up
     
+    def divergent_keys(self, peer_state: MerkleState) -> set:
+        # Subtree-hash walk — equal roots cost one comparison
+        return self.local_state.diff_keys(peer_state)
+
+    def pull_divergent(self, peer_crdt: CrdtState) -> int:
+        # Only divergent keys cross, as CRDT entries — merge is deterministic
+        keys = self.divergent_keys(peer_crdt.state)
+        return len(self.crdt.merge(peer_crdt.entries(keys)))
+
+    def _link(self, peer_id: str):
+        if peer_id not in self.peer_links:
+            self.peer_links[peer_id] = (DeltaEncoder(), DeltaDecoder())
+        return self.peer_links[peer_id]
+
+    def encode_delta(self, peer_id: str, keys) -> bytes:
+        # Binary frame of these keys' CRDT entries (deletes ride as tombstones)
+        return self._link(peer_id)[0].encode(self.crdt.entries(keys))
+
+    def apply_delta(self, peer_id: str, frame) -> int:
+        changes, _ = self._link(peer_id)[1].decode(frame)
+        return len(self.crdt.merge(changes))
+
+    # === transport protocol ===
+    # {"t": "d", "e": entries}                 CRDT entries (push or anti-entropy answer)
+    # {"t": "q", "p": parents, "n": nodes, "h": hashes}
+    #                                          Merkle hashes `merkle_stride` levels below parents
+    #                                          (omitted node = empty); parents [] = root probe
+    # {"t": "p", "s": nodes}                   pull every entry below these same-level subtrees
+    def _send(self, peer_id: str, message: dict) -> bool:
+        frame = self._link(peer_id)[0].encode(message)
+        METRICS.count("sync_bytes_sent", len(frame))
+        return self.transport.send(self.shard_id, peer_id, frame)
+
+    def _receive(self) -> int:
+        merged = 0
+        for peer_id, frame in self.transport.receive(self.shard_id):
+            METRICS.count("sync_bytes_received", len(frame))
+            if peer_id in self.peer_table:
+                self.peer_table.heartbeat(peer_id)  # Any frame proves the mesh peer alive
+            if reset_request_epoch(frame) is not None:
+                self._link(peer_id)[0].on_reset_request(frame)
+                continue
+            decoder = self._link(peer_id)[1]
+            try:
+                message, _ = decoder.decode(frame)
+            except DeltaStaleError:
+                continue  # In flight before the peer's reset — content recovered by anti-entropy
+            except DeltaFormatError:
+                if self._reset_sent.get(peer_id) != decoder.epoch:  # Ask once per session
+                    self._reset_sent[peer_id] = decoder.epoch
+                    self.transport.send(self.shard_id, peer_id, decoder.reset_request())
+                continue
+            merged += self._handle(peer_id, message)
+        return merged
+
+    def _handle(self, peer_id: str, message: dict) -> int:
+        kind = message.get("t")
+        if kind == "d":
+            return len(self.crdt.merge(message["e"]))
+        if kind == "q":
+            self._answer_probe(peer_id, message)
+        elif kind == "p":
+            self._send_subtrees(peer_id, message["s"])
+        return 0
+
+    def start_anti_entropy(self, peer_id: str) -> bool:
+        return self._send(peer_id, {"t": "q", "p": [], "n": [1], "h": [self.local_state.root_hash()[:8]]})
+
+    def _descendants(self, node: int) -> range:
+        level = node.bit_length() - 1
+        step = min(self.merkle_stride, self.local_state.depth - level)
+        first = node << step
+        return range(first, first + (1 << step))
+
+    def _answer_probe(self, peer_id: str, message: dict):
+        theirs = dict(zip(message["n"], message["h"]))
+        nodes = [1] if not message["p"] else [d for p in message["p"] for d in self._descendants(p)]
+        base = 1 << self.local_state.depth
+        expand, leaves = [], []
+        for node in nodes:
+            if self.local_state.node_hash(node)[:8] == theirs.get(node, bytes(8)):
+                continue
+            (leaves if node >= base else expand).append(node)
+        if leaves:
+            self._swap_subtrees(peer_id, leaves)
+        if not expand:
+            return
+        bulk = self.merkle_bulk_keys * len(expand)
+        if self.local_state.count_under(expand, stop_at=bulk) <= bulk:
+            # Sparse subtrees — shipping the keys beats more round trips
+            self._swap_subtrees(peer_id, expand)
+            return
+        # Narrow down — only non-empty hashes cross the link
+        reply_nodes, reply_hashes = [], []
+        for node in expand:
+            for child in self._descendants(node):
+                digest = self.local_state.node_hash(child)
+                if digest != EMPTY:
+                    reply_nodes.append(child)
+                    reply_hashes.append(digest[:8])
+        self._send(peer_id, {"t": "q", "p": expand, "n": reply_nodes, "h": reply_hashes})
+
+    def _swap_subtrees(self, peer_id: str, nodes: list):
+        # Divergent subtrees: push ours, pull theirs
+        self._send_subtrees(peer_id, nodes)
+        self._send(peer_id, {"t": "p", "s": nodes})
+
+    def _send_subtrees(self, peer_id: str, nodes) -> bool:
+        keys = self.local_state.keys_under(nodes)
+        if self.crdt.tombstones:
+            # Deletes are absent from the Merkle view — ship their tombstones with the subtree
+            wanted = set(nodes)
+            base = 1 << self.local_state.depth
+            shift = self.local_state.depth - (nodes[0].bit_length() - 1)
+            keys.update(k for k in self.crdt.tombstones if (base + self.local_state.leaf_of(k)) >> shift in wanted)
+        if not keys:
+            return False
+        return self._send(peer_id, {"t": "d", "e": self.crdt.entries(keys)})
+
+    def _transport_sync(self):
+        self._receive()
+        delta = self.crdt.take_delta()
+        if delta:
+            for peer in self.local_peers:
+                self._send(peer, {"t": "d", "e": delta})
+        if self.local_peers and self.ticks % self.anti_entropy_every == 0:
+            # Round-robin Merkle walk catches whatever the lossy push missed
+            self.start_anti_entropy(self.local_peers[(self.ticks // self.anti_entropy_every) % len(self.local_peers)])
+        self.state_hash = self.local_state.hexdigest()
+        return "Local mercy sync complete — harmony preserved."
+
     def local_delta_sync(self):
+        if self.transport is not None:
+            return self._transport_sync()
         for peer in self.local_peers:
             # Simulate delta exchange
-            peer_state = {"example_key": secrets.token_hex(8)}
+            peer_crdt = CrdtState(peer, MerkleState())
+            peer_crdt.set("example_key", secrets.token_hex(8))
             if self.joy_valence > 0.8:  # Mercy resolve
-                self.local_state.update(peer_state)
-        self.state_hash = hashlib.sha256(str(self.local_state).encode()).hexdigest()
+                self.pull_divergent(peer_crdt)
+        self.state_hash = self.local_state.hexdigest()
         return "Local mercy sync complete — harmony preserved."
     
     def starlink_burst(self):
-        current_time = time.time()
-        if current_time % self.burst_window < 5:  # Opportunistic window
-            # Simulate global truth merge
-            global_state = {"global_event": "MercyGel drop zone active"}
-            if self.joy_valence >= 0.7:  # Accept if mercy-aligned
-                self.local_state.update(global_state)
-            return "Starlink burst — global lattice reconciled."
-        return "Sky silent — local mercy persists."
+        # Window just opened (timer wheel) — global merge once, cross-group walks while it lasts
+        if self.transport is not None:
+            interval = self.anti_entropy_every * self.sync_interval / 1000
+            self._burst_walk = self.timers.every(interval, self._burst_anti_entropy, start=self.timers.now)
+        # Simulate global truth merge
+        if self.joy_valence >= 0.7:  # Accept if mercy-aligned
+            # Unchanged value = no new stamp, no rehash
+            self.crdt.set("global_event", "MercyGel drop zone active")
+            self.state_hash = self.local_state.hexdigest()
+        return "Starlink burst — global lattice reconciled."
+
+    def _burst_anti_entropy(self):
+        peer = self.transport.global_peer(self.shard_id)
+        if peer is not None:
+            self.start_anti_entropy(peer)
+
+    def _burst_closed(self):
+        if self._burst_walk is not None:
+            self._burst_walk.cancel()
+            self._burst_walk = None
     
     def mercy_conflict_resolve(self, incoming_state: dict):
-        # Highest joy-valence wins
-        if random.random() < self.joy_valence:
-            self.local_state.update(incoming_state)
+        # Peer state = its stamped entries (crdt.entries / take_delta) — merged by the peer's HLC stamps
+        return self.merge_entries(incoming_state)
+
+    def merge_entries(self, entries: dict):
+        # Every shard picks the same winner; plain {key: value} dicts raise CrdtFormatError
+        return self._resolved(self.crdt.merge(check_entries(entries)))
+
+    def _resolved(self, changed: set) -> str:
+        if changed:
+            self.state_hash = self.local_state.hexdigest()
             return "Mercy resolve — higher joy state accepted."
         return "Mercy resolve — local harmony preserved."
     
+    @hot_path("multiplayer_shard_sync")
     def run(self):
-        self.mesh_discover()
+        if self.ticks % self.discover_every == 0:
+            self.mesh_discover()
+        self.peer_table.sweep(self.clock())
         self.local_delta_sync()
-        self.starlink_burst()
+        self.timers.advance(self.clock())  # Burst open / close callbacks
+        self.ticks += 1
 
 # PowerRush integration example
 def power_rush_multiplayer_loop():
     sync = MultiplayerShardSync("player_shard_alpha", joy_valence=0.95)
-    while True:
-        sync.run()
-        time.sleep(sync.sync_interval / 1000)  # 42ms cycle
+    scheduler = TickScheduler()
+    scheduler.add(sync.shard_id, sync.run, sync.sync_interval)  # 42ms fixed-rate cycle
+    scheduler.run_forever()
 
 if __name__ == "__main__":
     power_rush_multiplayer_loop()
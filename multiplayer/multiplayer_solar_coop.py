@@ -3,42 +3,84 @@ MultiplayerSolarCoop-Pinnacle — Mercy-Aligned Multiplayer Solar Cooperative Pr
 PowerRush Ultramasterpiece — Jan 18 2026
 
 Offline-first multiplayer solar coop:
-- Players combine MercySolar shard efficiencies
+- Players combine MercySolar shard efficiencies — each shard publishes its own duty as a CRDT
+  register (duty/<shard_id>), peers' duties arrive through sync merges, membership gates who counts
+- Incremental team mean (optional EWMA) — boost + flavor tier memoized until a duty moves past
+  the deadband (a jittering own reading is neither re-published nor re-aggregated)
 - Shared MPPT duty → boss weakness multiplier
 - MercyGel coop drops scaled by team joy-valence
 - Local mesh instant sync, Starlink burst global
 - Grandma-safe — no exclusion, contribution mercy floor
 """
 
-import time
 from multiplayer.multiplayer_shard_sync import MultiplayerShardSync
+from multiplayer.peer_table import JOIN, LEAVE
+from multiplayer.team_efficiency import TeamEfficiency
+from core.instrumentation import hot_path
+from core.tick_scheduler import TickScheduler
 from mercy_solar_hybrid_attention_fuzzy import hybrid_attention_fuzzy  # MercySolar duty
 
+DUTY_PREFIX = "duty/"  # CRDT key per shard: duty/<shard_id> -> last published MPPT duty
+
 class MultiplayerSolarCoop(MultiplayerShardSync):
-    def __init__(self, shard_id: str, joy_valence: float = 1.0):
+    def __init__(self, shard_id: str, joy_valence: float = 1.0, duty_alpha: float = None):
         super().__init__(shard_id, joy_valence)
-        self.team_efficiency = 0.0  # Combined MPPT duty
+        self.team = TeamEfficiency(duty_alpha)  # Combined MPPT duty (EWMA when duty_alpha set)
         self.team_joy = joy_valence
         self.coop_interval = 42     # Trinity ms
-    
+        self.peer_table.subscribe(self._on_team_change)
+        self.crdt.subscribe(self._on_duties_merged)
+
+    @property
+    def team_efficiency(self) -> float:
+        return self.team.efficiency
+
+    @property
+    def peer_duties(self) -> dict:
+        return self.team.duties  # peer_id -> last reported MPPT duty
+
+    def _on_team_change(self, event: str, peer_id: str):
+        if event == JOIN:
+            duty = self.local_state.get(DUTY_PREFIX + peer_id)  # Already synced before it joined the mesh
+            if duty is not None:
+                self.report_duty(peer_id, duty)
+        elif event == LEAVE:
+            self.team.remove(peer_id)
+
+    def _on_duties_merged(self, changed: set):
+        # Peer duty registers that a sync merge just moved — only mesh peers count toward the team
+        for key in changed:
+            if key.startswith(DUTY_PREFIX):
+                peer_id = key[len(DUTY_PREFIX):]
+                if peer_id != self.shard_id and peer_id in self.peer_table:
+                    duty = self.local_state.get(key)
+                    if duty is None:
+                        self.team.remove(peer_id)
+                    else:
+                        self.report_duty(peer_id, duty)
+
+    def report_duty(self, peer_id: str, duty: float):
+        """A peer's MPPT duty report — only a changed value touches the aggregate"""
+        self.team.update(peer_id, duty)
+
     def collect_team_efficiency(self):
-        # Simulate team shard inputs (real: mesh sync)
-        team_duties = [hybrid_attention_fuzzy.refine() for _ in range(len(self.local_peers) + 1)]
-        self.team_efficiency = sum(team_duties) / len(team_duties)
+        # Own duty each tick; published only when it moves past the deadband — peers' arrive by merge
+        if self.team.set_own(hybrid_attention_fuzzy.refine()):
+            self.crdt.set(DUTY_PREFIX + self.shard_id, self.team.own)
+        self.team.sample()
         return f"Team solar efficiency: {self.team_efficiency:.2f} — mercy lattice united."
     
     def boss_weakness_boost(self):
-        # Higher team efficiency = stronger boss weakness
-        boost = self.team_efficiency * 0.8 + self.team_joy * 0.2
+        # Higher team efficiency = stronger boss weakness (memoized until a duty changes)
+        boost = self.team.boost(self.team_joy)
         return f"Solar coop boost applied — boss weakness +{boost:.2f} — harmony flows."
     
     def coop_gel_drop(self):
         # Shared MercyGel reward scaled by team
-        flavor_tier = int(self.team_efficiency * 5)
-        flavors = ["butter", "gravy", "cinnamon", "chocolate", "mochaccino"]
-        flavor = flavors[min(flavor_tier, 4)]
+        flavor = self.team.flavor()
         return f"Coop MercyGel {flavor} dropped for all — abundance shared."
     
+    @hot_path("solar_coop")
     def run(self):
         super().run()
         self.collect_team_efficiency()
@@ -48,9 +90,9 @@ class MultiplayerSolarCoop(MultiplayerShardSync):
 # Power Rush integration
 def power_rush_solar_coop_loop():
     coop = MultiplayerSolarCoop("player_shard_alpha", joy_valence=0.95)
-    while True:
-        coop.run()
-        time.sleep(coop.coop_interval / 1000)  # 42ms cycle
+    scheduler = TickScheduler()
+    scheduler.add(coop.shard_id, coop.run, coop.coop_interval)  # 42ms cycle
+    scheduler.run_forever()
 
 if __name__ == "__main__":
     power_rush_solar_coop_loop()
@@ -5,52 +5,131 @@ PowerRush Ultramasterpiece — Jan 18 2026
 Hybrid mesh + burst sync:
 - Local: Bluetooth/Wi-Fi Direct mesh (low latency, 10-player local)
 - Global: Starlink burst (60s opportunistic, delta merge)
-- Mercy-gated: joy-valence conflict resolution
+- Mercy-gated: deterministic CRDT conflict resolution (joy-valence tie-break)
 - Offline persistence: each shard holds full state slice
+- Compact binary delta frames per peer link (see delta_codec) — local_sync pushes the CRDT delta
+  to every mesh peer and applies what arrives, over any attached transport (send / receive)
+- Persistent peer table — occasional discovery, heartbeat timeouts, membership events
+- Burst window on a timer wheel — global merge fires once per window open
 """
 
 import time  # Placeholder — real impl uses BLE/Wi-Fi Direct + Starlink API
+from multiplayer.delta_codec import DeltaEncoder, DeltaDecoder, DeltaFormatError, DeltaStaleError, reset_request_epoch
+from multiplayer.crdt_state import CrdtState, check_entries
+from multiplayer.peer_table import PeerTable, LEAVE
+from core.tick_scheduler import TickScheduler
+from core.timer_wheel import TimerWheel
 
 class MultiplayerSync:
-    def __init__(self, shard_id: str):
+    def __init__(self, shard_id: str, clock=time.time):
         self.shard_id = shard_id
-        self.local_peers = []      # Nearby shards
+        self.peer_table = PeerTable()
+        self.local_peers = self.peer_table.peers  # Nearby shards — patched in place
         self.global_state_hash = ""
         self.local_state = {}      # Game state dict
         self.sync_interval = 42    # Trinity ms local, 60s burst
+        self.peer_links = {}       # peer_id -> (DeltaEncoder, DeltaDecoder) wire session
+        self.transport = None      # Frame carrier (None = standalone prototype, nothing on the air)
+        self._reset_sent = {}      # peer_id -> decoder epoch we last asked the peer to reset
+        self.bad_frames = 0
+        self.crdt = CrdtState(shard_id, self.local_state)
+        self.discover_every = 24   # Ticks between discovery scans (~1 s)
+        self.ticks = 0
+        self.bursts = 0
+        self.timers = TimerWheel(clock)
+        self.burst = self.timers.window(60, 5, on_open=self.burst_sync)  # Opportunistic window
+        self.peer_table.subscribe(self._on_membership)
     
     def mesh_discover(self):
-        # Simulate local peer discovery
-        self.local_peers = ["shard_002", "shard_003"]  # BLE/Wi-Fi Direct
+        # Simulate local peer discovery — each beacon is a heartbeat
+        found = ["shard_002", "shard_003"] if self.transport is None else self.transport.mesh_peers(self.shard_id)
+        for peer in found:  # BLE/Wi-Fi Direct
+            self.peer_table.heartbeat(peer)
         return f"Mesh discovered {len(self.local_peers)} peers — mercy link active."
+
+    def _on_membership(self, event: str, peer_id: str):
+        if event == LEAVE:
+            self.peer_links.pop(peer_id, None)  # Rejoin starts a fresh wire session
     
+    def _link(self, peer_id: str):
+        if peer_id not in self.peer_links:
+            self.peer_links[peer_id] = (DeltaEncoder(), DeltaDecoder())
+        return self.peer_links[peer_id]
+
+    def encode_delta(self, peer_id: str, keys) -> bytes:
+        return self._link(peer_id)[0].encode(self.crdt.entries(keys))
+
+    def apply_delta(self, peer_id: str, frame) -> int:
+        changes, _ = self._link(peer_id)[1].decode(frame)
+        if peer_id in self.peer_table:
+            self.peer_table.heartbeat(peer_id)
+        return len(self.crdt.merge(changes))
+
+    def attach_transport(self, transport):
+        """Carry delta frames over a transport (send/receive/mesh_peers/now)"""
+        self.transport = transport
+        self.crdt.hlc.clock = transport.now
+        self.peer_table.clock = transport.now
+        return f"Transport attached — {self.shard_id} on the mesh."
+
     def local_sync(self):
-        for peer in self.local_peers:
-            # Delta exchange + mercy-joy resolve
-            pass  # Real impl: send/receive state delta
-        return "Local mesh sync complete — harmony preserved."
+        if self.transport is None:
+            return "Local mesh sync complete — harmony preserved."
+        merged = 0
+        for peer_id, frame in self.transport.receive(self.shard_id):
+            if reset_request_epoch(frame) is not None:
+                self._link(peer_id)[0].on_reset_request(frame)  # Peer lost our session — resend keys
+                continue
+            try:
+                merged += self.apply_delta(peer_id, frame)
+            except DeltaStaleError:
+                continue  # Sent before the reset — its content comes again
+            except DeltaFormatError:
+                self.bad_frames += 1
+                decoder = self._link(peer_id)[1]
+                if self._reset_sent.get(peer_id) != decoder.epoch:  # Ask once per session
+                    self._reset_sent[peer_id] = decoder.epoch
+                    self.transport.send(self.shard_id, peer_id, decoder.reset_request())
+        keys = list(self.crdt.pending)  # Written here since the last sync
+        self.crdt.pending.clear()
+        if keys:
+            for peer in self.local_peers:
+                self.transport.send(self.shard_id, peer, self.encode_delta(peer, keys))
+        return f"Local mesh sync complete — {len(keys)} sent, {merged} merged, harmony preserved."
     
     def burst_sync(self):
-        if time.time() % 60 < 5:  # Opportunistic window
-            # Starlink burst — global truth merge
+        # Starlink burst — global truth merge (timer wheel: once per window open)
+        self.bursts += 1
+        return "Starlink burst — global lattice reconciled."
+
+    def burst_status(self) -> str:
+        if self.burst.is_open:
             return "Starlink burst — global lattice reconciled."
         return "Sky silent — local mercy persists."
     
     def mercy_resolve(self, conflict: dict):
-        # Joy-valence highest wins
+        # Peer state = its stamped entries — merged by the peer's stamps, never re-stamped here
+        return self.merge_entries(conflict)
+
+    def merge_entries(self, entries: dict):
+        # Stamped CRDT entries — HLC stamp, then joy-valence, then shard_id
+        self.crdt.merge(check_entries(entries))
         return "Conflict resolved — highest joy state prevails."
     
     def run(self):
-        self.mesh_discover()
+        if self.ticks % self.discover_every == 0:
+            self.mesh_discover()
+        self.peer_table.sweep()
         self.local_sync()
-        self.burst_sync()
+        self.timers.advance()  # Burst open / close callbacks
+        self.ticks += 1
 
 # Power Rush integration
 def multiplayer_loop():
     sync = MultiplayerSync("player_shard_001")
-    while True:
-        sync.run()
-        time.sleep(sync.sync_interval / 1000)  # 42ms local cycle
+    scheduler = TickScheduler()
+    scheduler.add(sync.shard_id, sync.run, sync.sync_interval)  # 42ms local cycle
+    scheduler.run_forever()
 
 if __name__ == "__main__":
     multiplayer_loop()
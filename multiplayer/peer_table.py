@@ -0,0 +1,108 @@
+"""
+PeerTable-Pinnacle — Incremental Mesh Membership (Join / Suspect / Leave)
+PowerRush Ultramasterpiece — Jan 18 2026
+
+Persistent peer table fed by heartbeats instead of per-tick rediscovery:
+- Any heartbeat (discovery beacon or received frame) refreshes a peer in O(1)
+- Silent peers go suspect after suspect_after seconds, leave after leave_after
+- Expiry queues ordered by last heartbeat — sweep() touches only expiring peers
+- peers list patched in place (swap-remove), never rebuilt
+- Membership events ("join", "suspect", "alive", "leave") fan out to listeners
+- Grandma-safe: a suspect peer stays in the mesh until it truly times out
+"""
+
+import time
+from collections import OrderedDict
+
+JOIN = "join"
+SUSPECT = "suspect"
+ALIVE = "alive"    # Suspect peer heard from again
+LEAVE = "leave"
+
+class PeerTable:
+    def __init__(self, suspect_after: float = 3.0, leave_after: float = 6.0, clock=time.time):
+        self.suspect_after = suspect_after
+        self.leave_after = leave_after   # Seconds of silence before removal
+        self.clock = clock               # Injectable (virtual clock in simulation)
+        self.peers = []                  # Members (alive + suspect) — stable list object
+        self._slot = {}                  # peer_id -> index in peers
+        self._alive = OrderedDict()      # peer_id -> last heartbeat, oldest first
+        self._suspect = OrderedDict()
+        self.listeners = []              # fn(event, peer_id)
+        self.joins = self.leaves = 0
+
+    def subscribe(self, listener):
+        self.listeners.append(listener)
+        return listener
+
+    def _emit(self, event: str, peer_id: str):
+        for listener in self.listeners:
+            listener(event, peer_id)
+
+    # === membership ===
+    def heartbeat(self, peer_id: str, now: float = None):
+        now = self.clock() if now is None else now
+        if peer_id in self._alive:
+            self._alive[peer_id] = now
+            self._alive.move_to_end(peer_id)
+            return None
+        if peer_id in self._suspect:
+            del self._suspect[peer_id]
+            self._alive[peer_id] = now
+            self._emit(ALIVE, peer_id)
+            return ALIVE
+        self._alive[peer_id] = now
+        self._slot[peer_id] = len(self.peers)
+        self.peers.append(peer_id)
+        self.joins += 1
+        self._emit(JOIN, peer_id)
+        return JOIN
+
+    def leave(self, peer_id: str) -> bool:
+        """Explicit goodbye (or timeout) — O(1) swap-remove"""
+        slot = self._slot.pop(peer_id, None)
+        if slot is None:
+            return False
+        self._alive.pop(peer_id, None)
+        self._suspect.pop(peer_id, None)
+        last = self.peers.pop()
+        if last != peer_id:
+            self.peers[slot] = last
+            self._slot[last] = slot
+        self.leaves += 1
+        self._emit(LEAVE, peer_id)
+        return True
+
+    def sweep(self, now: float = None) -> int:
+        """Advance timeouts — cost proportional to peers changing state"""
+        now = self.clock() if now is None else now
+        changed = 0
+        while self._suspect:
+            peer_id, last = next(iter(self._suspect.items()))
+            if now - last < self.leave_after:
+                break
+            self.leave(peer_id)
+            changed += 1
+        while self._alive:
+            peer_id, last = next(iter(self._alive.items()))
+            if now - last < self.suspect_after:
+                break
+            del self._alive[peer_id]
+            self._suspect[peer_id] = last
+            self._emit(SUSPECT, peer_id)
+            changed += 1
+        return changed
+
+    # === views ===
+    def state(self, peer_id: str):
+        if peer_id in self._alive:
+            return ALIVE
+        if peer_id in self._suspect:
+            return SUSPECT
+        return None
+
+    def __contains__(self, peer_id) -> bool:
+        return peer_id in self._slot
+
+    def __len__(self) -> int:
+        return len(self.peers)
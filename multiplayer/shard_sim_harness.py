@@ -0,0 +1,99 @@
+"""
+ShardSimHarness-Pinnacle — Thousands of Shards, One Process, Real Sync Cost
+PowerRush Ultramasterpiece — Jan 18 2026
+
+In-process multi-shard simulation over LocalMeshTransport:
+- Any MultiplayerShardSync subclass (MultiplayerSolarCoop included) via shard_factory
+- Shards packed into mesh groups (10-player local clusters), Starlink between groups
+- Churn: leave() drops a shard mid-run, peers notice through heartbeat timeouts
+- Lock-step 42 ms virtual ticks — no sleeping, runs as fast as the CPU allows
+- Convergence = every shard's Merkle root identical
+- Bytes / frames moved read straight off the transport counters
+"""
+
+import random
+import time
+
+from multiplayer.crdt_state import CrdtState
+from multiplayer.local_mesh_transport import LocalMeshTransport
+from multiplayer.multiplayer_shard_sync import MultiplayerShardSync
+
+class ShardSimHarness:
+    def __init__(self, shard_count: int, group_size: int = 10, shard_factory=MultiplayerShardSync,
+                 transport: LocalMeshTransport = None, seed: int = 0):
+        self.transport = transport or LocalMeshTransport(seed=seed)
+        self.rng = random.Random(seed)
+        self.tick_s = 0.042  # Trinity ms heartbeat
+        self.ticks = 0
+        self.shards = []
+        for i in range(shard_count):
+            shard = shard_factory(f"shard_{i:05d}", joy_valence=0.95)
+            self.transport.join(shard.shard_id, i // group_size)
+            shard.attach_transport(self.transport)
+            self.shards.append(shard)
+        if self.shards:
+            self.tick_s = self.shards[0].sync_interval / 1000
+
+    def seed_writes(self, keys_per_shard: int = 4) -> int:
+        """Every shard writes its own keys, plus a shared counter bump"""
+        for shard in self.shards:
+            for k in range(keys_per_shard):
+                shard.crdt.set(f"{shard.shard_id}/k{k}", self.rng.randint(0, 1 << 20))
+            shard.crdt.increment("gel_stock/world", 1)
+        return len(self.shards) * keys_per_shard
+
+    def preload(self, keys: int = 200) -> int:
+        """Start every shard from the same converged world (a shared save) — no traffic"""
+        world = CrdtState("world_seed", clock=self.transport.now)
+        for k in range(keys):
+            world.set(f"world/k{k}", self.rng.randint(0, 1 << 20))
+        entries = world.take_delta()
+        for shard in self.shards:
+            shard.crdt.merge(entries)
+        return len(entries)
+
+    def leave(self, shard_id: str) -> bool:
+        """Shard walks out of radio range — peers find out via heartbeat timeouts"""
+        for i, shard in enumerate(self.shards):
+            if shard.shard_id == shard_id:
+                self.transport.leave(shard_id)
+                del self.shards[i]
+                return True
+        return False
+
+    def step(self):
+        for shard in self.shards:
+            shard.run()
+        self.transport.advance(self.tick_s)
+        self.ticks += 1
+
+    def converged(self) -> bool:
+        roots = {shard.local_state.root_hash() for shard in self.shards}
+        return len(roots) <= 1
+
+    def run_until_converged(self, max_ticks: int = 20000, check_every: int = 4) -> dict:
+        """Step until all roots agree; returns virtual + wall time and traffic"""
+        start_clock = self.transport.now()
+        start_ticks = self.ticks
+        start_bytes = self.transport.bytes_sent
+        wall = time.perf_counter()
+        done = self.converged()
+        while not done and self.ticks - start_ticks < max_ticks:
+            self.step()
+            if (self.ticks - start_ticks) % check_every == 0:
+                done = self.converged()
+        wall = time.perf_counter() - wall
+        ticks = self.ticks - start_ticks
+        return {
+            "converged": done,
+            "ticks": ticks,
+            "virtual_s": self.transport.now() - start_clock,
+            "wall_s": wall,
+            "shard_ticks_per_s": ticks * len(self.shards) / wall if wall else 0.0,
+            "bytes": self.transport.bytes_sent - start_bytes,
+        }
+
+if __name__ == "__main__":
+    harness = ShardSimHarness(100)
+    harness.seed_writes()
+    print(harness.run_until_converged())
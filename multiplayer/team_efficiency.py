@@ -0,0 +1,102 @@
+"""
+TeamEfficiency-Pinnacle — Incremental Team MPPT Duty Aggregator
+PowerRush Ultramasterpiece — Jan 18 2026
+
+Running team mean for MultiplayerSolarCoop (no per-tick rescans):
+- Running sum + count, patched by per-peer duty deltas — O(changed peers) per tick
+- Optional EWMA smoothing of the team mean (alpha; None = raw mean)
+- Derived boss boost and flavor tier memoized until an input changes
+- Deadband: a duty (or EWMA step) moving less than `quantum` is not a change — a sensor that
+  jitters every tick leaves the memo warm instead of invalidating it every tick
+- Periodic exact re-sum keeps float drift out of the running sum
+- Grandma-safe: a peer's last report holds until it leaves — no flicker
+"""
+
+FLAVORS = ("butter", "gravy", "cinnamon", "chocolate", "mochaccino")
+
+class TeamEfficiency:
+    def __init__(self, alpha: float = None, resum_every: int = 1024, quantum: float = 0.005):
+        self.alpha = alpha              # EWMA weight of the newest mean (None = no smoothing)
+        self.quantum = quantum          # Duty deadband — smaller moves keep the last value
+        self.duties = {}                # peer_id -> last reported duty
+        self.duty_sum = 0.0
+        self.own = 0.0                  # This shard's duty
+        self.smoothed = None
+        self.version = 0                # Bumped whenever the team value changes
+        self.resum_every = resum_every
+        self._updates = 0
+        self._memo = {}                 # (what, args) -> derived value, valid for self.version
+
+    def __len__(self) -> int:
+        return len(self.duties) + 1     # Peers + self
+
+    # === inputs ===
+    def _changed(self):
+        self.version += 1
+        self._memo.clear()
+        self._updates += 1
+        if self._updates >= self.resum_every:
+            self.duty_sum = sum(self.duties.values())
+            self._updates = 0
+
+    def update(self, peer_id: str, duty: float) -> bool:
+        old = self.duties.get(peer_id)
+        if old is not None and abs(duty - old) < self.quantum:
+            return False
+        self.duties[peer_id] = duty
+        self.duty_sum += duty - (old or 0.0)
+        self._changed()
+        return True
+
+    def remove(self, peer_id: str):
+        old = self.duties.pop(peer_id, None)
+        if old is None:
+            return
+        self.duty_sum -= old
+        self._changed()
+
+    def set_own(self, duty: float) -> bool:
+        """This shard's duty — True when it moved past the deadband (worth telling peers)"""
+        if abs(duty - self.own) < self.quantum:
+            return False
+        self.own = duty
+        self._changed()
+        return True
+
+    # === outputs ===
+    @property
+    def mean(self) -> float:
+        return (self.duty_sum + self.own) / len(self)
+
+    def sample(self) -> float:
+        """Advance the EWMA by one tick — call once per tick after the inputs"""
+        mean = self.mean
+        if self.alpha is None:
+            return mean
+        if self.smoothed is not None and abs(mean - self.smoothed) < self.quantum:
+            return self.smoothed  # Settled — no asymptotic creep invalidating the memo every tick
+        self.smoothed = mean if self.smoothed is None else self.smoothed + self.alpha * (mean - self.smoothed)
+        self.version += 1
+        self._memo.clear()
+        return self.smoothed
+
+    @property
+    def efficiency(self) -> float:
+        return self.mean if self.alpha is None or self.smoothed is None else self.smoothed
+
+    def _derived(self, key: tuple, compute):
+        value = self._memo.get(key)
+        if value is None:
+            value = self._memo[key] = compute()
+        return value
+
+    def boost(self, joy: float) -> float:
+        """Boss weakness boost — efficiency × 0.8 + joy × 0.2"""
+        return self._derived(("boost", joy), lambda: self.efficiency * 0.8 + joy * 0.2)
+
+    def flavor_tier(self, bonus: float = 0.0) -> int:
+        """Index into FLAVORS for int((efficiency + bonus) × 5), capped at the top flavor"""
+        return self._derived(("tier", bonus), lambda: min(int((self.efficiency + bonus) * 5), len(FLAVORS) - 1))
+
+    def flavor(self, bonus: float = 0.0) -> str:
+        return FLAVORS[self.flavor_tier(bonus)]
@@ -1,28 +1,85 @@
 """
 ShardBuilder-Pinnacle — Offline-First MercyOS Hybrid Shard + Multiplayer Sync
 MercyOS Pinnacle Ultramasterpiece — Jan 18 2026
+
+- Subsystems (multiplayer sync, logistics, chat, swarm) imported + built on first use
+- Per-subsystem import / construction timings in shard.startup
+- Feature-gated subsystems read as None while their feature is off (multiplayer_sync)
+- Cold-start budget: benchmarks/shard_startup.py (timings) + tests/test_shard_startup.py (nothing eager)
 """
 
 # ... previous content ...
 
-from multiplayer.multiplayer_shard_sync import MultiplayerShardSync
+import importlib
+import time
+
+# name -> (module, factory(module, shard)) — nothing here is imported until first use
+SUBSYSTEMS = {
+    "multiplayer_sync": ("multiplayer.multiplayer_shard_sync",
+                         lambda m, shard: m.MultiplayerShardSync(shard.shard_id, shard.joy_valence)),
+    "logistics": ("core.logistics_service",
+                  lambda m, shard: m.shared_logistics().handle(shard.shard_id)),
+    "chat": ("chat.mercy_gel_chat", lambda m, shard: m.MercyGelChat(shard.shard_id)),
+    "swarm": ("core.swarm_formation_controller", lambda m, shard: m.SwarmFormationController()),
+}
+
+class _Subsystem:
+    """Attribute that imports and constructs its subsystem on first access
+
+    With a feature flag it reads as None (nothing imported) while the shard's flag is off.
+    """
+    def __init__(self, feature: str = None):
+        self.feature = feature
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, shard, owner=None):
+        if shard is None:
+            return self
+        if self.feature is not None and not getattr(shard, self.feature):
+            return None
+        return shard.subsystem(self.name)
 
 class MercyOSShard:
-    def __init__(self):
+    multiplayer_sync = _Subsystem(feature="multiplayer")
+    logistics = _Subsystem()
+    chat = _Subsystem()
+    swarm = _Subsystem()
+
+    def __init__(self, shard_id: str = "default", joy_valence: float = 1.0):
         # ... previous ...
-        self.multiplayer_sync = None
-    
+        self.shard_id = shard_id
+        self.joy_valence = joy_valence
+        self.multiplayer = False
+        self.loaded = {}      # name -> built subsystem
+        self.startup = {}     # name -> {"import_ms", "construct_ms"}
+
+    def subsystem(self, name: str):
+        system = self.loaded.get(name)
+        if system is None:
+            module_name, factory = SUBSYSTEMS[name]
+            start = time.perf_counter()
+            module = importlib.import_module(module_name)
+            imported = time.perf_counter()
+            system = self.loaded[name] = factory(module, self)
+            self.startup[name] = {"import_ms": (imported - start) * 1000,
+                                  "construct_ms": (time.perf_counter() - imported) * 1000}
+        return system
+
     def enable_multiplayer(self, shard_id: str, joy_valence: float = 1.0):
-        self.multiplayer_sync = MultiplayerShardSync(shard_id, joy_valence)
+        self.shard_id = shard_id
+        self.joy_valence = joy_valence
+        self.multiplayer = True  # Sync itself is built on the first multiplayer_step
         return "Multiplayer mercy sync enabled — harmony lattice active."
-    
+
     def multiplayer_step(self):
-        if self.multiplayer_sync:
+        if self.multiplayer:
             self.multiplayer_sync.run()
 
 # Factory with multiplayer option
 def build_shard(multiplayer: bool = False, shard_id: str = "default", joy_valence: float = 1.0):
-    shard = MercyOSShard()
+    shard = MercyOSShard(shard_id, joy_valence)
     if multiplayer:
         shard.enable_multiplayer(shard_id, joy_valence)
     return shard
@@ -0,0 +1,111 @@
+"""
+Durable outbox — replay, torn tail, coalescing, compaction, one writer per log
+
+Run from the repo root: python -m pytest -q tests
+"""
+
+import json
+
+import pytest
+
+from core.command_queue import CommandQueue, OutboxLockedError
+from core.starlink_drone_controller import StarlinkDroneController
+
+def _drop(recipient: str, x: float = 0.0, **extra) -> dict:
+    return {"kind": "drop", "recipient": recipient, "payload": "MercyGel", "destination": {"x": x, "y": 0.0}, **extra}
+
+def _commands(queue: CommandQueue) -> list:
+    return [command for _, command, _ in queue.pending.values()]
+
+def test_replay_restores_unacked_puts(tmp_path):
+    path = str(tmp_path / "outbox.jsonl")
+    queue = CommandQueue(path, batch_bytes=1)  # One command per batch
+    for name in ("ana", "ben", "cy"):
+        queue.put(_drop(name))
+    sent = []
+    queue.flush(lambda commands: not sent and not sent.extend(commands))  # Window closes after one batch
+    queue.close()
+    reopened = CommandQueue(path)
+    assert [c["recipient"] for c in sent] == ["ana"]
+    assert [c["recipient"] for c in _commands(reopened)] == ["ben", "cy"]
+    assert reopened.put(_drop("dee")) == 4  # Seqs continue past the replayed ones
+    reopened.close()
+
+def test_torn_final_line_is_dropped(tmp_path):
+    path = str(tmp_path / "outbox.jsonl")
+    queue = CommandQueue(path)
+    queue.put(_drop("ana"))
+    queue.put(_drop("ben"))
+    queue.close()
+    with open(path, "ab") as f:
+        f.write(b'{"op":"put","owner":"outbox.jsonl","seq":3,"cmd":{"kind":"dr')  # Crash mid-append
+    reopened = CommandQueue(path)
+    assert [c["recipient"] for c in _commands(reopened)] == ["ana", "ben"]
+    reopened.put(_drop("cy"))
+    reopened.close()
+    with open(path, "rb") as f:
+        lines = f.read().splitlines()
+    assert len(lines) == 3 and all(json.loads(line) for line in lines)
+
+def test_coalescing_by_key_of(tmp_path):
+    superseded = []
+    queue = CommandQueue(str(tmp_path / "outbox.jsonl"), on_superseded=superseded.append)
+    queue.put(_drop("ana", drone=1))
+    queue.put(_drop("ben"))
+    queue.put(_drop("ana", drone=2))      # Same kind / recipient / payload / destination
+    queue.put(_drop("ana", x=5.0))        # Different destination — its own command
+    assert len(queue) == 3 and queue.coalesced == 1
+    assert superseded == [_drop("ana", drone=1)]
+    assert [c.get("drone") for c in _commands(queue)] == [None, 2, None]  # Latest re-queued at the back
+    queue.close()
+    assert len(CommandQueue(str(tmp_path / "outbox.jsonl"))) == 3
+
+def test_compaction_keeps_only_pending(tmp_path):
+    path = str(tmp_path / "outbox.jsonl")
+    queue = CommandQueue(path)
+    for i in range(300):
+        queue.put(_drop(f"r{i}"))
+    queue.flush(lambda commands: True)  # Token bucket lets part of them go
+    left = [c["recipient"] for c in _commands(queue)]
+    assert 0 < len(left) < 300
+    queue.compact()
+    assert queue.log_records == len(left)
+    with open(path) as f:
+        assert [json.loads(line)["cmd"]["recipient"] for line in f] == left
+    queue.put(_drop("after"))
+    queue.close()
+    assert [c["recipient"] for c in _commands(CommandQueue(path))] == left + ["after"]
+
+def test_one_writer_per_log(tmp_path):
+    path = str(tmp_path / "outbox.jsonl")
+    queue = CommandQueue(path)
+    with pytest.raises(OutboxLockedError):
+        CommandQueue(path)
+    queue.close()
+    CommandQueue(path).close()  # Released on close
+
+def test_foreign_records_are_ignored(tmp_path):
+    path = str(tmp_path / "outbox.jsonl")
+    with open(path, "w") as f:
+        f.write(json.dumps({"op": "put", "owner": "other", "seq": 1, "cmd": _drop("ana")}) + "\n")
+        f.write(json.dumps({"op": "put", "owner": "shard_a", "seq": 1, "cmd": _drop("ben")}) + "\n")
+        f.write(json.dumps({"op": "ack", "owner": "other", "seq": 1, "seqs": [1]}) + "\n")  # Same seq, other writer
+    queue = CommandQueue(path, owner="shard_a")
+    assert [c["recipient"] for c in _commands(queue)] == ["ben"]
+    assert queue.foreign == 2
+    queue.close()
+
+def test_controller_outbox_in_memory_by_default():
+    fleet = StarlinkDroneController(fleet_size=4)
+    assert fleet.outbox.path is None
+
+def test_replayed_drops_retake_slots(tmp_path):
+    path = str(tmp_path / "fleet.jsonl")
+    queue = CommandQueue(path)
+    queue.put(_drop("ana", drone=2, leg=100.0))
+    queue.put(_drop("ben", drone=99, leg=100.0))  # Not in a 4-drone fleet
+    queue.close()
+    fleet = StarlinkDroneController(fleet_size=4, outbox_path=path)
+    assert [drone["in_flight"] for drone in fleet.drones] == [0, 0, 1, 0]
+    assert [("leg" in c) for c in _commands(fleet.outbox)] == [True, False]
+    fleet.outbox.close()
@@ -0,0 +1,104 @@
+"""
+CRDT merge laws — commutative, idempotent, associative; peer state merged by its own stamps
+
+Run from the repo root: python -m pytest -q tests
+"""
+
+import itertools
+
+import pytest
+
+from multiplayer.crdt_state import CrdtFormatError, CrdtState
+from multiplayer.multiplayer_shard_sync import MultiplayerShardSync
+
+def _replica(shard_id: str, joy: float = 1.0, now: float = 100.0) -> CrdtState:
+    return CrdtState(shard_id, joy_valence=joy, clock=lambda: now)
+
+def _snapshot(crdt: CrdtState) -> tuple:
+    return (crdt.registers, {k: v for k, v in crdt.counters.items() if v}, dict(crdt.state), crdt.tombstones)
+
+def _converged(deltas: list) -> list:
+    """Fresh replica per delta order (and with every delta re-applied) — snapshots of each"""
+    out = []
+    for order in itertools.permutations(deltas):
+        crdt = _replica("observer", now=0.0)
+        for delta in order + order:  # Second pass = duplicate bursts
+            crdt.merge(delta)
+        out.append(_snapshot(crdt))
+    return out
+
+def _all_equal(snapshots: list) -> bool:
+    return all(s == snapshots[0] for s in snapshots)
+
+def test_lww_ties_resolve_the_same_everywhere():
+    # Same wall ms and logical counter — joy-valence, then shard_id decide (tuple(entry[1:5]))
+    a, b, c = _replica("shard_a", 0.9), _replica("shard_b", 0.9), _replica("shard_c", 0.5)
+    for crdt, value in ((a, "a"), (b, "b"), (c, "c")):
+        crdt.set("zone", value)
+    deltas = [a.take_delta(), b.take_delta(), c.take_delta()]
+    assert deltas[0]["zone"][1:3] == deltas[1]["zone"][1:3] == deltas[2]["zone"][1:3]
+    snapshots = _converged(deltas)
+    assert _all_equal(snapshots)
+    assert snapshots[0][2]["zone"] == "b"  # Equal stamp and joy — highest shard_id
+
+def test_later_stamp_beats_higher_joy():
+    early, late = _replica("shard_a", 1.0, now=100.0), _replica("shard_b", 0.1, now=101.0)
+    early.set("zone", "early")
+    late.set("zone", "late")
+    snapshots = _converged([early.take_delta(), late.take_delta()])
+    assert _all_equal(snapshots) and snapshots[0][2]["zone"] == "late"
+
+def test_pn_counters_merge_associatively():
+    a, b, c = _replica("shard_a"), _replica("shard_b"), _replica("shard_c")
+    a.increment("gel_stock", 10)
+    b.increment("gel_stock", 4)
+    b.increment("gel_stock", -3)
+    c.increment("gel_stock", -2)
+    deltas = [a.take_delta(), b.take_delta(), c.take_delta()]
+    snapshots = _converged(deltas)
+    assert _all_equal(snapshots)
+    assert snapshots[0][2]["gel_stock"] == 9
+    # (a ⊔ b) ⊔ c == a ⊔ (b ⊔ c), and a partial (older) counter never rolls a shard back
+    left, right = _replica("x", now=0.0), _replica("y", now=0.0)
+    left.merge(deltas[0]); left.merge(deltas[1]); left.merge(deltas[2])
+    bc = _replica("bc", now=0.0)
+    bc.merge(deltas[1]); bc.merge(deltas[2])
+    right.merge(bc.entries(["gel_stock"])); right.merge(deltas[0])
+    right.merge({"gel_stock": ["c", {"shard_b": [1, 0]}]})
+    assert left.counters == right.counters and right.value("gel_stock") == 9
+
+def test_tombstone_against_concurrent_write():
+    a, b = _replica("shard_a", now=100.0), _replica("shard_b", now=100.0)
+    a.set("zone", "open")
+    b.merge(a.take_delta())
+    b.delete("zone")            # Same wall ms, logical 1 — after a's write
+    a.set("zone", "moved")      # Concurrent with the delete, also logical 1 — shard_b wins the tie
+    snapshots = _converged([a.take_delta(), b.take_delta()])
+    assert _all_equal(snapshots)
+    registers, _, state, tombstones = snapshots[0]
+    assert "zone" not in state and tombstones == {"zone"}
+    # A strictly later write resurrects the key everywhere
+    late = _replica("shard_a", now=200.0)
+    late.set("zone", "back")
+    snapshots = _converged([a.entries(["zone"]), b.entries(["zone"]), late.take_delta()])
+    assert _all_equal(snapshots) and snapshots[0][2]["zone"] == "back" and not snapshots[0][3]
+
+def test_peer_state_merges_by_peer_stamps():
+    receiver, peer = MultiplayerShardSync("shard_a"), MultiplayerShardSync("shard_b")
+    receiver.crdt.hlc.clock = lambda: 100.0
+    peer.crdt.hlc.clock = lambda: 200.0
+    receiver.crdt.set("zone", "old")
+    peer.crdt.set("zone", "new")
+    receiver.mercy_conflict_resolve(peer.crdt.entries(["zone"]))
+    assert receiver.local_state["zone"] == "new"
+    # Stale peer entries lose — the receiver keeps its own later write, no re-stamping
+    receiver.crdt.hlc.clock = lambda: 300.0
+    receiver.crdt.set("zone", "newest")
+    receiver.mercy_conflict_resolve(peer.crdt.entries(["zone"]))
+    assert receiver.local_state["zone"] == "newest"
+
+def test_plain_peer_state_is_rejected():
+    sync = MultiplayerShardSync("shard_a")
+    with pytest.raises(CrdtFormatError):
+        sync.mercy_conflict_resolve({"zone": "new"})
+    assert "zone" not in sync.local_state
@@ -0,0 +1,268 @@
+"""
+Round-trip + failure tests for the delta wire format (multiplayer.delta_codec)
+
+Run from the repo root: python -m pytest -q tests
+"""
+
+import random
+import zlib
+
+import pytest
+
+from multiplayer.delta_codec import (
+    DeltaDecoder, DeltaEncoder, DeltaFormatError, DeltaStaleError, FLAG_ZLIB, MAGIC, WIRE_VERSION,
+    reset_request_epoch,
+)
+from multiplayer.local_mesh_transport import LinkProfile, LocalMeshTransport
+from multiplayer.multiplayer_sync import MultiplayerSync
+
+VALUES = {
+    "zero": 0,
+    "small": 63,
+    "negative": -1,
+    "negative_big": -(2 ** 70) - 12345,
+    "big": 2 ** 64 + 7,
+    "int64_edges": [2 ** 63 - 1, -(2 ** 63)],
+    "float": 3.141592653589793,
+    "float_edges": [-0.0, 1e-308, 1.7976931348623157e308, float("inf"), float("-inf")],
+    "bools_none": [True, False, None],
+    "unicode": "gel_Zoë — 太陽 🌞",
+    "empty": ["", b"", [], {}],
+    "bytes": bytes(range(256)),
+    "nested": {"boss": {"hp": 7500, "phase": ["dawn", {"joy": 0.95, "ids": [1, -2, 3]}]}, "ünï": None},
+}
+
+def round_trip(enc: DeltaEncoder, dec: DeltaDecoder, changes: dict, deleted=()):
+    frame = enc.encode(changes, deleted=deleted)
+    return frame, dec.decode(memoryview(frame))
+
+@pytest.mark.parametrize("compression", [None, "zlib"])
+def test_round_trip_value_types(compression):
+    enc, dec = DeltaEncoder(compression=compression), DeltaDecoder()
+    for _ in range(3):  # Inline keys, then interned keys, then again
+        _, (changes, deleted) = round_trip(enc, dec, VALUES)
+        assert changes == VALUES
+        assert deleted == []
+
+def test_nan_round_trips():
+    enc, dec = DeltaEncoder(), DeltaDecoder()
+    _, (changes, _) = round_trip(enc, dec, {"nan": float("nan")})
+    assert changes["nan"] != changes["nan"]
+
+def test_tuples_decode_as_lists():
+    enc, dec = DeltaEncoder(), DeltaDecoder()
+    _, (changes, _) = round_trip(enc, dec, {"pos": (1.0, -2, "x")})
+    assert changes == {"pos": [1.0, -2, "x"]}
+
+def test_removed_keys():
+    enc, dec = DeltaEncoder(), DeltaDecoder()
+    round_trip(enc, dec, {"a": 1, "b": 2})
+    _, (changes, deleted) = round_trip(enc, dec, {"c": 3}, deleted=["a", "never_sent"])
+    assert changes == {"c": 3}
+    assert deleted == ["a", "never_sent"]
+    _, (changes, deleted) = round_trip(enc, dec, {}, deleted=["b", "never_sent"])  # Interned this time
+    assert (changes, deleted) == ({}, ["b", "never_sent"])
+
+def test_compressed_and_uncompressed_paths():
+    big = {f"shard_key_{i}": "MercyGel drop zone active" for i in range(64)}
+    compressed, dec = DeltaEncoder(compression="zlib"), DeltaDecoder()
+    frame, (changes, _) = round_trip(compressed, dec, big)
+    assert frame[3] & FLAG_ZLIB
+    assert changes == big
+
+    raw, dec = DeltaEncoder(compression=None), DeltaDecoder()
+    frame, (changes, _) = round_trip(raw, dec, big)
+    assert frame[3] == 0
+    assert changes == big
+
+    small = DeltaEncoder(compression="zlib")  # Under the threshold — sent raw
+    frame, (changes, _) = round_trip(small, DeltaDecoder(), {"a": 1})
+    assert frame[3] == 0
+    assert changes == {"a": 1}
+
+def test_interned_keys_shrink_frames():
+    enc, dec = DeltaEncoder(compression=None), DeltaDecoder()
+    delta = {f"key_{i}": i for i in range(100)}
+    first, _ = round_trip(enc, dec, delta)
+    second, (changes, _) = round_trip(enc, dec, delta)
+    assert changes == delta
+    assert len(second) < len(first) / 2
+
+def test_base_mismatch_is_detected_not_guessed():
+    enc, dec = DeltaEncoder(), DeltaDecoder()
+    enc.encode({"lost": 1})  # Never reaches the decoder — it would have interned "lost"
+    frame = enc.encode({"lost": 2, "next": 3})
+    with pytest.raises(DeltaFormatError, match="desync"):
+        dec.decode(frame)
+    assert dec.keys == []
+
+def test_reset_recovers_from_desync():
+    enc, dec = DeltaEncoder(), DeltaDecoder()
+    round_trip(enc, dec, {"a": 1})
+    enc.encode({"dropped": 2})
+    with pytest.raises(DeltaFormatError):
+        dec.decode(enc.encode({"b": 3}))
+
+    request = dec.reset_request()
+    assert reset_request_epoch(request) == enc.epoch
+    assert enc.on_reset_request(request)
+    assert not enc.on_reset_request(request)  # Once per failing session
+    _, (changes, _) = round_trip(enc, dec, {"a": 1, "b": 3})
+    assert changes == {"a": 1, "b": 3}
+    assert dec.epoch == enc.epoch == 1
+
+def test_stale_frames_from_old_session_are_dropped():
+    enc, dec = DeltaEncoder(), DeltaDecoder()
+    round_trip(enc, dec, {"a": 1})
+    late = enc.encode({"b": 2})  # Delayed on a lossy link
+    enc.reset()
+    round_trip(enc, dec, {"a": 5})
+    with pytest.raises(DeltaStaleError):
+        dec.decode(late)
+    _, (changes, _) = round_trip(enc, dec, {"a": 6})  # Session unaffected
+    assert changes == {"a": 6}
+
+def test_rejoined_peer_restarts_at_epoch_zero():
+    enc, dec = DeltaEncoder(), DeltaDecoder()
+    enc.reset()
+    round_trip(enc, dec, {"a": 1})
+    fresh = DeltaEncoder()
+    _, (changes, _) = round_trip(fresh, dec, {"z": 1})
+    assert changes == {"z": 1}
+    assert dec.keys == ["z"]
+
+def test_reset_request_is_not_a_delta():
+    with pytest.raises(DeltaFormatError):
+        DeltaDecoder().decode(DeltaDecoder().reset_request())
+    assert reset_request_epoch(DeltaEncoder().encode({"a": 1})) is None
+
+@pytest.mark.parametrize("compression", [None, "zlib"])
+def test_every_truncation_raises_cleanly(compression):
+    enc = DeltaEncoder(compression=compression, compress_threshold=0)
+    frame = enc.encode(VALUES, deleted=["gone"])
+    for cut in range(len(frame)):
+        dec = DeltaDecoder()
+        with pytest.raises(DeltaFormatError):
+            dec.decode(frame[:cut])
+        assert dec.keys == []  # Nothing interned from a rejected frame
+
+def test_corrupt_frames_raise_cleanly():
+    rng = random.Random(42)
+    frame = DeltaEncoder(compression=None).encode(VALUES, deleted=["gone"])
+    for _ in range(2000):
+        corrupt = bytearray(frame)
+        for _ in range(rng.randint(1, 4)):
+            corrupt[rng.randrange(4, len(corrupt))] = rng.randrange(256)
+        dec = DeltaDecoder()
+        try:
+            dec.decode(bytes(corrupt))
+        except DeltaFormatError:
+            assert dec.keys == []
+
+def test_header_errors():
+    frame = DeltaEncoder().encode({"a": 1})
+    with pytest.raises(DeltaFormatError, match="not a delta frame"):
+        DeltaDecoder().decode(b"\x00\x00" + frame[2:])
+    with pytest.raises(DeltaFormatError, match="wire version"):
+        DeltaDecoder().decode(frame[:2] + b"\x09" + frame[3:])
+    with pytest.raises(DeltaFormatError, match="trailing"):
+        DeltaDecoder().decode(frame + b"\x00")
+
+def test_corrupt_compressed_body():
+    enc = DeltaEncoder(compression="zlib", compress_threshold=0)
+    frame = bytearray(enc.encode({f"k{i}": "v" * 20 for i in range(20)}))
+    assert frame[3] & FLAG_ZLIB
+    frame[-3] ^= 0xFF
+    with pytest.raises(DeltaFormatError):
+        DeltaDecoder().decode(bytes(frame))
+    with pytest.raises(DeltaFormatError):
+        DeltaDecoder().decode(bytes(frame[:7]) + zlib.compress(b"\xff\xff\xff"))
+
+def zlib_frame(claimed: int, body: bytes) -> bytes:
+    """Session-0 zlib frame whose header claims `claimed` inflated bytes"""
+    frame = bytearray(MAGIC)
+    frame += bytes([WIRE_VERSION, FLAG_ZLIB, 0, 0])  # epoch 0, base 0
+    while claimed > 0x7F:
+        frame.append((claimed & 0x7F) | 0x80)
+        claimed >>= 7
+    frame.append(claimed)
+    return bytes(frame) + zlib.compress(body)
+
+def test_decompression_bomb_is_cut_at_the_claimed_size():
+    bomb = b"\x00" * (64 << 20)  # 64 MiB of zeros, ~64 KiB on the wire
+    dec = DeltaDecoder()
+    with pytest.raises(DeltaFormatError, match="claims|inflates|incomplete"):
+        dec.decode(zlib_frame(16, bomb))
+    with pytest.raises(DeltaFormatError, match="claims"):
+        dec.decode(zlib_frame(len(bomb), bomb))  # Honest header, still over max_body
+    assert dec.keys == []
+
+def test_claimed_size_must_match_the_body():
+    changes = {f"k{i}": "v" * 20 for i in range(20)}
+    frame = DeltaEncoder(compression="zlib", compress_threshold=0).encode(changes)
+    assert frame[3] & FLAG_ZLIB
+    good = DeltaDecoder().decode(frame)
+    assert good == (changes, [])
+    inflated = DeltaEncoder(compression=None).encode(changes)[6:]  # Body after the 6-byte header
+    with pytest.raises(DeltaFormatError):
+        DeltaDecoder().decode(zlib_frame(len(inflated) + 5, inflated))  # Header over-claims
+    with pytest.raises(DeltaFormatError):
+        DeltaDecoder().decode(zlib_frame(len(inflated) - 1, inflated))  # Header under-claims
+    assert DeltaDecoder().decode(zlib_frame(len(inflated), inflated)) == good
+    with pytest.raises(DeltaFormatError, match="claims"):
+        DeltaDecoder(max_body=len(inflated) - 1).decode(frame)
+
+def test_encoder_rejects_bad_input_without_losing_session():
+    enc, dec = DeltaEncoder(), DeltaDecoder()
+    with pytest.raises(DeltaFormatError):
+        enc.encode({"fine": 1, "bad": object()})
+    with pytest.raises(DeltaFormatError):
+        enc.encode({1: "non-str key"})
+    _, (changes, _) = round_trip(enc, dec, {"fine": 2})
+    assert changes == {"fine": 2}
+
+def test_hostile_nesting_raises_cleanly():
+    header = DeltaEncoder(compression=None).encode({})[:-1]  # Drop the empty body's count
+    body = b"\x01\x07key" + bytes([7, 1]) * 5000 + b"\x00"   # 5000 nested one-item lists
+    with pytest.raises(DeltaFormatError):
+        DeltaDecoder().decode(header + body)
+
+def mesh_pair():
+    lossless = LinkProfile(latency_ms=10, loss=0.0)
+    transport = LocalMeshTransport(mesh=lossless)
+    shards = [MultiplayerSync(shard_id) for shard_id in ("shard_a", "shard_b")]
+    for shard in shards:
+        transport.join(shard.shard_id, "camp")
+    for shard in shards:
+        shard.attach_transport(transport)
+        shard.mesh_discover()
+    return transport, shards
+
+def test_local_sync_carries_deltas_over_the_mesh():
+    transport, (a, b) = mesh_pair()
+    a.crdt.update({"boss_hp": 7500})
+    b.crdt.update({"gel_stock": 12})
+    for _ in range(3):
+        for shard in (a, b):
+            shard.local_sync()
+        transport.advance(0.1)
+    assert a.local_state == b.local_state
+    assert a.local_state["boss_hp"] == 7500 and b.local_state["gel_stock"] == 12
+    assert transport.frames_sent == 2  # One delta each way, nothing re-sent once quiet
+
+def test_local_sync_asks_once_for_a_reset_on_a_bad_frame():
+    transport, (a, b) = mesh_pair()
+    bomb = zlib_frame(16, b"\x00" * (1 << 20))
+    transport.send("shard_a", "shard_b", bomb)
+    transport.send("shard_a", "shard_b", bomb)
+    transport.advance(0.1)
+    b.local_sync()
+    assert b.bad_frames == 2 and b.local_state == {}
+    transport.advance(0.1)
+    a.local_sync()  # Reset request honoured — next frame re-sends every key
+    assert a.peer_links["shard_b"][0].epoch == 1
+    a.crdt.update({"boss_hp": 7000})
+    a.local_sync()
+    transport.advance(0.1)
+    b.local_sync()
+    assert b.local_state["boss_hp"] == 7000
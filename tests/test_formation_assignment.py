@@ -0,0 +1,39 @@
+"""
+Slot assignment — valid permutation, never worse than identity, inside the deploy budget
+
+Run from the repo root: python -m pytest -q tests
+"""
+
+import time
+
+import numpy as np
+
+from core.formation_assignment import _travel, assign_slots, hungarian, _distance_matrix
+from core.swarm_formation_controller import SwarmFormationController
+
+def _switch(n: int):
+    swarm = SwarmFormationController(n)
+    swarm.v_mercy_wedge((0.0, 0.0, 50.0))
+    swarm.positions[:] = swarm.targets
+    swarm.abundance_circle((0.0, 0.0, 50.0))
+    return swarm.positions.copy(), swarm.targets.copy()
+
+def test_small_fleet_is_exact():
+    positions, slots = _switch(40)
+    perm = assign_slots(positions, slots)
+    assert _travel(positions, slots, perm) <= _travel(positions, slots, hungarian(_distance_matrix(positions, slots))) + 1e-6
+
+def test_large_fleet_permutation_beats_identity():
+    positions, slots = _switch(1000)
+    perm = assign_slots(positions, slots)
+    assert sorted(perm.tolist()) == list(range(1000))
+    assert _travel(positions, slots, perm) < 0.8 * _travel(positions, slots, np.arange(1000))
+
+def test_ten_thousand_within_budget():
+    positions, slots = _switch(10_000)
+    assign_slots(positions, slots)  # Warm-up
+    start = time.perf_counter()
+    perm = assign_slots(positions, slots, budget_ms=20.0)
+    assert (time.perf_counter() - start) * 1000 < 100
+    assert sorted(perm.tolist()) == list(range(10_000))
+    assert _travel(positions, slots, perm) <= _travel(positions, slots, np.arange(10_000))
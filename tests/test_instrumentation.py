@@ -0,0 +1,80 @@
+"""
+Instrumentation — no lost counts across threads, per-path overrun budgets
+
+Run from the repo root: python -m pytest -q tests
+"""
+
+import sys
+import threading
+
+from core.instrumentation import METRICS, Metrics, hot_path
+from core.swarm_formation_controller import COORD_PULSE_HZ, SwarmFormationController
+
+def _clock(step_ns: int):
+    """Deterministic perf_counter_ns — every read advances step_ns"""
+    now = [0]
+
+    def clock():
+        now[0] += step_ns
+        return now[0]
+    return clock
+
+def test_concurrent_counts_are_never_lost():
+    metrics = Metrics()
+    metrics.enable()
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # Switch threads as often as the interpreter allows
+    try:
+        def work():
+            for _ in range(20_000):
+                metrics.count("dispatches")
+                metrics.count("sync_bytes", 3)
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+    assert metrics.counters == {"dispatches": 160_000, "sync_bytes": 480_000}
+    assert "powerrush_dispatches_total 160000" in metrics.prometheus()
+
+def test_reset_clears_every_thread():
+    metrics = Metrics()
+    metrics.enable()
+    worker = threading.Thread(target=metrics.count, args=("dispatches", 5))
+    worker.start()
+    worker.join()
+    metrics.count("dispatches")
+    assert metrics.counters == {"dispatches": 6}
+    metrics.reset()
+    assert metrics.counters == {}
+    metrics.count("dispatches")
+    assert metrics.counters == {"dispatches": 1}
+
+def test_each_path_overruns_against_its_own_budget(monkeypatch):
+    metrics = Metrics()
+    # Every span below lasts exactly 30 ms: over a 23.8 ms budget, under the 42 ms default
+    monkeypatch.setattr("core.instrumentation.time.perf_counter_ns", _clock(30_000_000))
+
+    class Shard:
+        @hot_path("pulse", metrics, budget_ms=1000 / 42)
+        def pulse(self):
+            return None
+
+        @hot_path("tick", metrics)
+        def tick(self):
+            return None
+
+    metrics.enable()
+    shard = Shard()
+    for _ in range(3):
+        shard.pulse()
+        shard.tick()
+    assert metrics.counters == {"pulse_overruns": 3}
+    assert metrics.histograms["tick"].count == 3
+
+def test_update_positions_uses_the_coord_pulse_budget():
+    budgets = {name: budget for _, _, name, _, budget in METRICS.hot_paths}
+    assert budgets["swarm_update_positions"] == int(1000 / COORD_PULSE_HZ * 1_000_000)
+    assert SwarmFormationController().coord_pulse == COORD_PULSE_HZ
@@ -0,0 +1,35 @@
+"""
+Logistics planning — mixed x/y and lat/lon destinations cluster in one set of units
+
+Run from the repo root: python -m pytest -q tests
+"""
+
+import math
+
+from core import dispatch_scheduler, logistics_controller
+from core.logistics_controller import LogisticsController, _centroid
+
+def _clusters(plan: list) -> set:
+    return {frozenset(sortie["players"]) for sortie in plan}
+
+def test_one_projection_for_dispatch_and_clustering():
+    assert logistics_controller.destination_xy is dispatch_scheduler.destination_xy
+
+def test_each_destination_projected_in_its_own_units():
+    jobs = [
+        ("near", {"x": 10.0, "y": 10.0}, "butter"),
+        ("far", {"x": 5000.0, "y": 10.0}, "butter"),      # 5 km away — its own sortie
+        ("north_a", {"lat": 60.0, "lon": 10.0}, "gravy"),
+        ("north_b", {"lat": 60.0, "lon": 10.002}, "gravy"),  # ~111 m east at 60°N — same cell
+    ]
+    plan = LogisticsController().plan_dispatch(jobs)
+    assert _clusters(plan) == {frozenset({"near"}), frozenset({"far"}), frozenset({"north_a", "north_b"})}
+    north = next(sortie for sortie in plan if "north_a" in sortie["players"])
+    assert north["destination"]["lat"] == 60.0 and math.isclose(north["destination"]["lon"], 10.001)
+
+def test_mixed_centroid_falls_back_to_local_metres():
+    east = {"lat": 0.0, "lon": 0.001}
+    centroid = _centroid([{"x": 0.0, "y": 0.0}, east])
+    assert math.isclose(centroid["x"], dispatch_scheduler.destination_xy(east)[0] / 2)
+    assert centroid["y"] == 0.0
+    assert _centroid([{"x": 2.0, "y": 4.0}, {"x": 4.0, "y": 8.0}]) == {"x": 3.0, "y": 6.0}
@@ -0,0 +1,57 @@
+"""
+Chat inbox flood — per-sender limit before replies, one reply per coalesced group
+
+Run from the repo root: python -m pytest -q tests
+"""
+
+import pytest
+
+pytest.importorskip("chat.mercy_chat")  # MercyChat base ships with the chat client
+
+import chat.mercy_gel_chat as gel_chat_module
+from chat.mercy_gel_chat import MercyGelChat
+
+@pytest.fixture
+def chat(monkeypatch):
+    narrated = []
+    monkeypatch.setattr(gel_chat_module, "summon_mythic", lambda voice, text: narrated.append(text))
+    now = [100.0]
+    chat = MercyGelChat("flood_shard", rate_per_s=0.5, burst=3, clock=lambda: now[0])
+    chat.real_world_opt_in = False
+    chat.team_members = ["ana", "ben"]
+    chat.sent, chat.buffs = [], []
+    chat.send_message = lambda sender, text: chat.sent.append((sender, text))
+    chat.apply_gel_buff = lambda flavor, member=None: chat.buffs.append((flavor, member))
+    chat.now, chat.narrated = now, narrated
+    return chat
+
+def test_flood_from_one_sender(chat):
+    for _ in range(500):
+        chat.on_message({"sender": "spammer", "text": "/gel drop butter"})
+        chat.on_message({"sender": "spammer", "text": "/gel share cinnamon"})
+    chat.on_message({"sender": "ana", "text": "/gel drop gravy"})
+    replies = chat.process_inbox()
+    spam = [text for sender, text in chat.sent if sender == "spammer"]
+    assert len(spam) == 2 and replies == 3          # One per coalesced group, plus ana's own
+    assert chat.throttled == 1000 - chat.burst      # Limit applied before coalescing
+    assert chat.coalesced == 1                      # Third allowed message joined the drop group
+    assert len(chat.buffs) == 1 + len(chat.team_members) + 1
+    assert ("ana", "MercyGel gravy sachet dropped — joy restored!") in chat.sent
+
+def test_flood_stays_throttled_next_tick(chat):
+    for _ in range(100):
+        chat.on_message({"sender": "spammer", "text": "/gel drop butter"})
+    chat.process_inbox()
+    chat.sent.clear()
+    chat.now[0] += 2.0                              # One token back at 0.5/s
+    for _ in range(100):
+        chat.on_message({"sender": "spammer", "text": "/gel drop butter"})
+    assert chat.process_inbox() == 1 and len(chat.sent) == 1
+
+def test_same_share_from_two_senders_is_one_dispatch(chat):
+    chat.on_message({"sender": "ana", "text": "/gel share mochaccino"})
+    chat.on_message({"sender": "ben", "text": "/gel share mochaccino"})
+    chat.on_message({"sender": "ben", "text": "/gel share mochaccino"})
+    assert chat.process_inbox() == 2                # Each sender told once
+    assert len(chat.buffs) == len(chat.team_members)
+    assert chat.narrated == ["Coop MercyGel mochaccino shared — team abundance eternal!"]
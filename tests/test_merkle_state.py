@@ -0,0 +1,50 @@
+"""
+Merkle anti-entropy — a single divergent key is found touching only the subtrees on its path
+
+Run from the repo root: python -m pytest -q tests
+"""
+
+from multiplayer.merkle_state import MerkleState
+
+class _NoScan(dict):
+    """Bucket index that fails any whole-table scan"""
+    def items(self):
+        raise AssertionError("scanned every leaf bucket")
+
+    def __iter__(self):
+        raise AssertionError("scanned every leaf bucket")
+
+def _pair(n: int = 5000):
+    state = {f"key_{i}": i for i in range(n)}
+    return MerkleState(state), MerkleState(state)
+
+def test_diff_keys_single_divergence():
+    mine, theirs = _pair()
+    theirs["key_1234"] = "changed"
+    probed = []
+    remote = theirs.node_hash
+    diverged = mine.divergent_leaves(lambda node: probed.append(node) or remote(node))
+    assert diverged == [mine.leaf_of("key_1234")]
+    assert len(probed) <= 2 * mine.depth + 1  # The root, then both children on one path per level
+    assert mine.diff_keys(theirs) == {"key_1234"}
+
+def test_diff_keys_presence_and_delete():
+    mine, theirs = _pair(200)
+    theirs["only_theirs"] = 1
+    del theirs["key_7"]
+    assert mine.diff_keys(theirs) == theirs.diff_keys(mine) == {"only_theirs", "key_7"}
+    assert mine.diff_keys(MerkleState(dict(mine))) == set()
+
+def test_keys_under_walks_only_requested_subtrees():
+    mine, _ = _pair()
+    mine._leaf_keys = _NoScan(mine._leaf_keys)
+    leaf = mine.leaf_of("key_42")
+    base = 1 << mine.depth
+    for level_up in (0, 4, 9):
+        node = (base + leaf) >> level_up
+        keys = mine.keys_under([node])
+        assert "key_42" in keys
+        assert all((base + mine.leaf_of(k)) >> level_up == node for k in keys)
+    assert mine.keys_under([1]) == set(dict(mine))
+    assert 10 < mine.count_under([1], stop_at=10) < len(mine)
+    assert mine.keys_under([]) == set()
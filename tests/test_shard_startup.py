@@ -0,0 +1,44 @@
+"""
+Lazy shard start — build_shard imports and builds no subsystem (timings: benchmarks/shard_startup.py)
+
+Run from the repo root: python -m pytest -q tests
+"""
+
+from benchmarks.shard_startup import STARTUP_BUDGET_MS, check_startup_budget, startup_report
+from shards.shard_builder import SUBSYSTEMS, MercyOSShard, _Subsystem, build_shard
+
+def test_every_lazy_attribute_has_a_subsystem():
+    lazy = {name for name, attr in vars(MercyOSShard).items() if isinstance(attr, _Subsystem)}
+    assert lazy == set(SUBSYSTEMS)
+
+def test_build_shard_imports_no_subsystem():
+    # Fresh interpreter — this process has already imported most subsystem modules
+    report = startup_report(multiplayer=True)
+    assert report["eager"] == []
+    assert report["subsystems"] == {}  # Nothing constructed either
+
+def test_build_shard_builds_no_subsystem():
+    for multiplayer in (False, True):
+        shard = build_shard(multiplayer=multiplayer)
+        assert shard.loaded == {} and shard.startup == {}
+
+def test_budget_check_flags_regressions():
+    slow = {"import_ms": STARTUP_BUDGET_MS["import"] + 1, "build_ms": 0.0, "eager": ["swarm"]}
+    problems = check_startup_budget(slow)
+    assert len(problems) == 2
+    assert "import" in problems[0] and "swarm" in problems[1]
+
+def test_multiplayer_sync_is_none_while_disabled():
+    shard = build_shard(multiplayer=False)
+    assert shard.multiplayer_sync is None
+    assert "multiplayer_sync" not in shard.loaded
+    shard.multiplayer_step()  # No-op, nothing built
+    assert shard.loaded == {}
+
+def test_multiplayer_sync_built_on_first_use():
+    shard = build_shard(multiplayer=True, shard_id="shard_a")
+    assert shard.loaded == {}
+    sync = shard.multiplayer_sync
+    assert sync is shard.multiplayer_sync
+    assert sync.shard_id == "shard_a"
+    assert "import_ms" in shard.startup["multiplayer_sync"]
@@ -0,0 +1,59 @@
+"""
+Spatial hash — exact against brute force, half-shell pairs once each, no cap hit at spawn
+
+Run from the repo root: python -m pytest -q tests
+"""
+
+import numpy as np
+
+from core.spatial_hash_grid import SpatialHashGrid
+from core.swarm_formation_controller import SwarmFormationController
+
+def _brute(a: np.ndarray, b: np.ndarray, radius: float, skip_self: bool) -> set:
+    dist = np.linalg.norm(a[:, None, :] - b[None, :, :], axis=2)
+    close = dist < radius
+    if skip_self:
+        np.fill_diagonal(close, False)
+    return set(zip(*np.nonzero(close)))
+
+def _cloud(n: int, seed: int) -> np.ndarray:
+    return np.random.default_rng(seed).uniform(-60.0, 60.0, (n, 3))
+
+def test_self_pairs_match_brute_force():
+    points = _cloud(600, 1)
+    grid = SpatialHashGrid(cell_size=15.0, max_per_cell=None)
+    i, j, diff, dist = grid.query_pairs(points, 15.0)
+    assert set(zip(i.tolist(), j.tolist())) == _brute(points, points, 15.0, skip_self=True)
+    assert len(i) == len(set(zip(i.tolist(), j.tolist())))
+    np.testing.assert_allclose(diff, points[i] - points[j])
+    np.testing.assert_allclose(dist, np.linalg.norm(diff, axis=1))
+
+def test_half_pairs_cover_each_pair_once():
+    points = _cloud(600, 2)
+    grid = SpatialHashGrid(cell_size=15.0, max_per_cell=None)
+    i, j, _, _ = grid.query_pairs(points, 15.0, both=False)
+    unordered = [tuple(sorted(p)) for p in zip(i.tolist(), j.tolist())]
+    assert len(unordered) == len(set(unordered))
+    assert set(unordered) == {p for p in _brute(points, points, 15.0, skip_self=True) if p[0] < p[1]}
+
+def test_cross_pairs_match_brute_force():
+    sources, targets = _cloud(300, 3), _cloud(400, 4)
+    grid = SpatialHashGrid(cell_size=20.0, max_per_cell=None)
+    grid.dense_cells_per_point = 0  # Sorted-key lookup path
+    i, j, _, _ = grid.query_cross(sources, targets, 20.0)
+    assert set(zip(i.tolist(), j.tolist())) == _brute(sources, targets, 20.0, skip_self=False)
+
+def test_default_fleet_spawns_under_the_cap():
+    swarm = SwarmFormationController()
+    swarm.update_positions()
+    assert swarm.spatial_index.truncated == 0
+    spacing = np.linalg.norm(swarm.positions[:, None] - swarm.positions[None], axis=2)
+    assert spacing[~np.eye(swarm.fleet_size, dtype=bool)].min() > 0
+
+def test_repulsion_is_equal_and_opposite():
+    swarm = SwarmFormationController(2)
+    swarm.positions[:] = [[0.0, 0.0, 50.0], [4.0, 0.0, 50.0]]
+    swarm.targets[:] = swarm.positions
+    swarm.update_positions()
+    np.testing.assert_allclose(swarm.velocities[0], -swarm.velocities[1])
+    assert swarm.velocities[0, 0] < 0 < swarm.velocities[1, 0]
@@ -0,0 +1,98 @@
+"""
+Tag ledger — persistence across reopen, per-generation tomb bitmaps, crash-safe compaction, UTF-8 ids
+
+Run from the repo root: python -m pytest -q tests
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from core.pyrolysis_recycle import PyrolysisRecycle
+from core.tag_ledger import FRAGMENT_BYTES, TagLedger, TagLedgerError, fragment_key
+
+def _fill(ledger: TagLedger, n: int, first: int = 1) -> np.ndarray:
+    tags = np.arange(first, first + n, dtype=np.uint64)
+    ledger.add_many(tags, [f"frag_{t}" for t in tags.tolist()], np.full(n, 99.9))
+    return tags
+
+def test_reopen_keeps_records_and_counters(tmp_path):
+    path = str(tmp_path / "tags.ledger")
+    ledger = TagLedger(path, capacity=8, seed=1)
+    _fill(ledger, 20)           # Grows past the initial capacity
+    ledger.remove(5)
+    ledger.collected = 20
+    ledger.close()
+    reopened = TagLedger(path, seed=1)
+    assert len(reopened) == 19 and reopened.appended == 20 and reopened.tombstoned == 1
+    assert reopened.collected == 20
+    assert 5 not in reopened and reopened.fragment_of(6) == "frag_6"
+    assert reopened.purity_of(6) == pytest.approx(99.9, abs=1e-4)
+    reopened.close()
+
+def test_not_a_ledger(tmp_path):
+    path = tmp_path / "junk.ledger"
+    path.write_bytes(b"\0" * 256)
+    with pytest.raises(TagLedgerError):
+        TagLedger(str(path))
+
+def test_tomb_bitmap_per_generation(tmp_path):
+    path = str(tmp_path / "tags.ledger")
+    ledger = TagLedger(path, capacity=64, seed=1)
+    tags = _fill(ledger, 40)
+    ledger.pop_random(30)
+    assert os.path.exists(path + ".tomb.0")
+    reclaimed = ledger.compact()
+    assert reclaimed == 30 and len(ledger) == 10 and ledger.appended == 10 and ledger.tombstoned == 0
+    assert not os.path.exists(path + ".tomb.0") and os.path.exists(path + ".tomb.1")
+    survivors = [t for t in tags.tolist() if t in ledger]
+    ledger.remove(survivors[0])  # Lands in generation 1's bitmap
+    ledger.close()
+    reopened = TagLedger(path)
+    assert reopened.tomb_path == path + ".tomb.1"
+    assert sorted(t for t in tags.tolist() if t in reopened) == sorted(survivors[1:])
+    reopened.close()
+
+def test_failed_replace_leaves_old_generation(tmp_path, monkeypatch):
+    path = str(tmp_path / "tags.ledger")
+    ledger = TagLedger(path, capacity=64, seed=1)
+    tags = _fill(ledger, 40)
+    ledger.pop_random(30)
+    live = sorted(t for t in tags.tolist() if t in ledger)
+    ledger.flush()
+
+    def crash(src, dst):
+        raise OSError("power cut")
+
+    monkeypatch.setattr(os, "replace", crash)
+    with pytest.raises(OSError):
+        ledger.compact()
+    monkeypatch.undo()
+    assert len(ledger) == 10 and ledger.tombstoned == 30  # Still serving the old generation
+    assert sorted(t for t in tags.tolist() if t in ledger) == live
+    ledger.close()
+    reopened = TagLedger(path)  # What a restart after the crash sees
+    assert reopened.tomb_path == path + ".tomb.0" and len(reopened) == 10
+    assert sorted(t for t in tags.tolist() if t in reopened) == live
+    assert reopened.compact() == 30 and sorted(t for t in tags.tolist() if t in reopened) == live
+    reopened.close()
+
+def test_multibyte_ids_near_the_limit(tmp_path):
+    fits = "é" * (FRAGMENT_BYTES // 2)                  # Exactly 52 bytes of UTF-8
+    over = fits + "x"                                   # 53 bytes
+    straddle = "a" + "€" * (FRAGMENT_BYTES // 3)        # 3-byte chars crossing the limit
+    ledger = TagLedger(str(tmp_path / "tags.ledger"), capacity=8)
+    ledger.add_many(np.array([1, 2, 3, 4], dtype=np.uint64), [fits, over, straddle, over + "y"], np.full(4, 99.9))
+    assert ledger.fragment_of(1) == fits
+    stored = [ledger.fragment_of(t) for t in (2, 3, 4)]
+    assert len(set(stored)) == 3                        # Hashed, never collapsed by truncation
+    assert stored[0] == fragment_key(over).decode() and stored[0].startswith("é")
+    assert all(len(s.encode()) <= FRAGMENT_BYTES for s in stored)
+    ledger.close()
+
+def test_long_ids_do_not_abort_a_collection(tmp_path):
+    recycle = PyrolysisRecycle(ledger_path=str(tmp_path / "tags.ledger"))
+    recycle.collect_fragments([f"gel_{'player' * 20}_{i}" for i in range(5)])
+    assert len(recycle.tag_store) == 5 and recycle.collected_fragments == 5
+    recycle.ledger.close()